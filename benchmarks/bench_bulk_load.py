@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Bulk-load benchmark: per-row inserts vs. batched BulkWriter.
+
+Extracts database rows from Scopus CSV records once, then loads them into
+two fresh databases:
+
+- before: one cursor.execute per row, one commit per table (the previous
+  phase-by-phase behaviour of the creator)
+- after:  BulkWriter with executemany batches and grouped transactions
+
+Prints rows/sec per table for both runs.
+
+Usage:
+    python -m benchmarks.bench_bulk_load [CSV_FILE_OR_DIR] [--batch-size N] [--records N]
+"""
+
+import argparse
+import csv
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.database.bulk_writer import BulkWriter
+from scopus_db.database.creator import OptimalScopusDatabase
+from scopus_db.database.row_processor import INSERT_STATEMENTS, TABLE_ORDER, ScopusRecordProcessor
+
+
+class _RowCollector:
+    """Collects emitted rows per table, preserving emission order."""
+
+    def __init__(self):
+        self.rows = {table: [] for table in TABLE_ORDER}
+
+    def add(self, table, values):
+        self.rows[table].append(values)
+
+
+def load_records(path: Path):
+    """Read records from a CSV file or every CSV file in a directory."""
+    files = sorted(path.glob("*.csv")) if path.is_dir() else [path]
+    records = []
+    for csv_file in files:
+        with open(csv_file, 'r', encoding='utf-8-sig') as f:
+            records.extend(csv.DictReader(f))
+    return records
+
+
+def synthetic_records(count: int, seed: int = 42):
+    """Generate simple Scopus-like records when no CSV input is given."""
+    rng = random.Random(seed)
+    words = ["additive", "laser", "powder", "titanium", "fatigue", "porosity",
+             "lattice", "polymer", "sintering", "microstructure", "bioprinting"]
+    records = []
+    for i in range(count):
+        author_ids = [str(a) for a in rng.sample(range(1, count * 2), rng.randint(1, 6))]
+        records.append({
+            'Authors': '; '.join(f"Author{a} X." for a in author_ids),
+            'Author(s) ID': '; '.join(author_ids),
+            'Title': ' '.join(rng.sample(words, 5)),
+            'Year': str(rng.randint(2000, 2024)),
+            'DOI': f"10.1000/bench.{i}",
+            'Affiliations': '; '.join(f"Institute {rng.randint(1, count // 5 + 1)}, City, Country"
+                                      for _ in author_ids),
+            'Author Keywords': '; '.join(rng.sample(words, 4)),
+            'Index Keywords': '; '.join(rng.sample(words, 4)),
+            'References': '; '.join(
+                f"Author{rng.randint(1, 999)} A., {' '.join(rng.sample(words, 4))}, J Mater Sci, "
+                f"{rng.randint(1, 80)}, {rng.randint(1, 12)}, pp. 1-10, ({rng.randint(1990, 2024)})"
+                for _ in range(rng.randint(5, 40))),
+            'Funding Details': f"National Science Foundation, NSF {rng.randint(10000, 99999)}",
+            'Publisher': 'Elsevier',
+        })
+    return records
+
+
+def extract_rows(records):
+    """Run the record processor once and return rows per table."""
+    processor = ScopusRecordProcessor()
+    collector = _RowCollector()
+    for paper_id, row in enumerate(records, 1):
+        processor.process_record(paper_id, row, collector)
+    return collector.rows
+
+
+def create_database(directory: Path, name: str) -> sqlite3.Connection:
+    """Create an empty database with the production schema."""
+    creator = OptimalScopusDatabase(str(directory / "bench.csv"), enable_data_filtering=False)
+    creator.db_path = directory / name
+    creator.create_optimal_schema()
+    return creator.conn
+
+
+def load_per_row(conn, rows):
+    """Previous behaviour: execute per row, commit after each table."""
+    cursor = conn.cursor()
+    timings = {}
+    for table in TABLE_ORDER:
+        start = time.perf_counter()
+        for values in rows[table]:
+            cursor.execute(INSERT_STATEMENTS[table], values)
+        conn.commit()
+        timings[table] = time.perf_counter() - start
+    return timings
+
+
+def load_bulk(conn, rows, batch_size):
+    """New behaviour: BulkWriter batches, rows replayed in record order."""
+    writer = BulkWriter(conn, batch_size=batch_size)
+
+    # Interleave tables per paper as the creator does during ingestion
+    paper_ids = [values[0] for values in rows["papers"]]
+    by_paper = {table: {} for table in TABLE_ORDER}
+    for table in TABLE_ORDER:
+        for values in rows[table]:
+            key = values[0] if table not in ("authors_master", "institutions_master", "keywords_master") else None
+            by_paper[table].setdefault(key, []).append(values)
+
+    # Master rows carry no paper id; emit them up front to keep foreign keys valid
+    for table in ("authors_master", "institutions_master", "keywords_master"):
+        for values in by_paper[table].get(None, []):
+            writer.add(table, values)
+    for paper_id in paper_ids:
+        for table in TABLE_ORDER:
+            for values in by_paper[table].get(paper_id, ()):
+                writer.add(table, values)
+    writer.close()
+
+    return {table: stats["seconds"] for table, stats in writer.table_stats.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-row vs. bulk database loading")
+    parser.add_argument("input", nargs="?", help="Scopus CSV file or directory (synthetic data if omitted)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="BulkWriter batch size")
+    parser.add_argument("--records", type=int, default=5000, help="Synthetic record count")
+    args = parser.parse_args()
+
+    if args.input:
+        records = load_records(Path(args.input))
+        source = args.input
+    else:
+        records = synthetic_records(args.records)
+        source = f"{args.records:,} synthetic records"
+
+    print(f"⚡ BULK LOAD BENCHMARK ({source})")
+    rows = extract_rows(records)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        conn = create_database(tmp, "before.db")
+        start = time.perf_counter()
+        before = load_per_row(conn, rows)
+        before_total = time.perf_counter() - start
+        conn.close()
+
+        conn = create_database(tmp, "after.db")
+        start = time.perf_counter()
+        after = load_bulk(conn, rows, args.batch_size)
+        after_total = time.perf_counter() - start
+        conn.close()
+
+    print(f"\n   {'Table':<22} {'Rows':>9} {'Before rows/s':>14} {'After rows/s':>14} {'Speedup':>8}")
+    print("   " + "-" * 71)
+    total_rows = 0
+    for table in TABLE_ORDER:
+        count = len(rows[table])
+        if not count:
+            continue
+        total_rows += count
+        before_rate = count / before[table] if before[table] else 0
+        after_rate = count / after[table] if after[table] else 0
+        speedup = after_rate / before_rate if before_rate else 0
+        print(f"   {table:<22} {count:>9,} {before_rate:>14,.0f} {after_rate:>14,.0f} {speedup:>7.1f}x")
+
+    # Totals are wall-clock, including Python-side buffering overhead
+    print("   " + "-" * 71)
+    print(f"   {'TOTAL':<22} {total_rows:>9,} {total_rows / before_total:>14,.0f} "
+          f"{total_rows / after_total:>14,.0f} {before_total / after_total:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
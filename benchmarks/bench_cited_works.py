@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Citation storage benchmark: inline paper_citations vs. cited_works.
+
+Builds a database twice from the same synthetic export (or Scopus CSV
+directory), once with the reference data stored on every paper_citations row
+and once with database.cited_works enabled, then reports database size, the
+space used by the citation tables and their indexes (where SQLite has the
+dbstat table) and the time of a "most cited references" query.
+
+Usage:
+    python -m benchmarks.bench_cited_works [CSV_DIR] [--records N] [--files N]
+"""
+
+import argparse
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import SyntheticScopusExport
+
+MOST_CITED = {
+    False: """SELECT reference_text, COUNT(*) AS citations FROM paper_citations
+              GROUP BY reference_text ORDER BY citations DESC LIMIT 20""",
+    True: """SELECT reference_text, citation_count FROM cited_works
+             ORDER BY citation_count DESC LIMIT 20""",
+}
+
+
+def build(data_dir: Path, cited_works: bool) -> Path:
+    """Build a database from every CSV in data_dir and return its path."""
+    from scopus_db.config_loader import get_config
+    from scopus_db.database.creator import OptimalScopusDatabase
+
+    get_config().get_database_config()['cited_works'] = cited_works
+    creator = OptimalScopusDatabase(str(data_dir), enable_data_filtering=False,
+                                    csv_files=sorted(data_dir.glob("*.csv")))
+    creator.create_optimal_schema()
+    creator.process_csv_to_optimal_db()
+    creator.conn.close()
+    return creator.db_path
+
+
+def citation_storage_mb(conn: sqlite3.Connection) -> float:
+    """Bytes held by citation tables and their indexes, in MB (None without dbstat)."""
+    try:
+        rows = conn.execute("""
+            SELECT SUM(pgsize) FROM dbstat
+            WHERE name IN (SELECT name FROM sqlite_master
+                           WHERE tbl_name IN ('paper_citations', 'cited_works'))
+        """).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return (rows[0] or 0) / (1024 * 1024)
+
+
+def query_ms(conn: sqlite3.Connection, sql: str, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        conn.execute(sql).fetchall()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def measure(data_dir: Path, cited_works: bool) -> dict:
+    start = time.perf_counter()
+    db_path = build(data_dir, cited_works)
+    seconds = time.perf_counter() - start
+
+    conn = sqlite3.connect(db_path)
+    result = {
+        "build_seconds": seconds,
+        "db_mb": db_path.stat().st_size / (1024 * 1024),
+        "citation_mb": citation_storage_mb(conn),
+        "query_ms": query_ms(conn, MOST_CITED[cited_works]),
+        "citations": conn.execute("SELECT COUNT(*) FROM paper_citations").fetchone()[0],
+    }
+    conn.close()
+    shutil.rmtree(db_path.parent.parent, ignore_errors=True)
+    shutil.rmtree(data_dir / "output", ignore_errors=True)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inline vs. cited_works citation storage")
+    parser.add_argument("input", nargs="?", help="Directory of Scopus CSV files (synthetic export if omitted)")
+    parser.add_argument("--records", type=int, default=5000, help="Synthetic records to generate")
+    parser.add_argument("--files", type=int, default=2, help="Synthetic CSV files")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.input:
+            data_dir = Path(tmp) / "raw_scopus"
+            shutil.copytree(args.input, data_dir)
+            source = args.input
+        else:
+            data_dir = Path(tmp) / "raw_scopus"
+            SyntheticScopusExport(args.records).write(data_dir, files=args.files)
+            source = f"{args.records:,} synthetic records"
+
+        results = {layout: measure(data_dir, layout) for layout in (False, True)}
+
+    print(f"\n⚡ CITATION STORAGE BENCHMARK ({source}, {results[False]['citations']:,} citations)")
+    print(f"\n   {'Layout':<14} {'Build s':>8} {'DB MB':>8} {'Citation MB':>12} {'Top-20 query ms':>16}")
+    print("   " + "-" * 62)
+    for layout, name in ((False, "inline"), (True, "cited_works")):
+        r = results[layout]
+        citation_mb = f"{r['citation_mb']:.1f}" if r['citation_mb'] is not None else "n/a"
+        print(f"   {name:<14} {r['build_seconds']:>8.2f} {r['db_mb']:>8.1f} {citation_mb:>12} {r['query_ms']:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
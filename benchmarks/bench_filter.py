@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Quality-filter micro-benchmark: row-wise should_exclude_record vs. filter_batch.
+
+Generates Scopus-like rows with randomly blank (empty or whitespace-only)
+fields, evaluates them once per row through should_exclude_record and once
+per column-oriented chunk through filter_batch, checks both give the same
+decision and reason for every row and prints the per-row cost, for dict rows
+and for ScopusRecords. Rows are generated and evaluated chunk by chunk, so
+1M rows fit in little memory.
+
+Usage:
+    python -m benchmarks.bench_filter [--records N] [--chunk N] [--blank-rate R]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.data_quality_filter import BATCH_REASONS, EXCLUSION_CHECKS, ScopusDataQualityFilter
+from scopus_db.parsers.records import RecordSchema, record_columns
+
+# Columns read by should_exclude_record besides the checked ones
+EXTRA_COLUMNS = ('Document Type', 'Language of Original Document', 'Source title', 'Cited by')
+
+
+def synthetic_rows(count: int, blank_rate: float, rng: random.Random):
+    """Rows whose checked fields are blank with probability ``blank_rate`` each."""
+    blanks = ('', ' ', '\t', None)
+    rows = []
+    for i in range(count):
+        row = {
+            'Authors': f"Author{i} A.; Coauthor{i % 97} B.",
+            'Author(s) ID': f"{i}; {i + 1}",
+            'Title': f"Laser powder bed fusion study {i}",
+            'Year': str(2000 + i % 25),
+            'DOI': f"10.1000/bench.{i}",
+            'Affiliations': f"Institute {i % 500}, City, Country",
+            'Abstract': "Additive manufacturing of metallic lattices with controlled porosity.",
+            'Document Type': 'Article',
+            'Language of Original Document': 'English',
+            'Source title': 'Additive Manufacturing',
+            'Cited by': str(i % 40),
+        }
+        for column, _ in EXCLUSION_CHECKS:
+            if rng.random() < blank_rate:
+                blank = rng.choice(blanks)
+                if blank is None:
+                    del row[column]
+                else:
+                    row[column] = blank
+        rows.append(row)
+    return rows
+
+
+def evaluate(data_filter, chunks):
+    """Time row-wise checks, column extraction and filter_batch over chunks; returns seconds."""
+    row_seconds = column_seconds = batch_seconds = 0.0
+    checked = [column for column, _ in EXCLUSION_CHECKS]
+    excluded = 0
+    start = 0
+    for rows in chunks:
+        began = time.perf_counter()
+        row_results = [data_filter.should_exclude_record(row, i) for i, row in enumerate(rows, start + 1)]
+        row_seconds += time.perf_counter() - began
+
+        began = time.perf_counter()
+        columns = record_columns(rows, checked)
+        column_seconds += time.perf_counter() - began
+
+        began = time.perf_counter()
+        codes = data_filter.filter_batch(columns)
+        batch_seconds += time.perf_counter() - began
+
+        assert [(code > 0, BATCH_REASONS[code]) for code in codes] == row_results, \
+            "filter_batch differs from should_exclude_record"
+        excluded += sum(1 for code in codes if code)
+        start += len(rows)
+    return row_seconds, column_seconds, batch_seconds, excluded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark row-wise vs. batch quality filtering")
+    parser.add_argument("--records", type=int, default=1_000_000, help="Synthetic row count")
+    parser.add_argument("--chunk", type=int, default=10_000, help="Rows per column-oriented chunk")
+    parser.add_argument("--blank-rate", type=float, default=0.05, help="Probability of a blank checked field")
+    args = parser.parse_args()
+
+    data_filter = ScopusDataQualityFilter(log_path=str(Path("/tmp") / "bench_filter_exclusions.json"))
+    fields = [column for column, _ in EXCLUSION_CHECKS] + list(EXTRA_COLUMNS)
+    schema = RecordSchema(fields)
+
+    def chunks(as_records: bool):
+        rng = random.Random(42)
+        for start in range(0, args.records, args.chunk):
+            rows = synthetic_rows(min(args.chunk, args.records - start), args.blank_rate, rng)
+            yield [schema.record([row.get(f) for f in fields]) for row in rows] if as_records else rows
+
+    print(f"⚡ QUALITY FILTER BENCHMARK ({args.records:,} rows, chunks of {args.chunk:,}, "
+          f"blank rate {args.blank_rate:.0%})")
+    per_row = lambda seconds: seconds / args.records * 1e6
+    for label, as_records in (("dict rows (csv.DictReader)", False), ("ScopusRecord rows (read_records)", True)):
+        row_seconds, column_seconds, batch_seconds, excluded = evaluate(data_filter, chunks(as_records))
+        print(f"\n   {label}, {excluded:,} excluded ({excluded / args.records:.1%}):")
+        print(f"   Row-wise:             {per_row(row_seconds):8.3f} µs/row ({row_seconds:.2f}s)")
+        print(f"   Batch (masks only):   {per_row(batch_seconds):8.3f} µs/row ({batch_seconds:.2f}s)")
+        print(f"   Batch (+ to columns): {per_row(batch_seconds + column_seconds):8.3f} µs/row "
+              f"({batch_seconds + column_seconds:.2f}s)")
+        print(f"   Speedup:              {row_seconds / batch_seconds:8.1f}x masks only, "
+              f"{row_seconds / (batch_seconds + column_seconds):.1f}x with column extraction (identical reasons)")
+
+
+if __name__ == "__main__":
+    main()
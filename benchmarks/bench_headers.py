@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Header-resolution micro-benchmark: per-row key scans vs. cached HeaderMap.
+
+Runs the column lookups the record processor and the quality filter perform
+for every record, once with the previous scan-based lookups and once through
+HeaderMap, checks both return the same values and prints the per-row cost.
+
+Usage:
+    python -m benchmarks.bench_headers [CSV_FILE_OR_DIR] [--records N] [--bom]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_bulk_load import load_records, synthetic_records
+from scopus_db.data_quality_filter_simple import FIELD_VARIATIONS
+from scopus_db.parsers.headers import header_map_for
+
+
+# (column, alternatives) looked up per record by ScopusRecordProcessor
+PROCESSOR_LOOKUPS = [
+    ('Authors', None), ('Author(s) ID', None), ('Author full names', None),
+    ('Author Keywords', None), ('Index Keywords', None),
+    ('Funding Details', None), ('Funding Texts', None), ('References', None),
+    ('Chemicals/CAS', ['Chemical']), ('Tradenames', ['Trade Names']),
+    ('Correspondence Address', ['Corresponding Author']),
+    ('Access Type', ['Open Access']), ('Publisher', None),
+]
+FILTER_FIELDS = list(FIELD_VARIATIONS)
+
+
+def legacy_column_value(row, column_name, alternatives=None):
+    """Previous ScopusRecordProcessor._get_column_value (scans keys on a miss)."""
+    if column_name in row:
+        return row.get(column_name, '')
+    for key in row.keys():
+        if column_name in key:
+            return row.get(key, '')
+    if alternatives:
+        for alt in alternatives:
+            if alt in row:
+                return row.get(alt, '')
+            for key in row.keys():
+                if alt in key:
+                    return row.get(key, '')
+    return ''
+
+
+def legacy_field_value(row, field_name):
+    """Previous ScopusDataQualityFilter._get_field_value (case-insensitive scans)."""
+    if field_name in row:
+        return row[field_name]
+    for key in row.keys():
+        if field_name.lower() in key.lower():
+            return row[key]
+    for variant in FIELD_VARIATIONS.get(field_name, ()):
+        if variant in row:
+            return row[variant]
+        for key in row.keys():
+            if variant.lower() == key.lower():
+                return row[key]
+    return ""
+
+
+def run_legacy(records):
+    values = []
+    for row in records:
+        values.append([legacy_column_value(row, c, a) for c, a in PROCESSOR_LOOKUPS] +
+                      [legacy_field_value(row, f) for f in FILTER_FIELDS])
+    return values
+
+
+def run_header_map(records):
+    values = []
+    for row in records:
+        header = header_map_for(row)
+        processor_values = []
+        for column, alternatives in PROCESSOR_LOOKUPS:
+            key = header.resolve(column, alternatives or ())
+            processor_values.append(row.get(key, '') if key is not None else '')
+        filter_values = []
+        for field in FILTER_FIELDS:
+            key = header.resolve_field(field, FIELD_VARIATIONS[field])
+            filter_values.append(row[key] if key is not None else "")
+        values.append(processor_values + filter_values)
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-row header resolution")
+    parser.add_argument("input", nargs="?", help="Scopus CSV file or directory (synthetic data if omitted)")
+    parser.add_argument("--records", type=int, default=20000, help="Synthetic record count")
+    parser.add_argument("--bom", action="store_true", help="Prefix the first header with a BOM, as in raw exports")
+    args = parser.parse_args()
+
+    if args.input:
+        records = load_records(Path(args.input))
+        source = args.input
+    else:
+        records = synthetic_records(args.records)
+        source = f"{args.records:,} synthetic records"
+    if args.bom:
+        records = [{('\ufeff' + k if i == 0 else k): v for i, (k, v) in enumerate(r.items())} for r in records]
+
+    print(f"⚡ HEADER RESOLUTION BENCHMARK ({source})")
+    lookups = len(PROCESSOR_LOOKUPS) + len(FILTER_FIELDS)
+
+    start = time.perf_counter()
+    before = run_legacy(records)
+    before_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    after = run_header_map(records)
+    after_seconds = time.perf_counter() - start
+
+    assert before == after, "HeaderMap lookups differ from the scan-based lookups"
+
+    per_row_before = before_seconds / len(records) * 1e6
+    per_row_after = after_seconds / len(records) * 1e6
+    print(f"   Lookups per row: {lookups}")
+    print(f"   Scan-based:  {per_row_before:8.2f} µs/row")
+    print(f"   HeaderMap:   {per_row_after:8.2f} µs/row")
+    print(f"   Speedup:     {per_row_before / per_row_after:8.1f}x (identical values)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Papers layout benchmark: inline long text vs. paper_text (plain and compressed).
+
+Builds a database three times from the same synthetic export (or Scopus CSV
+directory): with abstract and scopus_link inline in papers, with them moved
+to paper_text (database.paper_text), and with paper_text values compressed
+(database.compress_paper_text). Reports database size, the space used by
+papers and paper_text (where SQLite has the dbstat table) and the time of
+typical year, citation and document-type aggregates, each run on a fresh
+connection with SQLite's default page cache, plus abstract lookups through
+the paper_details view.
+
+Usage:
+    python -m benchmarks.bench_paper_text [CSV_DIR] [--records N] [--files N]
+"""
+
+import argparse
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import SyntheticScopusExport
+
+LAYOUTS = (
+    ("inline", False, False),
+    ("paper_text", True, False),
+    ("compressed", True, True),
+)
+
+AGGREGATES = {
+    "papers per year": "SELECT year, COUNT(*) FROM papers GROUP BY year",
+    "citations per year": "SELECT year, SUM(cited_by), AVG(cited_by) FROM papers GROUP BY year",
+    "document types": "SELECT document_type, COUNT(*) FROM papers GROUP BY document_type",
+    "top cited": "SELECT paper_id, title, cited_by FROM papers ORDER BY cited_by DESC LIMIT 20",
+    "top sources": """SELECT source_title, COUNT(*) AS papers, SUM(cited_by) FROM papers
+                      GROUP BY source_title ORDER BY papers DESC LIMIT 20""",
+}
+
+ABSTRACT_LOOKUPS = 200
+
+
+def build(data_dir: Path, paper_text: bool, compress: bool) -> Path:
+    """Build a database from every CSV in data_dir and return its path."""
+    from scopus_db.config_loader import get_config
+    from scopus_db.database.creator import OptimalScopusDatabase
+
+    database = get_config().get_database_config()
+    database.update(paper_text=paper_text, compress_paper_text=compress)
+    creator = OptimalScopusDatabase(str(data_dir), enable_data_filtering=False,
+                                    csv_files=sorted(data_dir.glob("*.csv")))
+    creator.create_optimal_schema()
+    creator.process_csv_to_optimal_db()
+    creator.conn.close()
+    return creator.db_path
+
+
+def table_mb(conn: sqlite3.Connection, table: str) -> float:
+    """Bytes held by a table and its indexes, in MB (None without dbstat)."""
+    try:
+        rows = conn.execute("""
+            SELECT SUM(pgsize) FROM dbstat
+            WHERE name IN (SELECT name FROM sqlite_master WHERE tbl_name = ?)
+        """, (table,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return (rows[0] or 0) / (1024 * 1024)
+
+
+def cold_query_ms(db_path: Path, sql: str, repeat: int = 5) -> float:
+    """Average time of a query on a fresh connection (empty SQLite page cache)."""
+    total = 0.0
+    for _ in range(repeat):
+        conn = sqlite3.connect(db_path)
+        start = time.perf_counter()
+        conn.execute(sql).fetchall()
+        total += time.perf_counter() - start
+        conn.close()
+    return total / repeat * 1000
+
+
+def abstract_lookup_ms(db_path: Path, paper_ids: list) -> float:
+    """Average time to fetch one abstract through the layout's read path."""
+    from scopus_db.database.paper_text import register_text_functions
+
+    conn = sqlite3.connect(db_path)
+    register_text_functions(conn)
+    table = "paper_details" if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'paper_details'").fetchone() else "papers"
+    start = time.perf_counter()
+    for paper_id in paper_ids:
+        conn.execute(f"SELECT abstract FROM {table} WHERE paper_id = ?", (paper_id,)).fetchone()
+    seconds = time.perf_counter() - start
+    conn.close()
+    return seconds / len(paper_ids) * 1000
+
+
+def measure(data_dir: Path, paper_text: bool, compress: bool) -> dict:
+    start = time.perf_counter()
+    db_path = build(data_dir, paper_text, compress)
+    seconds = time.perf_counter() - start
+
+    conn = sqlite3.connect(db_path)
+    papers = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+    result = {
+        "build_seconds": seconds,
+        "db_mb": db_path.stat().st_size / (1024 * 1024),
+        "papers_mb": table_mb(conn, "papers"),
+        "paper_text_mb": table_mb(conn, "paper_text") if paper_text else 0.0,
+        "papers": papers,
+    }
+    conn.close()
+
+    result["queries_ms"] = {name: cold_query_ms(db_path, sql) for name, sql in AGGREGATES.items()}
+    paper_ids = random.Random(42).sample(range(1, papers + 1), min(ABSTRACT_LOOKUPS, papers))
+    result["abstract_ms"] = abstract_lookup_ms(db_path, paper_ids)
+
+    shutil.rmtree(db_path.parent.parent, ignore_errors=True)
+    shutil.rmtree(data_dir / "output", ignore_errors=True)
+    return result
+
+
+def format_mb(value: float) -> str:
+    return f"{value:.1f}" if value is not None else "n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inline vs. paper_text papers layouts")
+    parser.add_argument("input", nargs="?", help="Directory of Scopus CSV files (synthetic export if omitted)")
+    parser.add_argument("--records", type=int, default=5000, help="Synthetic records to generate")
+    parser.add_argument("--files", type=int, default=2, help="Synthetic CSV files")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "raw_scopus"
+        if args.input:
+            shutil.copytree(args.input, data_dir)
+            source = args.input
+        else:
+            SyntheticScopusExport(args.records).write(data_dir, files=args.files)
+            source = f"{args.records:,} synthetic records"
+
+        results = {name: measure(data_dir, paper_text, compress) for name, paper_text, compress in LAYOUTS}
+
+    names = [name for name, _, _ in LAYOUTS]
+    print(f"\n⚡ PAPERS LAYOUT BENCHMARK ({source}, {results['inline']['papers']:,} papers)")
+    print(f"\n   {'':<22}" + "".join(f"{name:>12}" for name in names))
+    print("   " + "-" * (22 + 12 * len(names)))
+    rows = [
+        ("Build s", lambda r: f"{r['build_seconds']:.2f}"),
+        ("DB MB", lambda r: f"{r['db_mb']:.1f}"),
+        ("papers MB", lambda r: format_mb(r['papers_mb'])),
+        ("paper_text MB", lambda r: format_mb(r['paper_text_mb'])),
+    ]
+    rows += [(f"{name} ms", lambda r, name=name: f"{r['queries_ms'][name]:.2f}") for name in AGGREGATES]
+    rows.append(("abstract lookup ms", lambda r: f"{r['abstract_ms']:.3f}"))
+    for label, value in rows:
+        print(f"   {label:<22}" + "".join(f"{value(results[name]):>12}" for name in names))
+
+
+if __name__ == "__main__":
+    main()
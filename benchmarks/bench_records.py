@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Record memory benchmark: csv.DictReader dicts vs. compact ScopusRecords.
+
+Serializes the input records to an in-memory CSV (repeating them up to the
+requested count), parses it once with csv.DictReader and once with
+read_records, and reports the memory held by the parsed records per 100k
+records, measured with tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_records [CSV_FILE_OR_DIR] [--records N]
+"""
+
+import argparse
+import csv
+import gc
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_bulk_load import load_records, synthetic_records
+from scopus_db.parsers.records import read_records
+
+
+def to_csv_text(records, count):
+    """Write ``count`` records (cycling through the input) as CSV text."""
+    fieldnames = list(dict.fromkeys(key for record in records for key in record))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    for i in range(count):
+        writer.writerow(records[i % len(records)])
+    return buffer.getvalue()
+
+
+def measure(parse, text):
+    """Parse text and return (parsed records, bytes held, seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    parsed = list(parse(io.StringIO(text)))
+    seconds = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return parsed, current, seconds
+
+
+def value_bytes(parsed):
+    """Bytes held by distinct value strings (interned values counted once)."""
+    seen = {}
+    for record in parsed:
+        for value in record.values():
+            if value is not None:
+                seen[id(value)] = sys.getsizeof(value)
+    return sum(seen.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memory held by parsed records")
+    parser.add_argument("input", nargs="?", help="Scopus CSV file or directory (synthetic data if omitted)")
+    parser.add_argument("--records", type=int, default=100000, help="Records to parse")
+    args = parser.parse_args()
+
+    if args.input:
+        records = load_records(Path(args.input))
+        source = args.input
+    else:
+        records = synthetic_records(min(args.records, 5000))
+        source = "synthetic records"
+
+    text = to_csv_text(records, args.records)
+    print(f"⚡ RECORD MEMORY BENCHMARK ({args.records:,} records from {source}, "
+          f"{len(text) / (1024 * 1024):.1f} MB of CSV)")
+
+    dicts, dict_bytes, dict_seconds = measure(csv.DictReader, text)
+    compact, compact_bytes, compact_seconds = measure(read_records, text)
+    assert dicts == compact, "ScopusRecords differ from csv.DictReader rows"
+    dict_overhead = dict_bytes - value_bytes(dicts)
+    compact_overhead = compact_bytes - value_bytes(compact)
+    del dicts, compact
+
+    # Container overhead = total minus the value strings themselves
+    scale = 100000 / args.records / (1024 * 1024)
+    print(f"\n   {'Representation':<16} {'MB per 100k':>12} {'Overhead MB':>12} {'Parse time':>11}")
+    print("   " + "-" * 54)
+    print(f"   {'DictReader dict':<16} {dict_bytes * scale:>12.1f} {dict_overhead * scale:>12.1f} {dict_seconds:>10.2f}s")
+    print(f"   {'ScopusRecord':<16} {compact_bytes * scale:>12.1f} {compact_overhead * scale:>12.1f} {compact_seconds:>10.2f}s")
+    print(f"\n   Memory saved: {(1 - compact_bytes / dict_bytes) * 100:.1f}% total, "
+          f"{(1 - compact_overhead / dict_overhead) * 100:.1f}% container overhead (identical contents)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Reference parsing benchmark.
+
+Collects the semicolon-separated entries of the References column (from the
+synthetic corpus by default, or from Scopus CSV exports), then parses them
+with ReferenceParser without a cache and with its LRU memo, and prints
+refs/sec for each. Both runs must produce identical results.
+
+Usage:
+    python -m benchmarks.bench_references [CSV_FILE_OR_DIR] [--records N] [--cache-size N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_bulk_load import load_records
+from benchmarks.synthetic import SyntheticScopusExport
+from scopus_db.database.row_processor import split_field
+from scopus_db.parsers.references import DEFAULT_CACHE_SIZE, ReferenceParser
+
+
+def collect_references(records):
+    return [reference for record in records for reference in split_field(record.get('References') or '')]
+
+
+def measure(parser, references):
+    """Parse every reference once; return (results, refs/sec)."""
+    parse = parser.parse
+    start = time.perf_counter()
+    results = [parse(reference) for reference in references]
+    return results, len(references) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reference parsing throughput")
+    parser.add_argument("input", nargs="?", help="Scopus CSV file or directory (synthetic corpus if omitted)")
+    parser.add_argument("--records", type=int, default=2000, help="Synthetic records to generate")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="LRU memo size")
+    args = parser.parse_args()
+
+    if args.input:
+        records = load_records(Path(args.input))
+        source = args.input
+    else:
+        records = SyntheticScopusExport(args.records).iter_records()
+        source = f"{args.records:,} synthetic records"
+
+    references = collect_references(records)
+    unique = len(set(references))
+    print(f"⚡ REFERENCE PARSING BENCHMARK ({len(references):,} references from {source}, "
+          f"{unique:,} distinct)")
+
+    uncached, uncached_rate = measure(ReferenceParser(cache_size=0), references)
+    memo = ReferenceParser(cache_size=args.cache_size)
+    cached, cached_rate = measure(memo, references)
+    assert cached == uncached, "Memoized results differ from uncached parsing"
+    info = memo.cache_info()
+
+    print(f"\n   {'Parser':<20} {'refs/sec':>12}")
+    print("   " + "-" * 33)
+    print(f"   {'uncached':<20} {uncached_rate:>12,.0f}")
+    print(f"   {'LRU memo':<20} {cached_rate:>12,.0f}")
+    print(f"\n   Cache hit rate: {info.hits / max(info.hits + info.misses, 1) * 100:.1f}% "
+          f"({info.currsize:,}/{info.maxsize:,} entries)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+End-to-end build benchmark runner.
+
+For each dataset size, generates (or reuses) a deterministic synthetic
+Scopus export and builds a database from it in a fresh subprocess, so peak
+RSS is measured per build. Records wall time, per-phase timings from
+``OptimalScopusDatabase.phase_timings``, peak RSS and database size, appends
+them to a JSON history file and compares against the previous run of the
+same size.
+
+Usage:
+    python -m benchmarks.run [--sizes 10000,100000,1000000] [--files 4]
+                             [--workdir DIR] [--history FILE] [--label TEXT]
+                             [--parallel] [--verbose]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticScopusExport
+
+DEFAULT_SIZES = "10000,100000,1000000"
+DEFAULT_HISTORY = Path(__file__).parent / "history.json"
+DEFAULT_WORKDIR = Path(__file__).parent / ".data"
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_build(data_dir: Path, result_path: Path, parallel: bool):
+    """Child-process entry point: build a database and write the measurements."""
+    from scopus_db.config_loader import get_config
+    from scopus_db.database.creator import OptimalScopusDatabase
+
+    if parallel:
+        get_config().get_performance_config()['parallel_processing'] = True
+
+    csv_files = sorted(data_dir.glob("*.csv"))
+    start = time.perf_counter()
+    creator = OptimalScopusDatabase(str(data_dir), csv_files=csv_files)
+    schema_start = time.perf_counter()
+    creator.create_optimal_schema()
+    schema_seconds = time.perf_counter() - schema_start
+    creator.process_csv_to_optimal_db()
+    creator.conn.close()
+    wall_seconds = time.perf_counter() - start
+
+    phases = {"schema": schema_seconds}
+    phases.update(creator.phase_timings)
+    phases["csv_decode"] = sum(f["seconds"] for f in creator.csv_load_stats)
+
+    result = {
+        "wall_seconds": wall_seconds,
+        "phases": phases,
+        "peak_rss_mb": peak_rss_mb(),
+        "db_size_mb": creator.db_path.stat().st_size / (1024 * 1024),
+        "papers": creator.stats["papers_processed"],
+        "db_path": str(creator.db_path),
+    }
+    result_path.write_text(json.dumps(result))
+
+
+def prepare_dataset(workdir: Path, size: int, files: int, seed: int) -> Path:
+    """Generate the synthetic export for a size, reusing a previous identical one."""
+    data_dir = workdir / f"synthetic_{size}_{files}f_seed{seed}" / "raw_scopus"
+    marker = data_dir / ".complete"
+    if not marker.exists():
+        if data_dir.exists():
+            shutil.rmtree(data_dir)
+        print(f"   🧪 Generating {size:,} synthetic records ({files} file(s))...")
+        start = time.perf_counter()
+        SyntheticScopusExport(size, seed=seed).write(data_dir, files=files)
+        marker.write_text("ok")
+        print(f"      done in {time.perf_counter() - start:.1f}s")
+    return data_dir
+
+
+def measure(data_dir: Path, parallel: bool, verbose: bool) -> dict:
+    """Build once in a subprocess and return its measurements."""
+    result_path = data_dir.parent / "result.json"
+    command = [sys.executable, "-m", "benchmarks.run", "--child", str(data_dir), str(result_path)]
+    if parallel:
+        command.append("--parallel")
+    output = None if verbose else subprocess.DEVNULL
+    subprocess.run(command, cwd=PROJECT_ROOT, stdout=output, check=True)
+
+    result = json.loads(result_path.read_text())
+    result_path.unlink()
+    # Build outputs (run folder, validation report) are not kept; the synthetic input is
+    shutil.rmtree(Path(result.pop("db_path")).parent.parent, ignore_errors=True)
+    shutil.rmtree(data_dir / "output", ignore_errors=True)
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path: Path) -> list:
+    if path.exists():
+        return json.loads(path.read_text())
+    return []
+
+
+def previous_result(history: list, size: int, parallel: bool) -> dict:
+    """Most recent recorded result for the same size and mode."""
+    for run in reversed(history):
+        if run.get("parallel", False) != parallel:
+            continue
+        for result in run["results"]:
+            if result["size"] == size:
+                return result
+    return None
+
+
+def format_change(current: float, previous: float) -> str:
+    if current is None or not previous:
+        return ""
+    return f"({(current - previous) / previous * 100:+.1f}%)"
+
+
+def print_result(result: dict, previous: dict):
+    size = result["size"]
+    print(f"\n   📊 {size:,} records ({result['papers']:,} papers loaded)")
+    prev = previous or {}
+    print(f"      Wall time:  {result['wall_seconds']:9.2f}s "
+          f"{format_change(result['wall_seconds'], prev.get('wall_seconds'))}")
+    print(f"      Throughput: {size / result['wall_seconds']:9,.0f} records/s")
+    if result["peak_rss_mb"] is not None:
+        print(f"      Peak RSS:   {result['peak_rss_mb']:9.1f} MB "
+              f"{format_change(result['peak_rss_mb'], prev.get('peak_rss_mb'))}")
+    print(f"      DB size:    {result['db_size_mb']:9.1f} MB "
+          f"{format_change(result['db_size_mb'], prev.get('db_size_mb'))}")
+    prev_phases = prev.get("phases", {})
+    for phase, seconds in result["phases"].items():
+        print(f"         {phase:<12} {seconds:9.2f}s {format_change(seconds, prev_phases.get(phase))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end database build benchmark")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated record counts")
+    parser.add_argument("--files", type=int, default=4, help="CSV files per synthetic export")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed")
+    parser.add_argument("--workdir", type=Path, default=DEFAULT_WORKDIR, help="Directory for synthetic exports")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--label", default="", help="Free-text label stored with this run")
+    parser.add_argument("--parallel", action="store_true", help="Enable performance.parallel_processing")
+    parser.add_argument("--verbose", action="store_true", help="Show build output")
+    parser.add_argument("--child", nargs=2, metavar=("DATA_DIR", "RESULT_JSON"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_build(Path(args.child[0]), Path(args.child[1]), args.parallel)
+        return
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    history = load_history(args.history)
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "label": args.label,
+        "parallel": args.parallel,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "cpu_count": os.cpu_count(),
+        "results": [],
+    }
+
+    print(f"⚡ BUILD BENCHMARK (sizes: {', '.join(f'{s:,}' for s in sizes)}; commit {run['git_commit']})")
+    for size in sizes:
+        data_dir = prepare_dataset(args.workdir, size, args.files, args.seed)
+        result = {"size": size, "files": args.files, "seed": args.seed}
+        result.update(measure(data_dir, args.parallel, args.verbose))
+        print_result(result, previous_result(history, size, args.parallel))
+        run["results"].append(result)
+
+        # Saved after every size so long runs keep partial results
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        args.history.write_text(json.dumps(history + [run], indent=2))
+
+    print(f"\n   📝 History updated: {args.history}")
+
+
+if __name__ == "__main__":
+    main()
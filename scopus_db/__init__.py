@@ -9,6 +9,8 @@ Features:
 - CLI: `scopus-db check <db_file> --csv-file <csv_file>` - Validate database integrity  
 - API: ScopusDB.create_database() - Programmatic database creation
 - API: ScopusDB.validate_database() - Programmatic validation
+- API: ScopusDB.get_citation_graph() - In-corpus citation graph
+- API: ScopusDB.search() - Ranked full-text search over papers
 """
 
 __version__ = "0.2.0"
@@ -158,4 +158,82 @@ class ScopusDB:
         info['file_size_mb'] = round(os.path.getsize(db_path) / (1024 * 1024), 2)
         
         conn.close()
-        return info
\ No newline at end of file
+        return info
+    
+    @staticmethod
+    def get_citation_graph(db_path: str) -> dict:
+        """
+        Get the in-corpus citation graph of a Scopus database.
+        
+        Edges come from references resolved to papers of the same database
+        during the build (database.resolve_citations).
+        
+        Args:
+            db_path (str): Path to the SQLite database file
+            
+        Returns:
+            dict: Mapping citing paper_id -> list of cited paper_ids, in
+                  reference list order
+            
+        Raises:
+            FileNotFoundError: If database file doesn't exist
+            
+        Example:
+            >>> from scopus_db import ScopusDB
+            >>> graph = ScopusDB.get_citation_graph("scopus.db")
+            >>> print(f"Papers citing the corpus: {len(graph)}")
+        """
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"Database file not found: {db_path}")
+        
+        import sqlite3
+        
+        conn = sqlite3.connect(db_path)
+        graph = {}
+        for citing_paper_id, cited_paper_id in conn.execute("""
+            SELECT citing_paper_id, cited_paper_id FROM citation_graph
+            ORDER BY citing_paper_id, position
+        """):
+            graph.setdefault(citing_paper_id, []).append(cited_paper_id)
+        
+        conn.close()
+        return graph
+    
+    @staticmethod
+    def search(db_path: str, query: str, limit: int = 20, offset: int = 0) -> list:
+        """
+        Full-text search over paper titles, abstracts and keywords.
+        
+        Needs a database built with database.full_text_search enabled.
+        
+        Args:
+            db_path (str): Path to the SQLite database file
+            query (str): FTS5 query, e.g. '"laser welding"', 'title:lattice',
+                         'powder NOT metal' or 'addit*'
+            limit (int): Maximum number of results
+            offset (int): Number of results to skip (paging)
+            
+        Returns:
+            list: Dicts with 'paper_id' and 'bm25', best match first (lower
+                  bm25 scores are better matches)
+            
+        Raises:
+            FileNotFoundError: If database file doesn't exist
+            ValueError: If the database has no full-text index or the query is malformed
+            
+        Example:
+            >>> from scopus_db import ScopusDB
+            >>> hits = ScopusDB.search("scopus.db", "lattice structures", limit=10)
+            >>> print([hit['paper_id'] for hit in hits])
+        """
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"Database file not found: {db_path}")
+        
+        import sqlite3
+        from .database.search import search_papers
+        
+        conn = sqlite3.connect(db_path)
+        try:
+            return search_papers(conn, query, limit=limit, offset=offset)
+        finally:
+            conn.close()
@@ -6,8 +6,11 @@ Command-line interface for Scopus Database creation and validation.
 import sys
 import os
 import argparse
+import shutil
+import sqlite3
 from pathlib import Path
 from .database import OptimalScopusDatabase
+from .database.link_tables import compact_link_tables, is_compact, link_table_report
 from .validator import DatabaseValidator
 
 
@@ -83,6 +86,61 @@ def check_database(args):
         sys.exit(1)
 
 
+def compact_database(args):
+    """Handle 'compact' subcommand."""
+    db_path = args.db_file
+    
+    if not os.path.exists(db_path):
+        print(f"❌ Error: Database file not found: {db_path}")
+        sys.exit(1)
+    
+    try:
+        if args.output:
+            print(f"📋 Copying {db_path} -> {args.output}")
+            shutil.copyfile(db_path, args.output)
+            db_path = args.output
+        
+        conn = sqlite3.connect(db_path)
+        if is_compact(conn):
+            print(f"✅ {db_path} already uses compact link tables")
+            conn.close()
+            return
+        
+        print(f"🗜️ Compacting link tables of {db_path}")
+        before = link_table_report(conn)
+        result = compact_link_tables(conn)
+        after = link_table_report(conn)
+        conn.close()
+        
+        print(f"   Converted {', '.join(f'{table} ({rows:,} rows)' for table, rows in result['rows'].items())} "
+              f"in {result['seconds']:.2f}s")
+        _print_compact_report(before, after)
+        
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def _print_compact_report(before: dict, after: dict):
+    """Print sizes and query times before and after compacting."""
+    def change(old, new):
+        return f"{(new - old) / old * 100:+.0f}%" if old else ""
+    
+    print(f"\n   {'':<28}{'Before':>10}{'After':>10}{'Change':>9}")
+    print("   " + "-" * 57)
+    print(f"   {'Database MB':<28}{before['db_mb']:>10.1f}{after['db_mb']:>10.1f}"
+          f"{change(before['db_mb'], after['db_mb']):>9}")
+    for table, old in before["table_mb"].items():
+        new = after["table_mb"][table]
+        if old is not None and new is not None:
+            print(f"   {table + ' MB':<28}{old:>10.2f}{new:>10.2f}{change(old, new):>9}")
+    for query, old in before["query_ms"].items():
+        new = after["query_ms"][query]
+        print(f"   {query + ' ms':<28}{old:>10.2f}{new:>10.2f}{change(old, new):>9}")
+
+
 def main():
     """Main CLI entry point with subcommand support."""
     parser = argparse.ArgumentParser(
@@ -103,6 +161,12 @@ def main():
     check_parser.add_argument('--csv-file', required=True, help='Path to original CSV file')
     check_parser.set_defaults(func=check_database)
     
+    # Compact subcommand
+    compact_parser = subparsers.add_parser('compact', help='Convert link tables to the compact WITHOUT ROWID layout')
+    compact_parser.add_argument('db_file', help='Path to SQLite database file (e.g. master_*.db)')
+    compact_parser.add_argument('--output', help='Write the compacted copy here instead of converting in place')
+    compact_parser.set_defaults(func=compact_database)
+    
     # Parse arguments and run appropriate function
     args = parser.parse_args()
     args.func(args)
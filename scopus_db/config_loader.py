@@ -113,7 +113,11 @@ class ConfigLoader:
                     "require_year": True,
                     "require_doi": False,
                     "require_affiliations": True,
-                    "require_abstract": True
+                    "require_abstract": True,
+                    "min_title_length": 0,
+                    "min_abstract_words": 0,
+                    "year_range": None,
+                    "document_types": []
                 }
             },
             "database": {
@@ -122,7 +126,22 @@ class ConfigLoader:
                 "normalize_entities": True,
                 "compute_collaborations": True,
                 "compute_keyword_cooccurrence": True,
-                "include_recovery_metadata": True
+                "max_pair_entities": 0,
+                "include_recovery_metadata": True,
+                "build_profile": "fast",
+                "build_cache_size_mb": 256,
+                "mmap_size_mb": 256,
+                "vacuum_on_finalize": False,
+                "index_build_threads": 0,
+                "cited_works": False,
+                "resolve_citations": True,
+                "full_text_search": False,
+                "paper_text": False,
+                "compress_paper_text": False,
+                "compact_link_tables": False,
+                "near_duplicate_detection": True,
+                "drop_near_duplicates": False,
+                "background_reports": True
             },
             "output": {
                 "generate_html_report": True,
@@ -136,6 +155,10 @@ class ConfigLoader:
                 "batch_size": 1000,
                 "memory_limit_mb": 2048,
                 "parallel_processing": False,
+                "workers": 0,
+                "shard_size": 2000,
+                "reference_workers": 0,
+                "reference_chunk_size": 5000,
                 "cache_api_responses": True
             },
             "file_handling": {
@@ -184,6 +207,21 @@ class ConfigLoader:
             'VERBOSE_LOGGING': ('output', 'verbose_logging', self._parse_bool),
             'BATCH_SIZE': ('performance', 'batch_size', int),
             'MEMORY_LIMIT_MB': ('performance', 'memory_limit_mb', int),
+            'PARALLEL_PROCESSING': ('performance', 'parallel_processing', self._parse_bool),
+            'BUILD_WORKERS': ('performance', 'workers', int),
+            'REFERENCE_WORKERS': ('performance', 'reference_workers', int),
+            'DB_BUILD_PROFILE': ('database', 'build_profile', str),
+            'DB_MAX_PAIR_ENTITIES': ('database', 'max_pair_entities', int),
+            'DB_VACUUM_ON_FINALIZE': ('database', 'vacuum_on_finalize', self._parse_bool),
+            'DB_CITED_WORKS': ('database', 'cited_works', self._parse_bool),
+            'DB_RESOLVE_CITATIONS': ('database', 'resolve_citations', self._parse_bool),
+            'DB_FULL_TEXT_SEARCH': ('database', 'full_text_search', self._parse_bool),
+            'DB_PAPER_TEXT': ('database', 'paper_text', self._parse_bool),
+            'DB_COMPRESS_PAPER_TEXT': ('database', 'compress_paper_text', self._parse_bool),
+            'DB_COMPACT_LINK_TABLES': ('database', 'compact_link_tables', self._parse_bool),
+            'DB_NEAR_DUPLICATE_DETECTION': ('database', 'near_duplicate_detection', self._parse_bool),
+            'DB_DROP_NEAR_DUPLICATES': ('database', 'drop_near_duplicates', self._parse_bool),
+            'DB_BACKGROUND_REPORTS': ('database', 'background_reports', self._parse_bool),
         }
         
         for env_var, (section, key, converter) in env_mappings.items():
@@ -232,6 +270,33 @@ class ConfigLoader:
         if config['performance']['memory_limit_mb'] <= 0:
             raise ConfigurationError("Memory limit must be positive")
         
+        if config['performance']['workers'] < 0:
+            raise ConfigurationError("Worker count must be 0 (auto) or positive")
+        
+        if config['performance']['shard_size'] <= 0:
+            raise ConfigurationError("Shard size must be positive")
+        
+        if config['performance']['reference_workers'] < 0:
+            raise ConfigurationError("Reference worker count must be 0 (inline) or positive")
+        
+        if config['performance']['reference_chunk_size'] <= 0:
+            raise ConfigurationError("Reference chunk size must be positive")
+        
+        if config['database']['max_pair_entities'] < 0:
+            raise ConfigurationError("Max pair entities must be 0 (no limit) or positive")
+        
+        if config['database']['build_profile'] not in ('fast', 'safe'):
+            raise ConfigurationError("Database build profile must be 'fast' or 'safe'")
+        
+        # Validate quality criteria
+        criteria = config['data_quality']['quality_criteria']
+        for key in ('min_title_length', 'min_abstract_words'):
+            if (criteria.get(key) or 0) < 0:
+                raise ConfigurationError(f"Quality criterion {key} must be 0 (off) or positive")
+        year_range = criteria.get('year_range')
+        if year_range and (len(year_range) != 2 or int(year_range[0]) > int(year_range[1])):
+            raise ConfigurationError("Quality criterion year_range must be [first_year, last_year]")
+        
         # Validate confidence thresholds
         thresholds = config['crossref']['confidence_thresholds']
         for phase, threshold in thresholds.items():
@@ -308,8 +373,13 @@ class ConfigLoader:
         # Data quality settings
         dq = self.config['data_quality']
         print(f"🔍 Data Quality: {'✅ Enabled' if dq['filtering_enabled'] else '❌ Disabled'}")
-        required_fields = [k.replace('require_', '') for k, v in dq['quality_criteria'].items() if v]
+        required_fields = [k.replace('require_', '') for k, v in dq['quality_criteria'].items()
+                           if k.startswith('require_') and v]
         print(f"   📋 Required fields: {', '.join(required_fields)}")
+        value_rules = [f"{k}={v}" for k, v in dq['quality_criteria'].items()
+                       if not k.startswith(('require_', '_')) and v]
+        if value_rules:
+            print(f"   📏 Value rules: {', '.join(value_rules)}")
         
         # Output settings
         output = self.config['output']
@@ -331,8 +401,13 @@ class ConfigLoader:
         # Data quality settings
         dq = self.config['data_quality']
         print(f"🔍 Data Quality Filtering: {'✅ Enabled' if dq['filtering_enabled'] else '❌ Disabled'}")
-        required_fields = [k.replace('require_', '') for k, v in dq['quality_criteria'].items() if v]
+        required_fields = [k.replace('require_', '') for k, v in dq['quality_criteria'].items()
+                           if k.startswith('require_') and v]
         print(f"   📋 Required fields: {', '.join(required_fields)}")
+        value_rules = [f"{k}={v}" for k, v in dq['quality_criteria'].items()
+                       if not k.startswith(('require_', '_')) and v]
+        if value_rules:
+            print(f"   📏 Value rules: {', '.join(value_rules)}")
         
         # Output settings
         output = self.config['output']
@@ -8,11 +8,35 @@ incomplete records, and malformed data.
 
 import re
 import json
+import logging
+import time
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 from pathlib import Path
 import math
 
+from .exclusion_log import (ENTRY_KEYS, CategorySamples, CsvEntriesSink, ExclusionLog, JsonEntriesSink,
+                            csv_columns, replay)
+from .parsers.records import record_columns
+
+# Empty-field checks of should_exclude_record in priority order, as (column, reason).
+# filter_batch reports the first failing check of a row as its 1-based position.
+EXCLUSION_CHECKS = (
+    ('Authors', "MISSING_AUTHORS: No author names provided"),
+    ('Author(s) ID', "MISSING_AUTHOR_IDS: No Scopus Author IDs provided"),
+    ('Title', "MISSING_TITLE: No title provided"),
+    ('Year', "MISSING_YEAR: No publication year provided"),
+    ('DOI', "MISSING_DOI: No DOI provided"),
+    ('Affiliations', "MISSING_AFFILIATIONS: No institutional affiliations provided"),
+    ('Abstract', "MISSING_ABSTRACT: No abstract provided"),
+)
+
+# Reason of each filter_batch code (0 = passed)
+BATCH_REASONS = ("PASSED: All quality filters passed",) + tuple(reason for _, reason in EXCLUSION_CHECKS)
+
+# Rows per column-oriented chunk in filter_csv_data
+BATCH_SIZE = 10000
+
 
 class ScopusDataQualityFilter:
     """
@@ -53,7 +77,6 @@ class ScopusDataQualityFilter:
             if not self._is_valid_email(self.crossref_email):
                 raise ValueError(f"Invalid email format for CrossRef: {self.crossref_email}")
         
-        self.exclusion_log = []
         self.stats = {
             "total_records": 0,
             "excluded_records": 0,
@@ -69,7 +92,9 @@ class ScopusDataQualityFilter:
                 "phase2a_successful": 0,
                 "phase2b_attempted": 0,
                 "phase2b_successful": 0
-            }
+            },
+            # Seconds spent filtering (including CrossRef recovery) and writing reports
+            "timings": {"filter": 0.0, "reports": 0.0}
         }
         
         # Set up logging
@@ -78,6 +103,9 @@ class ScopusDataQualityFilter:
         else:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.log_path = Path(f"data_quality_exclusion_log_{timestamp}.json")
+        
+        # Excluded rows are streamed to disk; only counters stay in memory
+        self.exclusion_log = ExclusionLog(self.log_path.with_suffix('.jsonl'))
     
     def _is_valid_email(self, email: str) -> bool:
         """Basic email validation for CrossRef polite pool compliance."""
@@ -381,6 +409,47 @@ class ScopusDataQualityFilter:
         # Record passed all filters
         return False, "PASSED: All quality filters passed"
     
+    def filter_batch(self, columns: Mapping[str, Sequence[Optional[str]]]) -> List[int]:
+        """
+        Evaluate the empty-field checks for a column-oriented chunk of records.
+        
+        Gives the same decision as should_exclude_record for every row, as a
+        reason code: 0 when the row passes, otherwise the 1-based position in
+        EXCLUSION_CHECKS of its first failing check (text in BATCH_REASONS).
+        Each column's blank rows are found once per chunk and codes are
+        written from the lowest-priority check to the highest, so the first
+        failing check of a row is the one that remains.
+        
+        Args:
+            columns: Column name -> values of the chunk (all the same length);
+                a column missing from the chunk is empty in every row
+            
+        Returns:
+            Reason code per row
+        """
+        size = len(next(iter(columns.values()))) if columns else 0
+        codes = [0] * size
+        if not self.enable_filtering:
+            return codes
+        
+        for code in range(len(EXCLUSION_CHECKS), 0, -1):
+            values = columns.get(EXCLUSION_CHECKS[code - 1][0])
+            if values is None:
+                codes = [code] * size
+                continue
+            # Same test as (value or '').strip() == "": str.isspace and str.strip agree on whitespace
+            for i in [i for i, value in enumerate(values) if not value or value.isspace()]:
+                codes[i] = code
+        return codes
+    
+    def _batch_reason_codes(self, rows: List[Dict[str, str]]) -> List[int]:
+        """filter_batch reason codes for rows, evaluated in chunks of BATCH_SIZE."""
+        codes = []
+        for start in range(0, len(rows), BATCH_SIZE):
+            columns = record_columns(rows[start:start + BATCH_SIZE], [column for column, _ in EXCLUSION_CHECKS])
+            codes.extend(self.filter_batch(columns))
+        return codes
+    
     def filter_csv_data(self, csv_data: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], Dict]:
         """
         Filter CSV data and return filtered data plus exclusion report.
@@ -391,6 +460,7 @@ class ScopusDataQualityFilter:
         Returns:
             (filtered_data, exclusion_report): Filtered data and detailed report
         """
+        filter_start = time.perf_counter()
         filtered_data = []
         self.stats["total_records"] = len(csv_data)
         
@@ -408,17 +478,24 @@ class ScopusDataQualityFilter:
                 if self.enable_crossref_recovery:  # User confirmed
                     self._initialize_crossref_client()
         
+        # Without CrossRef recovery rows are not modified before the checks, so
+        # they are evaluated column-wise up front; otherwise row by row
+        recovering = self.enable_crossref_recovery and self.crossref_client
+        codes = None if recovering else self._batch_reason_codes(csv_data)
+        
         for i, row in enumerate(csv_data, 1):
             # Progress logging every 100 records
             if i % 100 == 0:
-                import logging
                 logger = logging.getLogger(__name__)
                 logger.info(f"📊 Processing record {i:,} of {len(csv_data):,} ({i/len(csv_data)*100:.1f}%)")
             
-            # PHASE 1: Attempt CrossRef recovery before quality checks (if enabled)
-            if self.enable_crossref_recovery and self.crossref_client:
+            if codes is not None:
+                code = codes[i - 1]
+                should_exclude, reason = code > 0, BATCH_REASONS[code]
+            else:
+                # PHASE 1: Attempt CrossRef recovery before quality checks (if enabled)
                 row = self._attempt_crossref_recovery(row)
-            should_exclude, reason = self.should_exclude_record(row, i)
+                should_exclude, reason = self.should_exclude_record(row, i)
             
             if should_exclude:
                 # Log exclusion with ALL original CSV data
@@ -479,17 +556,56 @@ class ScopusDataQualityFilter:
                     phase2b_rate = (recovery_stats['phase2b_successful'] / recovery_stats['phase2b_attempted']) * 100
                     print(f"   📈 Phase 2b success rate: {phase2b_rate:.1f}%")
         
-        # Save detailed log and generate user-friendly reports
-        self._save_exclusion_log()
-        self._generate_user_friendly_report()
-        self._generate_csv_export()
-        self._generate_missing_doi_report()  # New: specific report for missing DOIs
-        self._generate_html_report()
+        # Save detailed log and generate user-friendly reports (one pass over the exclusion log)
+        self.exclusion_log.close()
+        self.stats["timings"]["filter"] = time.perf_counter() - filter_start
+        self._generate_reports()
+        
+        timings = self.stats["timings"]
+        print(f"   ⏱️ Filter time: {timings['filter']:.2f}s, report time: {timings['reports']:.2f}s")
+        logging.getLogger(__name__).info(
+            f"⏱️ Data quality filter: {timings['filter']:.2f}s filtering, {timings['reports']:.2f}s reports")
         
         return filtered_data, self._generate_exclusion_report()
     
-    def _save_exclusion_log(self):
-        """Save detailed exclusion log to JSON file"""
+    def _generate_reports(self):
+        """
+        Write all exclusion reports with a single pass over the exclusion log.
+        
+        The JSON log, CSV export, per-category CSVs and missing-DOI CSV are
+        sinks fed entry by entry by ``replay``; samples for the text report and
+        missing-DOI pattern counts are gathered in the same pass. The text,
+        missing-DOI analysis and HTML reports are written from those
+        aggregates afterwards.
+        """
+        start = time.perf_counter()
+        samples = CategorySamples(limit=5)
+        missing_doi_patterns = {"has_pubmed": 0, "has_journal_info": 0, "has_title_only": 0, "insufficient_data": 0}
+        
+        json_sink = self._exclusion_log_sink()
+        csv_sinks = self._csv_export_sinks()
+        missing_doi_sink = self._missing_doi_sink(missing_doi_patterns)
+        sinks = [json_sink, samples] + csv_sinks + ([missing_doi_sink] if missing_doi_sink else [])
+        replay(self.exclusion_log, sinks)
+        
+        print(f"   📝 Detailed exclusion log saved: {self.log_path}")
+        self._generate_user_friendly_report(samples.samples)
+        if csv_sinks:
+            print(f"   📊 CSV export of excluded records saved: {csv_sinks[0].path}")
+            for sink in csv_sinks[1:]:
+                print(f"   📊 {sink.category} exclusions CSV saved: {sink.path}")
+        else:
+            print(f"   📊 No excluded records - CSV export skipped")
+        if missing_doi_sink:
+            self._generate_missing_doi_analysis(missing_doi_sink.path, missing_doi_patterns)
+        else:
+            print(f"   📊 No missing DOI records found - all DOIs were present or recovered!")
+        self._generate_html_report()
+        
+        self.stats["timings"]["reports"] = time.perf_counter() - start
+    
+    def _exclusion_log_sink(self) -> JsonEntriesSink:
+        """Sink writing the detailed exclusion log JSON file"""
         log_data = {
             "filter_metadata": {
                 "timestamp": datetime.now().isoformat(),
@@ -499,14 +615,11 @@ class ScopusDataQualityFilter:
                 "records_included": self.stats["included_records"]
             },
             "exclusion_summary": self.stats["exclusion_reasons"],
-            "detailed_exclusions": self.exclusion_log
+            "detailed_exclusions": None  # streamed from the exclusion log
         }
-        
-        with open(self.log_path, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"   📝 Detailed exclusion log saved: {self.log_path}")
+        return JsonEntriesSink(self.log_path, log_data, "detailed_exclusions")
     
+
     def _generate_exclusion_report(self) -> Dict:
         """Generate summary report of exclusions"""
         if self.stats["total_records"] == 0:
@@ -557,7 +670,7 @@ class ScopusDataQualityFilter:
             
             print(f"   {category:<18} {count:<8} {rate:<8} {description}")
     
-    def _generate_user_friendly_report(self):
+    def _generate_user_friendly_report(self, samples: List[Dict]):
         """Generate a comprehensive, human-readable text report"""
         timestamp = datetime.now().strftime("%Y-%m-%d at %H:%M:%S")
         report_path = self.log_path.with_suffix('.txt')
@@ -620,229 +733,140 @@ class ScopusDataQualityFilter:
                 f.write("-"*40 + "\n")
                 f.write("Here are a few examples of excluded records to help you understand:\n\n")
                 
-                # Show up to 5 examples from different categories
-                shown_categories = set()
-                examples_shown = 0
-                for entry in self.exclusion_log:
-                    if examples_shown >= 5:
-                        break
+                # Up to 5 examples from different categories (gathered during the report pass)
+                for examples_shown, entry in enumerate(samples):
                     category = entry["category"]
-                    if category not in shown_categories:
-                        f.write(f"Example {examples_shown + 1}: {self._get_friendly_category_name(category)}\n")
-                        f.write(f"   Title: {entry['title']}\n")
-                        f.write(f"   Authors: {entry['authors'][:50]}{'...' if len(entry['authors']) > 50 else ''}\n")
-                        f.write(f"   Reason: {self._get_friendly_reason(entry['reason'])}\n\n")
-                        shown_categories.add(category)
-                        examples_shown += 1
+                    f.write(f"Example {examples_shown + 1}: {self._get_friendly_category_name(category)}\n")
+                    f.write(f"   Title: {entry['title']}\n")
+                    f.write(f"   Authors: {entry['authors'][:50]}{'...' if len(entry['authors']) > 50 else ''}\n")
+                    f.write(f"   Reason: {self._get_friendly_reason(entry['reason'])}\n\n")
                         
         print(f"   📋 Human-readable report saved: {report_path}")
     
-    def _generate_csv_export(self):
-        """Generate CSV export of excluded records with original data"""
-        csv_path = self.log_path.with_suffix('.csv')
-        
+    def _csv_export_sinks(self) -> List[CsvEntriesSink]:
+        """Sinks for the CSV export of excluded records and the per-category CSV files"""
         if not self.exclusion_log:
-            print(f"   📊 No excluded records - CSV export skipped")
-            return
-        
-        # Store original data for excluded records
-        excluded_records_with_data = []
-        
-        print(f"   📊 Generating CSV export of excluded records...")
-        
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            import csv
+            return []
+        
+        # Metadata columns, then common Scopus CSV columns in logical order, then any others found
+        common_columns = [
+            'title', 'authors', 'doi', 'year', 'abstract', 'affiliations',
+            'document_type', 'source_title', 'volume', 'issue', 'pages',
+            'cited_by_count', 'keywords', 'funding', 'language'
+        ]
+        headers = ['exclusion_reason', 'exclusion_category', 'row_index'] + csv_columns(
+            (key for key in self.exclusion_log.fields if key not in ENTRY_KEYS), common_columns)
+        sinks = [CsvEntriesSink(self.log_path.with_suffix('.csv'), headers, row=self._csv_export_row)]
+        
+        # Separate files for categories with significant numbers of exclusions (5+).
+        # The MISSING_DOI file shares its name with the missing DOI report, which replaces it.
+        missing_doi_csv_path = self._missing_doi_csv_path()
+        for category, count in self.exclusion_log.counts.items():
+            category_csv_path = self.log_path.with_name(f"{self.log_path.stem}_{category.lower()}.csv")
+            if count < 5 or category_csv_path == missing_doi_csv_path:
+                continue
             
-            # Prepare headers - start with metadata columns
-            headers = [
-                'exclusion_reason',
-                'exclusion_category', 
-                'row_index'
-            ]
-            
-            # Add all possible CSV columns from the original data
-            all_csv_columns = set()
-            for entry in self.exclusion_log:
-                # Each entry has the original row data stored
-                for key in entry.keys():
-                    if key not in ['row_index', 'reason', 'category']:
-                        all_csv_columns.add(key)
-            
-            # Add common Scopus CSV columns in logical order
-            common_columns = [
-                'title', 'authors', 'doi', 'year', 'abstract', 'affiliations',
-                'document_type', 'source_title', 'volume', 'issue', 'pages',
-                'cited_by_count', 'keywords', 'funding', 'language'
-            ]
-            
-            # Add common columns first, then any others found
-            for col in common_columns:
-                if col in all_csv_columns:
-                    headers.append(col)
-                    all_csv_columns.remove(col)
-            
-            # Add remaining columns
-            headers.extend(sorted(all_csv_columns))
-            
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            
-            # Write excluded records with their original data
-            for entry in self.exclusion_log:
-                row_data = {
-                    'exclusion_reason': entry.get('reason', ''),
-                    'exclusion_category': entry.get('category', ''),
-                    'row_index': entry.get('row_index', '')
-                }
-                
-                # Add all the original CSV data for this record
-                for key, value in entry.items():
-                    if key not in ['row_index', 'reason', 'category']:
-                        row_data[key] = value
-                
-                writer.writerow(row_data)
-        
-        print(f"   📊 CSV export of excluded records saved: {csv_path}")
+            # Same header logic as main CSV
+            common_columns = ['title', 'authors', 'doi', 'year', 'abstract', 'affiliations']
+            headers = ['exclusion_reason', 'exclusion_category', 'row_index'] + csv_columns(
+                (key for key in self.exclusion_log.category_fields[category] if key not in ENTRY_KEYS),
+                common_columns)
+            sinks.append(CsvEntriesSink(category_csv_path, headers, category=category, row=self._csv_export_row))
+        return sinks
+    
+    @staticmethod
+    def _csv_export_row(entry: Dict) -> Dict:
+        """CSV row of an excluded record: exclusion metadata and its original data"""
+        row_data = {
+            'exclusion_reason': entry.get('reason', ''),
+            'exclusion_category': entry.get('category', ''),
+            'row_index': entry.get('row_index', '')
+        }
         
-        # Generate category-specific CSV files for major categories
-        self._generate_category_csv_files()
+        # Add all the original CSV data for this record
+        for key, value in entry.items():
+            if key not in ['row_index', 'reason', 'category']:
+                row_data[key] = value
+        return row_data
     
-    def _generate_category_csv_files(self):
-        """Generate separate CSV files for each major exclusion category"""
-        
-        # Group exclusions by category
-        by_category = {}
-        for entry in self.exclusion_log:
-            category = entry.get('category', 'OTHER')
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(entry)
-        
-        # Generate CSV for categories with significant numbers of exclusions
-        for category, entries in by_category.items():
-            if len(entries) >= 5:  # Only create separate files for categories with 5+ exclusions
-                category_csv_path = self.log_path.with_name(f"{self.log_path.stem}_{category.lower()}.csv")
-                
-                with open(category_csv_path, 'w', encoding='utf-8', newline='') as f:
-                    import csv
-                    
-                    # Same header logic as main CSV
-                    headers = ['exclusion_reason', 'exclusion_category', 'row_index']
-                    
-                    all_columns = set()
-                    for entry in entries:
-                        for key in entry.keys():
-                            if key not in ['row_index', 'reason', 'category']:
-                                all_columns.add(key)
-                    
-                    common_columns = ['title', 'authors', 'doi', 'year', 'abstract', 'affiliations']
-                    for col in common_columns:
-                        if col in all_columns:
-                            headers.append(col)
-                            all_columns.remove(col)
-                    headers.extend(sorted(all_columns))
-                    
-                    writer = csv.DictWriter(f, fieldnames=headers)
-                    writer.writeheader()
-                    
-                    for entry in entries:
-                        row_data = {
-                            'exclusion_reason': entry.get('reason', ''),
-                            'exclusion_category': entry.get('category', ''),
-                            'row_index': entry.get('row_index', '')
-                        }
-                        
-                        for key, value in entry.items():
-                            if key not in ['row_index', 'reason', 'category']:
-                                row_data[key] = value
-                        
-                        writer.writerow(row_data)
-                
-                print(f"   📊 {category} exclusions CSV saved: {category_csv_path}")
+    def _missing_doi_csv_path(self) -> Path:
+        return self.log_path.with_suffix('.csv').with_name(self.log_path.stem + '_missing_doi.csv')
     
-    def _generate_missing_doi_report(self):
-        """Generate a specialized report for papers missing DOIs (unrecoverable)"""
-        
-        # Find all records that are missing DOIs and couldn't be recovered
-        missing_doi_records = []
-        for entry in self.exclusion_log:
-            if entry.get('category') == 'MISSING_DOI':
-                missing_doi_records.append(entry)
-        
-        if not missing_doi_records:
-            print(f"   📊 No missing DOI records found - all DOIs were present or recovered!")
-            return
-        
-        # Generate CSV report for missing DOI records
-        missing_doi_csv_path = self.log_path.with_suffix('.csv').with_name(
-            self.log_path.stem + '_missing_doi.csv'
-        )
-        
-        with open(missing_doi_csv_path, 'w', encoding='utf-8', newline='') as f:
-            import csv
+    def _missing_doi_sink(self, patterns: Dict[str, int]) -> Optional[CsvEntriesSink]:
+        """Sink for the CSV of papers missing DOIs (unrecoverable); counts recovery patterns into ``patterns``"""
+        if not self.exclusion_log.counts.get('MISSING_DOI', 0):
+            return None
+        
+        # Prepare headers for missing DOI report
+        headers = [
+            'row_index',
+            'title', 
+            'authors',
+            'year',
+            'source_title',
+            'volume',
+            'issue',
+            'page_start',
+            'page_end',
+            'pubmed_id',
+            'abstract',
+            'affiliations',
+            'crossref_attempted',
+            'recovery_failure_reason'
+        ]
+        crossref_attempted = "Yes" if self.enable_crossref_recovery else "No - CrossRef disabled"
+        
+        def missing_doi_row(entry: Dict) -> Dict:
+            # Create troubleshooting analysis
+            pubmed_id = entry.get('pubmed_id', '').strip()
+            title = entry.get('title', '').strip()
+            source_title = entry.get('source_title', '').strip()
+            volume = entry.get('volume', '').strip()
+            year = entry.get('year', '').strip()
             
-            # Prepare headers for missing DOI report
-            headers = [
-                'row_index',
-                'title', 
-                'authors',
-                'year',
-                'source_title',
-                'volume',
-                'issue',
-                'page_start',
-                'page_end',
-                'pubmed_id',
-                'abstract',
-                'affiliations',
-                'crossref_attempted',
-                'recovery_failure_reason'
-            ]
-            
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
+            # Determine why recovery failed
+            if pubmed_id:
+                failure_reason = "Phase 1 (PubMed ID) failed - check PubMed ID validity"
+                patterns["has_pubmed"] += 1
+            elif source_title and (volume or year):
+                failure_reason = "Phase 2a (Journal) failed - journal not found in CrossRef or low confidence match"
+                patterns["has_journal_info"] += 1
+            elif title and len(title) >= 10:
+                failure_reason = "Phase 2b (Title) failed - title search returned no matches or low confidence"
+                patterns["has_title_only"] += 1
+            elif title and len(title) < 10:
+                failure_reason = "Phase 2b skipped - title too short for reliable matching"
+                patterns["insufficient_data"] += 1
+            else:
+                failure_reason = "Insufficient metadata for any recovery phase"
+                patterns["insufficient_data"] += 1
             
-            # Write missing DOI records with troubleshooting info
-            for entry in missing_doi_records:
-                # Create troubleshooting analysis
-                pubmed_id = entry.get('pubmed_id', '').strip()
-                title = entry.get('title', '').strip()
-                source_title = entry.get('source_title', '').strip()
-                volume = entry.get('volume', '').strip()
-                year = entry.get('year', '').strip()
-                
-                # Determine why recovery failed
-                if pubmed_id:
-                    failure_reason = "Phase 1 (PubMed ID) failed - check PubMed ID validity"
-                elif source_title and (volume or year):
-                    failure_reason = "Phase 2a (Journal) failed - journal not found in CrossRef or low confidence match"
-                elif title and len(title) >= 10:
-                    failure_reason = "Phase 2b (Title) failed - title search returned no matches or low confidence"
-                elif title and len(title) < 10:
-                    failure_reason = "Phase 2b skipped - title too short for reliable matching"
-                else:
-                    failure_reason = "Insufficient metadata for any recovery phase"
-                
-                crossref_attempted = "Yes" if self.enable_crossref_recovery else "No - CrossRef disabled"
-                
-                row_data = {
-                    'row_index': entry.get('row_index', ''),
-                    'title': title[:100] + ('...' if len(title) > 100 else ''),
-                    'authors': entry.get('authors', '')[:50] + ('...' if len(entry.get('authors', '')) > 50 else ''),
-                    'year': year,
-                    'source_title': source_title[:30] + ('...' if len(source_title) > 30 else ''),
-                    'volume': volume,
-                    'issue': entry.get('issue', ''),
-                    'page_start': entry.get('page_start', ''),
-                    'page_end': entry.get('page_end', ''),
-                    'pubmed_id': pubmed_id,
-                    'abstract': entry.get('abstract', '')[:100] + ('...' if len(entry.get('abstract', '')) > 100 else ''),
-                    'affiliations': entry.get('affiliations', '')[:100] + ('...' if len(entry.get('affiliations', '')) > 100 else ''),
-                    'crossref_attempted': crossref_attempted,
-                    'recovery_failure_reason': failure_reason
-                }
-                
-                writer.writerow(row_data)
+            return {
+                'row_index': entry.get('row_index', ''),
+                'title': title[:100] + ('...' if len(title) > 100 else ''),
+                'authors': entry.get('authors', '')[:50] + ('...' if len(entry.get('authors', '')) > 50 else ''),
+                'year': year,
+                'source_title': source_title[:30] + ('...' if len(source_title) > 30 else ''),
+                'volume': volume,
+                'issue': entry.get('issue', ''),
+                'page_start': entry.get('page_start', ''),
+                'page_end': entry.get('page_end', ''),
+                'pubmed_id': pubmed_id,
+                'abstract': entry.get('abstract', '')[:100] + ('...' if len(entry.get('abstract', '')) > 100 else ''),
+                'affiliations': entry.get('affiliations', '')[:100] + ('...' if len(entry.get('affiliations', '')) > 100 else ''),
+                'crossref_attempted': crossref_attempted,
+                'recovery_failure_reason': failure_reason
+            }
+        
+        return CsvEntriesSink(self._missing_doi_csv_path(), headers, category='MISSING_DOI', row=missing_doi_row)
+    
+    def _generate_missing_doi_analysis(self, missing_doi_csv_path: Path, patterns: Dict[str, int]):
+        """Generate the text analysis for papers missing DOIs from the recovery pattern counts"""
+        missing_doi_count = self.exclusion_log.counts.get('MISSING_DOI', 0)
+        has_pubmed = patterns["has_pubmed"]
+        has_journal_info = patterns["has_journal_info"]
+        has_title_only = patterns["has_title_only"]
+        insufficient_data = patterns["insufficient_data"]
         
         # Generate text summary for missing DOIs
         missing_doi_txt_path = self.log_path.with_suffix('.txt').with_name(
@@ -856,7 +880,7 @@ class ScopusDataQualityFilter:
             
             f.write(f"📊 MISSING DOI SUMMARY\n")
             f.write("-" * 30 + "\n")
-            f.write(f"Total records missing DOIs: {len(missing_doi_records):,}\n")
+            f.write(f"Total records missing DOIs: {missing_doi_count:,}\n")
             
             if self.enable_crossref_recovery:
                 recovery_stats = self.stats.get("crossref_recovery_stats", {})
@@ -873,28 +897,6 @@ class ScopusDataQualityFilter:
             f.write(f"📋 FAILURE PATTERN ANALYSIS\n")
             f.write("-" * 30 + "\n")
             
-            failure_patterns = {}
-            has_pubmed = 0
-            has_journal_info = 0
-            has_title_only = 0
-            insufficient_data = 0
-            
-            for entry in missing_doi_records:
-                pubmed_id = entry.get('pubmed_id', '').strip()
-                title = entry.get('title', '').strip()
-                source_title = entry.get('source_title', '').strip()
-                volume = entry.get('volume', '').strip()
-                year = entry.get('year', '').strip()
-                
-                if pubmed_id:
-                    has_pubmed += 1
-                elif source_title and (volume or year):
-                    has_journal_info += 1
-                elif title and len(title) >= 10:
-                    has_title_only += 1
-                else:
-                    insufficient_data += 1
-            
             f.write(f"Records with PubMed IDs: {has_pubmed:,} (Phase 1 recovery possible)\n")
             f.write(f"Records with journal details: {has_journal_info:,} (Phase 2a recovery possible)\n")
             f.write(f"Records with titles only: {has_title_only:,} (Phase 2b recovery possible)\n")
@@ -1286,26 +1288,18 @@ class ScopusDataQualityFilter:
         if not self.exclusion_log:
             return "<p><em>No excluded records - no CSV files generated.</em></p>"
         
-        # Group exclusions by category to show which category CSVs exist
-        by_category = {}
-        for entry in self.exclusion_log:
-            category = entry.get('category', 'OTHER')
-            if category not in by_category:
-                by_category[category] = []
-            by_category[category].append(entry)
-        
         html_parts = []
         html_parts.append('<h3>📁 Category-Specific CSV Exports</h3>')
         html_parts.append('<p>Separate CSV files for each exclusion category (5+ records only):</p>')
         html_parts.append('<ul>')
         
         category_files_generated = False
-        for category, entries in by_category.items():
-            if len(entries) >= 5:
+        for category, count in self.exclusion_log.counts.items():
+            if count >= 5:
                 category_files_generated = True
                 friendly_name = self._get_friendly_category_name(category)
                 csv_filename = f"{self.log_path.stem}_{category.lower()}.csv"
-                html_parts.append(f'<li><strong>{friendly_name}:</strong> {csv_filename} ({len(entries)} records)</li>')
+                html_parts.append(f'<li><strong>{friendly_name}:</strong> {csv_filename} ({count} records)</li>')
         
         if not category_files_generated:
             html_parts.append('<li><em>No category-specific files generated (each category had less than 5 records)</em></li>')
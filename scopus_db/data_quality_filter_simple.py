@@ -6,35 +6,56 @@ Focuses on excluding editorial content, incomplete records, and malformed data.
 """
 
 import re
+import copy
 import json
+import time
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from pathlib import Path
 
+from .exclusion_log import ENTRY_KEYS, CsvEntriesSink, ExclusionLog, FirstEntries, JsonEntriesSink, replay
+from .filter_rules import CompiledFilter, build_rules
+from .parsers.headers import HeaderMap, header_map_for
+
+
+# Known header spellings of each required field
+FIELD_VARIATIONS = {
+    "authors": ("Authors", "Author(s)", "Author Names"),
+    "author_ids": ("Author(s) ID", "Author IDs", "Scopus Author ID"),
+    "title": ("Title", "Article Title", "Document Title"),
+    "year": ("Year", "Publication Year", "Pub Year"),
+    "affiliations": ("Affiliations", "Author Affiliations", "Institution(s)"),
+    "abstract": ("Abstract", "Summary", "Description"),
+    "doi": ("DOI",),
+    "document_type": ("Document Type",),
+}
+
 
 class ScopusDataQualityFilter:
     """
     Filters Scopus CSV data to ensure only high-quality research papers are processed.
     
-    Exclusion criteria (empty field checks only):
-    1. Missing authors (no author names provided)
-    2. Missing author IDs (no Scopus Author IDs provided)
-    3. Missing title (no title provided)
-    4. Missing publication year (no year provided)
-    5. Missing DOI (no Digital Object Identifier provided)
-    6. Missing affiliations (no institutional affiliations provided)
-    7. Missing abstract (no abstract provided)
+    Exclusion criteria come from ``data_quality.quality_criteria`` (see
+    filter_rules.build_rules); by default records missing authors, author
+    IDs, title, publication year, affiliations or abstract are excluded.
+    The criteria are compiled once into specialized predicates
+    (filter_rules.CompiledFilter).
     """
     
-    def __init__(self, enable_filtering: bool = True, log_path: Optional[str] = None):
+    def __init__(self, enable_filtering: bool = True, log_path: Optional[str] = None, report_worker=None,
+                 quality_criteria: Optional[Dict] = None):
         """
         Initialize the data quality filter.
         
         Args:
             enable_filtering: Whether to apply filtering (False = no filtering)
             log_path: Path to save exclusion log (auto-generated if None)
+            report_worker: Writes the exclusion reports in the background
+                (``submit(name, writer, *args)``, e.g. a ReportWorker); inline when None
+            quality_criteria: Configured quality criteria (filter_rules.DEFAULT_CRITERIA if None)
         """
         self.enable_filtering = enable_filtering
+        self.report_worker = report_worker
         
         # Setup logging
         if log_path:
@@ -43,26 +64,28 @@ class ScopusDataQualityFilter:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.log_path = Path(f"data_quality_exclusions_{timestamp}.json")
         
-        # Initialize statistics
+        # Statistics and detailed exclusion records (streamed to disk) of the current run
+        self._reset_run()
+        
+        # Exclusion report of the last completed filtering run
+        self.report = None
+        
+        # Seconds spent filtering and writing reports in the last run
+        self.timings = {"filter": 0.0, "reports": 0.0}
+        
+        # Quality rules, compiled per CSV header and ordered by observed rejection rate
+        self.rules = build_rules(quality_criteria)
+        self.rule_filter = CompiledFilter(self.rules, FIELD_VARIATIONS)
+    
+    def _reset_run(self):
+        """Start a filtering run from empty statistics and a new exclusion log."""
         self.stats = {
             "total_records": 0,
             "excluded_records": 0,
             "included_records": 0,
             "exclusion_reasons": {}
         }
-        
-        # Store detailed exclusion records
-        self.exclusion_log = []
-        
-        # Required fields for quality check
-        self.required_fields = [
-            "authors",
-            "author_ids", 
-            "title",
-            "year",
-            "affiliations",
-            "abstract"
-        ]
+        self.exclusion_log = ExclusionLog(self.log_path.with_suffix('.jsonl'))
     
     def should_exclude_record(self, row: Dict[str, str], row_index: int) -> Tuple[bool, str]:
         """
@@ -78,55 +101,25 @@ class ScopusDataQualityFilter:
         if not self.enable_filtering:
             return False, ""
         
-        # Check for required fields
-        for field in self.required_fields:
-            value = self._get_field_value(row, field)
-            if not value or value.strip() == "":
-                reason = f"MISSING_{field.upper()}: No {field.replace('_', ' ')} provided"
-                return True, reason
-        
-        return False, ""
+        reason = self.rule_filter.reason(row)
+        return (True, reason) if reason is not None else (False, "")
     
-    def _get_field_value(self, row: Dict[str, str], field_name: str) -> str:
+    def _get_field_value(self, row: Dict[str, str], field_name: str, header: Optional[HeaderMap] = None) -> str:
         """
         Get field value handling various CSV header formats.
         
         Args:
             row: CSV row dictionary
             field_name: Field name to look for
+            header: Resolved header of the row (looked up if not given)
             
         Returns:
             Field value or empty string if not found
         """
-        # Direct match
-        if field_name in row:
-            return row[field_name]
-        
-        # Case-insensitive search
-        for key in row.keys():
-            if field_name.lower() in key.lower():
-                return row[key]
-        
-        # Handle specific field variations
-        field_variations = {
-            "authors": ["Authors", "Author(s)", "Author Names"],
-            "author_ids": ["Author(s) ID", "Author IDs", "Scopus Author ID"],
-            "title": ["Title", "Article Title", "Document Title"],
-            "year": ["Year", "Publication Year", "Pub Year"],
-            "affiliations": ["Affiliations", "Author Affiliations", "Institution(s)"],
-            "abstract": ["Abstract", "Summary", "Description"]
-        }
-        
-        if field_name in field_variations:
-            for variant in field_variations[field_name]:
-                if variant in row:
-                    return row[variant]
-                # Case-insensitive variant search
-                for key in row.keys():
-                    if variant.lower() == key.lower():
-                        return row[key]
-        
-        return ""
+        if header is None:
+            header = header_map_for(row)
+        key = header.resolve_field(field_name, FIELD_VARIATIONS.get(field_name, ()))
+        return row[key] if key is not None else ""
     
     def filter_csv_data(self, csv_data: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], Dict]:
         """
@@ -138,20 +131,51 @@ class ScopusDataQualityFilter:
         Returns:
             (filtered_data, exclusion_report): Filtered data and detailed report
         """
-        filtered_data = []
-        self.stats["total_records"] = len(csv_data)
+        filtered_data = list(self.filter_records(csv_data, total=len(csv_data)))
+        return filtered_data, self.report
+    
+    def filter_records(self, records: Iterable[Dict[str, str]], total: Optional[int] = None) -> Iterator[Dict[str, str]]:
+        """
+        Stream records through the quality filter.
+        
+        Included records are yielded as soon as they are evaluated; excluded
+        records are appended to the on-disk exclusion log. Once the input is
+        exhausted the exclusion report is stored in ``self.report`` and saved,
+        by the report worker when there is one. Its "exclusions" is the
+        run's ExclusionLog, which supports len() and iteration but reads
+        the entries from disk, so it is only valid until the next run
+        replaces the log file. Statistics are reset at the start of each run.
         
+        Args:
+            records: Iterable of CSV rows as dictionaries
+            total: Number of records, if known (used for progress logging)
+            
+        Yields:
+            Records that pass all quality checks
+        """
+        self._reset_run()
         print(f"\n🔍 APPLYING DATA QUALITY FILTERS")
-        print(f"   Total records to evaluate: {len(csv_data):,}")
+        if total is not None:
+            print(f"   Total records to evaluate: {total:,}")
         
         # Progress logging setup
         import logging
         logger = logging.getLogger(__name__)
         
-        for i, row in enumerate(csv_data, 1):
+        # Time spent in the filter itself (not waiting on the record source or consumer)
+        perf_counter = time.perf_counter
+        filter_seconds = 0.0
+        
+        for i, row in enumerate(records, 1):
+            started = perf_counter()
+            self.stats["total_records"] += 1
+            
             # Progress logging every 100 records
             if i % 100 == 0:
-                logger.info(f"📊 Processing record {i:,} of {len(csv_data):,} ({i/len(csv_data)*100:.1f}%)")
+                if total:
+                    logger.info(f"📊 Processing record {i:,} of {total:,} ({i/total*100:.1f}%)")
+                else:
+                    logger.info(f"📊 Processing record {i:,}")
             
             should_exclude, reason = self.should_exclude_record(row, i)
             
@@ -176,13 +200,21 @@ class ScopusDataQualityFilter:
                 category = exclusion_entry["category"]
                 self.stats["exclusion_reasons"][category] = self.stats["exclusion_reasons"].get(category, 0) + 1
             else:
-                filtered_data.append(row)
                 self.stats["included_records"] += 1
+                filter_seconds += perf_counter() - started
+                yield row
+                continue
+            filter_seconds += perf_counter() - started
+        
+        if self.enable_filtering and self.rules:
+            print(f"   ⚙️ Rule order (most rejections first): {', '.join(self.rule_filter.categories())}")
         
         # Create exclusion report
+        self.exclusion_log.close()
+        self.timings["filter"] = filter_seconds
         exclusion_rate = (self.stats["excluded_records"] / self.stats["total_records"] * 100) if self.stats["total_records"] > 0 else 0
         
-        report = {
+        self.report = {
             "timestamp": datetime.now().isoformat(),
             "summary": {
                 "total_records": self.stats["total_records"],
@@ -191,21 +223,44 @@ class ScopusDataQualityFilter:
                 "exclusion_rate": f"{exclusion_rate:.1f}%",
                 "quality_improvement": f"Filtered out {exclusion_rate:.1f}% low-quality entries"
             },
-            "exclusion_breakdown": self.stats["exclusion_reasons"],
+            "exclusion_breakdown": dict(self.stats["exclusion_reasons"]),
             "exclusions": self.exclusion_log,
             "log_file": str(self.log_path)
         }
         
-        # Save the report
-        self._save_exclusion_report(report)
-        
-        return filtered_data, report
+        # Save the report (from a snapshot sharing the closed, final exclusion log);
+        # the worker records the report time and prints its lines when it is waited for
+        if self.report_worker is not None:
+            snapshot = copy.deepcopy(self.report, {id(self.exclusion_log): self.exclusion_log})
+            self.report_worker.submit("quality_reports", self._save_exclusion_report, snapshot, filter_seconds)
+        else:
+            start = time.perf_counter()
+            for line in self._save_exclusion_report(self.report, filter_seconds):
+                print(line)
+            self.timings["reports"] = time.perf_counter() - start
     
-    def _save_exclusion_report(self, report: Dict):
-        """Save exclusion report in multiple formats."""
-        # Save JSON report
-        with open(self.log_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+    def _save_exclusion_report(self, report: Dict, filter_seconds: float) -> List[str]:
+        """
+        Save exclusion report in multiple formats.
+        
+        The JSON report and CSV exports are fed by a single pass over the
+        exclusion log (``replay``), which also keeps the first records for
+        the text and HTML samples. Only reads its arguments, so it can run
+        on the report worker.
+        
+        Returns:
+            Summary lines to print
+        """
+        start = time.perf_counter()
+        lines = []
+        
+        # JSON report, with the exclusions streamed from the exclusion log
+        exclusion_log = report["exclusions"]
+        document = dict(report, exclusions=None)
+        samples = FirstEntries(limit=100)
+        csv_sinks = self._csv_export_sinks(report)
+        replay(exclusion_log, [JsonEntriesSink(self.log_path, document, "exclusions"), samples] + csv_sinks)
+        samples = samples.entries
         
         # Save human-readable text report
         text_path = self.log_path.with_suffix('.txt')
@@ -226,7 +281,7 @@ class ScopusDataQualityFilter:
             
             f.write("\n\nDETAILED EXCLUSION LOG:\n")
             f.write("-" * 70 + "\n")
-            for entry in report['exclusions'][:100]:  # First 100 for brevity
+            for entry in samples[:100]:  # First 100 for brevity
                 f.write(f"\nRow {entry['row_index']}: {entry['reason']}\n")
                 if 'title' in entry:
                     f.write(f"  Title: {entry.get('title', 'N/A')[:100]}...\n")
@@ -234,58 +289,47 @@ class ScopusDataQualityFilter:
                     f.write(f"  Authors: {entry.get('authors', 'N/A')[:100]}...\n")
         
         # Save CSV export of excluded records
-        self._save_csv_export(report)
+        for sink in csv_sinks:
+            if sink.category is None:
+                lines.append(f"   📊 CSV export of excluded records saved: {sink.path}")
+            else:
+                lines.append(f"   📊 {sink.category} exclusions CSV saved: {sink.path}")
         
         # Generate HTML report
-        self._generate_html_report(report)
-        
-        exclusion_rate = (self.stats["excluded_records"] / self.stats["total_records"] * 100) if self.stats["total_records"] > 0 else 0
-        print(f"   ✅ Records included: {report['summary']['included_records']:,} ({100-exclusion_rate:.1f}%)")
-        print(f"   ❌ Records excluded: {report['summary']['excluded_records']:,} ({exclusion_rate:.1f}%)")
-        print(f"   📝 Detailed exclusion log saved: {self.log_path}")
-        print(f"   📋 Human-readable report saved: {text_path}")
+        html_path = self._generate_html_report(report, samples)
+        lines.append(f"   🌐 Interactive HTML report saved: {html_path}")
+        report_seconds = time.perf_counter() - start
+        
+        summary = report["summary"]
+        exclusion_rate = (summary["excluded_records"] / summary["total_records"] * 100) if summary["total_records"] > 0 else 0
+        lines.append(f"   ✅ Records included: {report['summary']['included_records']:,} ({100-exclusion_rate:.1f}%)")
+        lines.append(f"   ❌ Records excluded: {report['summary']['excluded_records']:,} ({exclusion_rate:.1f}%)")
+        lines.append(f"   📝 Detailed exclusion log saved: {self.log_path}")
+        lines.append(f"   📋 Human-readable report saved: {text_path}")
+        lines.append(f"   ⏱️ Filter time: {filter_seconds:.2f}s, report time: {report_seconds:.2f}s")
+        return lines
     
-    def _save_csv_export(self, report: Dict):
-        """Save excluded records as CSV for easy review."""
-        csv_path = self.log_path.with_suffix('.csv')
-        
-        if not report['exclusions']:
-            return
-        
-        import csv
-        
-        # Get all unique field names from excluded records
-        all_fields = set()
-        for record in report['exclusions']:
-            all_fields.update(record.keys())
-        
-        # Order fields logically
-        ordered_fields = ['row_index', 'reason', 'category']
-        data_fields = sorted([f for f in all_fields if f not in ordered_fields])
+    def _csv_export_sinks(self, report: Dict) -> List[CsvEntriesSink]:
+        """Sinks for the CSV export of excluded records and the category-specific CSV files."""
+        exclusion_log = report["exclusions"]
+        if not exclusion_log:
+            return []
+        
+        # Order fields logically (field names are collected by the exclusion log)
+        ordered_fields = list(ENTRY_KEYS)
+        data_fields = sorted([f for f in exclusion_log.fields if f not in ordered_fields])
         fieldnames = ordered_fields + data_fields
-        
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(report['exclusions'])
-        
-        print(f"   📊 CSV export of excluded records saved: {csv_path}")
+        sinks = [CsvEntriesSink(self.log_path.with_suffix('.csv'), fieldnames)]
         
         # Also create category-specific CSV files for major exclusion categories
         for category in report['exclusion_breakdown']:
             if report['exclusion_breakdown'][category] >= 10:  # Only for categories with 10+ exclusions
-                category_records = [r for r in report['exclusions'] if r['category'] == category]
                 category_csv_path = self.log_path.with_suffix(f'.{category.lower()}.csv')
-                
-                with open(category_csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(category_records)
-                
-                print(f"   📊 {category} exclusions CSV saved: {category_csv_path}")
+                sinks.append(CsvEntriesSink(category_csv_path, fieldnames, category=category))
+        return sinks
     
-    def _generate_html_report(self, report: Dict):
-        """Generate an interactive HTML report."""
+    def _generate_html_report(self, report: Dict, samples: List[Dict]) -> Path:
+        """Generate an interactive HTML report; returns its path."""
         html_path = self.log_path.with_suffix('.html')
         
         html_content = f"""
@@ -375,7 +419,7 @@ class ScopusDataQualityFilter:
 """
         
         # Add sample excluded records
-        for entry in report['exclusions'][:50]:  # First 50 records
+        for entry in samples[:50]:  # First 50 records
             title = entry.get('title', 'N/A')[:80] + '...' if len(entry.get('title', '')) > 80 else entry.get('title', 'N/A')
             authors = entry.get('authors', 'N/A')[:60] + '...' if len(entry.get('authors', '')) > 60 else entry.get('authors', 'N/A')
             html_content += f"""
@@ -397,7 +441,7 @@ class ScopusDataQualityFilter:
         with open(html_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
-        print(f"   🌐 Interactive HTML report saved: {html_path}")
+        return html_path
     
     def print_exclusion_summary(self):
         """Print a summary of exclusion statistics."""
@@ -418,7 +462,11 @@ class ScopusDataQualityFilter:
                     "MISSING_YEAR": "No publication year",
                     "MISSING_DOI": "No DOI provided",
                     "MISSING_AFFILIATIONS": "No institutional affiliations",
-                    "MISSING_ABSTRACT": "No abstract provided"
+                    "MISSING_ABSTRACT": "No abstract provided",
+                    "SHORT_TITLE": "Title below minimum length",
+                    "SHORT_ABSTRACT": "Abstract below minimum word count",
+                    "YEAR_OUT_OF_RANGE": "Publication year outside configured range",
+                    "EXCLUDED_DOCUMENT_TYPE": "Document type not in allowlist"
                 }
                 
                 desc = descriptions.get(category, "Other quality issue")
@@ -0,0 +1,304 @@
+"""
+Analytics Tables Module
+
+Materialized co-author, keyword co-occurrence and per-year trend tables.
+After the load, one ordered scan over papers and their author, keyword and
+institution relationships accumulates pair and trend counts in in-memory
+counters. A counter that outgrows its entry budget merges its partial
+counts into the target table (keyed updates, then inserts of new keys) and
+starts again, so memory
+stays bounded for large corpora while the tables end up holding the exact
+totals. Network and trend queries then read indexed rows instead of
+self-joining paper_authors or paper_keywords.
+"""
+
+import sqlite3
+import time
+from collections import Counter
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Rough in-memory cost of one counter entry (key tuple, value list, dict slot)
+ENTRY_BYTES = 200
+
+ANALYTICS_DDL = {
+    "author_collaborations": """
+        CREATE TABLE author_collaborations (
+            author_id_1 INTEGER, -- lower author_id of the pair
+            author_id_2 INTEGER,
+            collaboration_count INTEGER, -- co-authored papers
+            collaboration_strength REAL, -- sum of 1 / (authors - 1) per paper
+            first_year INTEGER,
+            last_year INTEGER,
+
+            PRIMARY KEY (author_id_1, author_id_2),
+            FOREIGN KEY (author_id_1) REFERENCES authors_master(author_id),
+            FOREIGN KEY (author_id_2) REFERENCES authors_master(author_id)
+        ) WITHOUT ROWID
+    """,
+    "keyword_cooccurrence": """
+        CREATE TABLE keyword_cooccurrence (
+            keyword_id_1 INTEGER, -- lower keyword_id of the pair
+            keyword_id_2 INTEGER,
+            cooccurrence_count INTEGER, -- papers carrying both keywords
+
+            PRIMARY KEY (keyword_id_1, keyword_id_2),
+            FOREIGN KEY (keyword_id_1) REFERENCES keywords_master(keyword_id),
+            FOREIGN KEY (keyword_id_2) REFERENCES keywords_master(keyword_id)
+        ) WITHOUT ROWID
+    """,
+    "temporal_trends": """
+        CREATE TABLE temporal_trends (
+            entity_type TEXT CHECK (entity_type IN ('author', 'keyword', 'institution')),
+            entity_id INTEGER,
+            year INTEGER,
+            paper_count INTEGER,
+            citation_count INTEGER, -- sum of cited_by over the year's papers
+
+            PRIMARY KEY (entity_type, entity_id, year)
+        ) WITHOUT ROWID
+    """,
+}
+
+# Value columns per table and how partial counts combine
+_AGGREGATES = {
+    "author_collaborations": (("collaboration_count", "sum"), ("collaboration_strength", "sum"),
+                              ("first_year", "min"), ("last_year", "max")),
+    "keyword_cooccurrence": (("cooccurrence_count", "sum"),),
+    "temporal_trends": (("paper_count", "sum"), ("citation_count", "sum")),
+}
+
+_KEYS = {
+    "author_collaborations": ("author_id_1", "author_id_2"),
+    "keyword_cooccurrence": ("keyword_id_1", "keyword_id_2"),
+    "temporal_trends": ("entity_type", "entity_id", "year"),
+}
+
+
+def analytics_tables(database_config: Dict) -> List[str]:
+    """Analytics tables enabled by the database configuration, in build order."""
+    if not database_config.get('include_analytics_tables', True):
+        return []
+    tables = []
+    if database_config.get('compute_collaborations', True):
+        tables.append("author_collaborations")
+    if database_config.get('compute_keyword_cooccurrence', True):
+        tables.append("keyword_cooccurrence")
+    tables.append("temporal_trends")
+    return tables
+
+
+def _combine(column: str, aggregate: str) -> Tuple[str, int]:
+    """UPDATE assignment merging a spilled partial value (bound as ?) into the stored one, and its ? count."""
+    if aggregate == "sum":
+        return f"{column} = {column} + ?", 1
+    # Years may be NULL on either side; NULL never wins
+    return f"{column} = {aggregate}(COALESCE({column}, ?), COALESCE(?, {column}))", 2
+
+
+class SpillingCounter:
+    """
+    Keyed counters that spill to their table when they exceed ``max_entries``.
+
+    Values are lists combined per column (sum, min or max, see _AGGREGATES);
+    tables whose only value is a count keep plain integers in a Counter and
+    are fed with ``count()``. ``spill()`` merges the current entries into the
+    table in key order (an UPDATE of existing keys, then INSERT OR IGNORE of
+    the rest) and clears them; ``close()`` writes the remainder, with a plain
+    INSERT when nothing was spilled before.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, table: str, max_entries: int):
+        """
+        Initialize spilling counter.
+
+        Args:
+            conn: Connection holding the (empty) target table
+            table: author_collaborations, keyword_cooccurrence or temporal_trends
+            max_entries: In-memory entries that trigger a spill
+        """
+        self.conn = conn
+        self.table = table
+        self.max_entries = max_entries
+        self.spills = 0
+
+        keys = _KEYS[table]
+        aggregates = _AGGREGATES[table]
+        self._aggregates = [aggregate for _, aggregate in aggregates]
+        self.count_only = self._aggregates == ["sum"]
+        self.entries = Counter() if self.count_only else {}
+
+        columns = keys + tuple(column for column, _ in aggregates)
+        placeholders = ", ".join("?" * len(columns))
+        self._insert_sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        self._insert_missing_sql = self._insert_sql.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
+
+        # UPDATE parameters are picked from the (keys..., values...) row: the
+        # merged values in assignment order, then the keys
+        assignments, self._update_columns = [], []
+        for index, (column, aggregate) in enumerate(aggregates, len(keys)):
+            assignment, uses = _combine(column, aggregate)
+            assignments.append(assignment)
+            self._update_columns += [index] * uses
+        self._update_columns += range(len(keys))
+        self._update_sql = (f"UPDATE {table} SET {', '.join(assignments)} WHERE "
+                            + " AND ".join(f"{key} = ?" for key in keys))
+
+    def count(self, keys: Iterable[tuple]):
+        """Add one occurrence of each key (count-only tables)."""
+        self.entries.update(keys)
+        if len(self.entries) >= self.max_entries:
+            self.spill()
+
+    def add(self, key: tuple, values: list):
+        """Add one observation (``values`` becomes owned by the counter)."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.entries[key] = values
+            if len(self.entries) >= self.max_entries:
+                self.spill()
+            return
+        for index, aggregate in enumerate(self._aggregates):
+            value = values[index]
+            if aggregate == "sum":
+                entry[index] += value
+            elif value is not None and (entry[index] is None or
+                                        (value < entry[index] if aggregate == "min" else value > entry[index])):
+                entry[index] = value
+
+    def spill(self):
+        """Merge the in-memory partial counts into the table and clear them."""
+        # Key order keeps the writes local in the table's primary key B-tree
+        self._merge(sorted(self.entries.items()))
+        self.entries.clear()
+        self.spills += 1
+
+    def close(self):
+        """Write the remaining counts."""
+        if self.spills:
+            self._merge(self.entries.items())
+        else:
+            self.conn.executemany(self._insert_sql, self._rows(self.entries.items()))
+        self.entries.clear()
+
+    def _merge(self, items):
+        """Add counts to existing keys, then insert the keys not stored yet."""
+        rows = list(self._rows(items))
+        columns = self._update_columns
+        self.conn.executemany(self._update_sql, (tuple(row[i] for i in columns) for row in rows))
+        self.conn.executemany(self._insert_missing_sql, rows)
+
+    def _rows(self, items) -> Iterator[tuple]:
+        if self.count_only:
+            return (key + (value,) for key, value in items)
+        return (key + tuple(values) for key, values in items)
+
+
+def _by_paper(rows: Iterator[Tuple[int, int]]) -> Iterator[Tuple[int, List[int]]]:
+    """Group (paper_id, entity_id) rows ordered by paper_id into per-paper id lists."""
+    current, ids = None, []
+    for paper_id, entity_id in rows:
+        if paper_id != current:
+            if ids:
+                yield current, ids
+            current, ids = paper_id, []
+        ids.append(entity_id)
+    if ids:
+        yield current, ids
+
+
+class _PaperStream:
+    """Per-paper entity lists of one relationship table, consumed in paper_id order."""
+
+    def __init__(self, rows: Iterator[Tuple[int, int]]):
+        self._groups = _by_paper(rows)
+        self._next = next(self._groups, None)
+
+    def take(self, paper_id: int) -> Sequence[int]:
+        """Entity ids of ``paper_id`` (empty when the paper has none)."""
+        while self._next is not None and self._next[0] < paper_id:
+            self._next = next(self._groups, None)
+        if self._next is not None and self._next[0] == paper_id:
+            ids = self._next[1]
+            self._next = next(self._groups, None)
+            return ids
+        return ()
+
+
+def build_analytics_tables(conn: sqlite3.Connection, tables: List[str],
+                           memory_limit_mb: int = 2048, max_pair_entities: int = 0) -> Dict:
+    """
+    Fill the enabled analytics tables in one pass over the relationship data.
+
+    Args:
+        conn: Connection to a populated database with the analytics tables created
+        tables: Tables to fill (see analytics_tables)
+        memory_limit_mb: performance.memory_limit_mb; the counters together
+            use at most a quarter of it before spilling
+        max_pair_entities: database.max_pair_entities; papers with more authors
+            (keywords) than this add no collaboration (co-occurrence) pairs,
+            0 for no limit
+
+    Returns:
+        Dictionary with 'rows' and 'spills' per table, 'skipped' (papers over
+        max_pair_entities per pair table), 'papers' and 'seconds'
+    """
+    start = time.perf_counter()
+    if not tables:
+        return {"rows": {}, "spills": {}, "skipped": {}, "papers": 0, "seconds": 0.0}
+
+    max_entries = max(1, memory_limit_mb * 1024 * 1024 // 4 // ENTRY_BYTES // len(tables))
+    counters = {table: SpillingCounter(conn, table, max_entries) for table in tables}
+    collaborations = counters.get("author_collaborations")
+    cooccurrence = counters.get("keyword_cooccurrence")
+    trends = counters.get("temporal_trends")
+    pair_limit = max_pair_entities if max_pair_entities > 0 else float("inf")
+    skipped = {table: 0 for table in ("author_collaborations", "keyword_cooccurrence") if table in counters}
+
+    # Relationship primary keys start with paper_id, so each stream is an index-ordered scan
+    authors = _PaperStream(conn.execute("SELECT paper_id, author_id FROM paper_authors ORDER BY paper_id"))
+    keywords = _PaperStream(conn.execute("SELECT paper_id, keyword_id FROM paper_keywords ORDER BY paper_id"))
+    institutions = _PaperStream(conn.execute(
+        "SELECT paper_id, institution_id FROM paper_institutions ORDER BY paper_id"))
+
+    papers = 0
+    for paper_id, year, cited_by in conn.execute("SELECT paper_id, year, cited_by FROM papers ORDER BY paper_id"):
+        papers += 1
+        paper_authors = sorted(set(authors.take(paper_id)))
+        # A keyword listed as both author and index keyword counts once
+        paper_keywords = sorted(set(keywords.take(paper_id)))
+        paper_institutions = institutions.take(paper_id)
+
+        if collaborations and len(paper_authors) > 1:
+            if len(paper_authors) > pair_limit:
+                skipped["author_collaborations"] += 1
+            else:
+                strength = 1.0 / (len(paper_authors) - 1)
+                for pair in combinations(paper_authors, 2):
+                    collaborations.add(pair, [1, strength, year, year])
+
+        if cooccurrence and len(paper_keywords) > 1:
+            if len(paper_keywords) > pair_limit:
+                skipped["keyword_cooccurrence"] += 1
+            else:
+                cooccurrence.count(combinations(paper_keywords, 2))
+
+        if trends and year is not None:
+            citations = cited_by or 0
+            for entity_type, ids in (("author", paper_authors), ("keyword", paper_keywords),
+                                     ("institution", paper_institutions)):
+                for entity_id in ids:
+                    trends.add((entity_type, entity_id, year), [1, citations])
+
+    for counter in counters.values():
+        counter.close()
+    conn.commit()
+
+    rows = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in tables}
+    return {
+        "rows": rows,
+        "spills": {table: counter.spills for table, counter in counters.items()},
+        "skipped": skipped,
+        "papers": papers,
+        "seconds": time.perf_counter() - start,
+    }
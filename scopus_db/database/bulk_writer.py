@@ -0,0 +1,113 @@
+"""
+Bulk Writer Module
+
+Buffers database rows per table and writes them with executemany in
+configurable batches, inside a small number of large transactions.
+Tracks per-table row counts and insert throughput for reporting.
+"""
+
+import sqlite3
+import time
+from typing import Dict, Optional
+
+from .row_processor import INSERT_STATEMENTS, TABLE_ORDER
+
+
+class BulkWriter:
+    """
+    Batched, transaction-grouped writer for the ingestion tables.
+
+    Rows are queued with ``add(table, values)``. Once ``batch_size`` rows are
+    pending across all tables, every table is flushed in TABLE_ORDER so rows
+    referencing papers or master entities are always written after them.
+    A transaction is committed every ``batches_per_transaction`` flushes
+    and once more on ``close()``.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, batch_size: int = 1000,
+                 batches_per_transaction: int = 100,
+                 statements: Optional[Dict[str, str]] = None):
+        """
+        Initialize bulk writer.
+
+        Args:
+            conn: Open SQLite connection
+            batch_size: Pending rows (all tables) that trigger a flush
+            batches_per_transaction: Flushes grouped into one transaction
+            statements: Insert statement per table (defaults to INSERT_STATEMENTS)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self.batch_size = batch_size
+        self.batches_per_transaction = max(1, batches_per_transaction)
+        self.statements = statements or INSERT_STATEMENTS
+        self.table_order = [t for t in TABLE_ORDER if t in self.statements] + \
+                           [t for t in self.statements if t not in TABLE_ORDER]
+
+        self.buffers = {table: [] for table in self.table_order}
+        self.pending_rows = 0
+        self.flush_count = 0
+        self.commit_count = 0
+
+        # Per-table statistics: rows written and seconds spent in executemany
+        self.table_stats = {table: {"rows": 0, "seconds": 0.0} for table in self.table_order}
+
+    def add(self, table: str, values: tuple):
+        """Queue one row, flushing when the batch is full."""
+        self.buffers[table].append(values)
+        self.pending_rows += 1
+        if self.pending_rows >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all pending rows, committing when a transaction is full."""
+        if not self.pending_rows:
+            return
+
+        for table in self.table_order:
+            rows = self.buffers[table]
+            if rows:
+                start = time.perf_counter()
+                self.cursor.executemany(self.statements[table], rows)
+                stats = self.table_stats[table]
+                stats["seconds"] += time.perf_counter() - start
+                stats["rows"] += len(rows)
+                rows.clear()
+
+        self.pending_rows = 0
+        self.flush_count += 1
+        if self.flush_count % self.batches_per_transaction == 0:
+            self.commit()
+
+    def commit(self):
+        """Commit the current transaction."""
+        self.conn.commit()
+        self.commit_count += 1
+
+    def close(self):
+        """Flush remaining rows and commit the final transaction."""
+        self.flush()
+        self.commit()
+
+    def rows_per_second(self) -> Dict[str, float]:
+        """Return insert throughput per table (rows/sec)."""
+        return {
+            table: (stats["rows"] / stats["seconds"]) if stats["seconds"] > 0 else 0.0
+            for table, stats in self.table_stats.items()
+            if stats["rows"]
+        }
+
+    def print_summary(self):
+        """Print per-table row counts and throughput."""
+        throughput = self.rows_per_second()
+        print(f"\n⚡ BULK LOAD SUMMARY (batch size {self.batch_size:,}, "
+              f"{self.flush_count:,} batches, {self.commit_count:,} transactions)")
+        print(f"   {'Table':<22} {'Rows':>10} {'Seconds':>9} {'Rows/sec':>12}")
+        print("   " + "-" * 56)
+        for table in self.table_order:
+            stats = self.table_stats[table]
+            if stats["rows"]:
+                print(f"   {table:<22} {stats['rows']:>10,} {stats['seconds']:>9.2f} {throughput[table]:>12,.0f}")
@@ -0,0 +1,162 @@
+"""
+Citation Resolver Module
+
+Post-load stage linking references to the papers of the corpus they cite.
+Papers are indexed in memory by normalized DOI and by first-author surname
+plus year; each reference is then looked up with a dictionary probe and
+only candidates sharing its surname and year have their titles compared,
+so resolution is a hash join instead of a fuzzy all-pairs comparison.
+Matches are written with one executemany to paper_citations.cited_paper_id (or to
+cited_works.cited_paper_id in the cited_works layout), which the
+citation_graph view exposes as paper-to-paper edges.
+"""
+
+import re
+import sqlite3
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from ..parsers.references import surname_key, title_words
+
+# Leading title words that must agree between a reference and a paper
+# (all of them when the paper title is shorter)
+TITLE_PREFIX_WORDS = 6
+
+_DOI = re.compile(r'10\.\d{4,9}/[^\s,;()\[\]]+')
+_WORDS = re.compile(r'\w+')
+
+
+def normalize_doi(value: Optional[str]) -> Optional[str]:
+    """Lowercased bare DOI found in a DOI field or reference text, or None."""
+    if not value or '10.' not in value:
+        return None
+    match = _DOI.search(value)
+    return match.group().rstrip('.').lower() if match else None
+
+
+class CitationResolver:
+    """
+    In-memory lookup index over the papers of a database.
+
+    Built once from papers and their first authors; ``resolve`` then maps a
+    reference to a paper_id by DOI, falling back to surname + year (or an
+    adjacent year) + title prefix. When several titles agree the longest one
+    wins; equally long matches are treated as unresolved.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        """
+        Initialize resolver and build the paper index.
+
+        Args:
+            conn: Connection to a populated database
+        """
+        self.by_doi: Dict[str, int] = {}
+        self.by_author_year: Dict[Tuple[str, int], List[Tuple[int, List[str]]]] = defaultdict(list)
+
+        ambiguous_dois = set()
+        rows = conn.execute("""
+            SELECT p.paper_id, p.doi, p.year, p.title, a.abbreviated_name
+            FROM papers p
+            LEFT JOIN paper_authors pa ON pa.paper_id = p.paper_id AND pa.position = 1
+            LEFT JOIN authors_master a ON a.author_id = pa.author_id
+        """)
+        for paper_id, doi, year, title, first_author in rows:
+            doi = normalize_doi(doi)
+            if doi:
+                if doi in self.by_doi:
+                    ambiguous_dois.add(doi)
+                self.by_doi[doi] = paper_id
+            surname = surname_key(first_author)
+            if surname and year and title:
+                words = _WORDS.findall(title.lower())[:TITLE_PREFIX_WORDS]
+                self.by_author_year[(surname, year)].append((paper_id, words))
+
+        for doi in ambiguous_dois:
+            del self.by_doi[doi]
+
+        # Most references predate the corpus; their years are rejected before any parsing
+        self.years = {year + offset for _, year in self.by_author_year for offset in (-1, 0, 1)}
+
+    def resolve(self, reference: str, year: Optional[int], authors: Optional[str]) -> Optional[int]:
+        """
+        Paper cited by one parsed reference.
+
+        Args:
+            reference: Raw reference text
+            year: Parsed reference year
+            authors: Parsed first author ("Smith J.")
+
+        Returns:
+            paper_id of the cited paper, or None when it is not in the corpus
+        """
+        if reference and '10.' in reference:
+            paper_id = self.by_doi.get(normalize_doi(reference))
+            if paper_id is not None:
+                return paper_id
+
+        if year not in self.years:
+            return None
+        surname = surname_key(authors)
+        words = None
+        # Online-first and issue years often differ by one, so the
+        # neighbouring years are tried when the cited year has no match
+        for candidate_year in (year, year - 1, year + 1):
+            candidates = self.by_author_year.get((surname, candidate_year))
+            if not candidates:
+                continue
+            if words is None:
+                words = title_words(reference, TITLE_PREFIX_WORDS)
+            matches = [(len(paper_words), paper_id) for paper_id, paper_words in candidates
+                       if paper_words and words[:len(paper_words)] == paper_words]
+            if matches:
+                # The longest agreeing title wins ("Laser welding" vs "Laser welding of steel")
+                matches.sort(reverse=True)
+                if len(matches) > 1 and matches[0][0] == matches[1][0]:
+                    return None
+                return matches[0][1]
+        return None
+
+
+def resolve_citations(conn: sqlite3.Connection, cited_works: bool = False) -> Dict[str, float]:
+    """
+    Fill cited_paper_id for references to papers in the same database.
+
+    Args:
+        conn: Connection to a populated database
+        cited_works: Whether the database uses the cited_works layout
+
+    Returns:
+        Dictionary with 'candidates' (references examined), 'resolved' and 'seconds'
+    """
+    start = time.perf_counter()
+    resolver = CitationResolver(conn)
+
+    if cited_works:
+        table, key = "cited_works", "cited_work_id"
+    else:
+        table, key = "paper_citations", "citation_id"
+
+    # Self-links are impossible for a reference list, so the citing paper is skipped
+    citing = "NULL" if cited_works else "citing_paper_id"
+    rows = conn.execute(f"""
+        SELECT {key}, {citing}, reference_text, reference_year, reference_authors FROM {table}
+    """)
+
+    resolve = resolver.resolve
+    update = f"UPDATE {table} SET cited_paper_id = ? WHERE {key} = ?"
+    candidates = 0
+    links = []
+    for row_id, citing_paper_id, reference, year, authors in rows:
+        candidates += 1
+        paper_id = resolve(reference, year, authors)
+        if paper_id is not None and paper_id != citing_paper_id:
+            links.append((paper_id, row_id))
+
+    # Updates run after the scan so the read cursor never sees rows it changed
+    conn.executemany(update, links)
+    conn.commit()
+
+    return {"candidates": candidates, "resolved": len(links), "seconds": time.perf_counter() - start}
+
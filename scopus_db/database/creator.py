@@ -6,15 +6,33 @@ Focuses on structuring raw Scopus data without pre-computed analytics.
 """
 
 import sqlite3
+import copy
 import csv
 import json
 import os
 import logging
+import time
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 from ..data_quality_filter_simple import ScopusDataQualityFilter
+from ..parsers.csv_files import iter_csv_files_parallel
+from ..parsers.records import read_records
+from .row_processor import ScopusRecordProcessor
+from .bulk_writer import BulkWriter
+from .pragmas import apply_build_profile, finalize_database
+from .analytics_tables import ANALYTICS_DDL, analytics_tables, build_analytics_tables
+from .citation_resolver import resolve_citations
+from .link_tables import COMPACT_LINK_DDL, COMPACT_LINK_INDEXES, LINK_TABLES, PAPER_KEYWORD_DETAILS_VIEW
+from .metrics import compute_entity_metrics
+from .near_duplicates import NearDuplicateDetector
+from .paper_text import PAPER_TEXT_DDL, paper_details_view, register_text_functions
+from .search import create_search_index, rebuild_search_index
+from .reference_pipeline import ReferencePipeline
+from .report_worker import ReportWorker
+from .sharded_build import sharded_ingest
 
 
 class OptimalScopusDatabase:
@@ -113,35 +131,55 @@ class OptimalScopusDatabase:
         # Get data quality configuration
         data_quality_config = config.get_data_quality_config()
         
+        # Quality, deduplication and validation reports are written off the critical path
+        self.report_worker = ReportWorker(background=config.get_database_config().get('background_reports', True))
+        
         self.data_filter = ScopusDataQualityFilter(
             enable_filtering=enable_data_filtering and data_quality_config['filtering_enabled'],
-            log_path=str(filter_log_path)
+            log_path=str(filter_log_path),
+            report_worker=self.report_worker,
+            quality_criteria=data_quality_config.get('quality_criteria')
         )
         
         # Store config for use in database creation
         self.config = config
         
-        # Entity registries for normalization
-        self.authors_registry = {}      # scopus_id -> author_id
-        self.institutions_registry = {} # canonical_name -> institution_id
-        self.keywords_registry = {}     # keyword_text -> keyword_id
-        
-        # Counters for entity IDs
-        self.author_counter = 1
-        self.institution_counter = 1
-        self.keyword_counter = 1
-        
+        # Single-pass record processor owns the entity registries and ID counters
+        self.cited_works = config.get_database_config().get('cited_works', False)
+        self.analytics_tables = analytics_tables(config.get_database_config())
+        self.entity_metrics = config.get_database_config().get('include_analytics_tables', True)
+        self.full_text_search = config.get_database_config().get('full_text_search', False)
+        self.paper_text = config.get_database_config().get('paper_text', False)
+        self.compress_paper_text = self.paper_text and config.get_database_config().get('compress_paper_text', False)
+        self.compact_link_tables = config.get_database_config().get('compact_link_tables', False)
+        self.processor = ScopusRecordProcessor(scopus_query=self.scopus_query, cited_works=self.cited_works,
+                                               paper_text=self.paper_text,
+                                               compress_paper_text=self.compress_paper_text,
+                                               compact_link_tables=self.compact_link_tables)
+        self.authors_registry = self.processor.authors_registry            # scopus_id -> author_id
+        self.institutions_registry = self.processor.institutions_registry  # canonical_name -> institution_id
+        self.keywords_registry = self.processor.keywords_registry          # normalized_text -> keyword_id
+
         # Statistics tracking with expected vs actual counts
         self.stats = {
             "papers_processed": 0,
             "papers_filtered_out": 0,
             "duplicates_removed": 0,
+            "near_duplicates_removed": 0,
             "csv_files_processed": 0,
+            "records_loaded": 0,
             "authors_normalized": 0,
             "institutions_normalized": 0,
             "keywords_normalized": 0,
+            "citations_resolved": 0,
         }
         
+        # Wall-clock seconds per build phase of process_csv_to_optimal_db
+        self.phase_timings = {}
+        
+        # Queue, write and total latency (seconds) per report, once the build has waited for them
+        self.report_timings = {}
+        
         # Expected vs Actual table population tracking
         self.population_tracking = {
             "expected": {
@@ -159,110 +197,6 @@ class OptimalScopusDatabase:
             "validation_issues": []
         }
     
-    def _get_column_value(self, row: Dict, column_name: str, alternatives: List[str] = None) -> str:
-        """
-        Get column value handling BOM and formatting issues in CSV headers.
-        
-        Args:
-            row: CSV row dictionary
-            column_name: Primary column name to look for
-            alternatives: Alternative column names to try
-        
-        Returns:
-            Column value or empty string if not found
-        """
-        # Try exact match first
-        if column_name in row:
-            return row.get(column_name, '')
-        
-        # Handle BOM and quote issues - look for column containing the name
-        for key in row.keys():
-            if column_name in key:
-                return row.get(key, '')
-        
-        # Try alternatives if provided
-        if alternatives:
-            for alt in alternatives:
-                if alt in row:
-                    return row.get(alt, '')
-                # Also check for BOM/quote issues in alternatives
-                for key in row.keys():
-                    if alt in key:
-                        return row.get(key, '')
-        
-        return ''
-    
-    def _track_expected_counts(self, data: List[Dict]):
-        """Calculate expected table population counts from data."""
-        print("📊 Calculating expected table population counts...")
-        
-        # Papers count (should match input data)
-        self.population_tracking["expected"]["papers"] = len(data)
-        
-        # Track unique entities to estimate normalized table sizes
-        unique_authors = set()
-        unique_institutions = set()
-        unique_keywords = set()
-        total_funding_entries = 0
-        total_author_papers = 0
-        total_keyword_papers = 0
-        total_institution_papers = 0
-        total_citation_entries = 0
-        
-        for row in data:
-            # Count unique authors
-            authors_raw = self._get_column_value(row, 'Authors')
-            author_ids_raw = self._get_column_value(row, 'Author(s) ID')
-            if authors_raw and author_ids_raw:
-                author_ids = [a.strip() for a in str(author_ids_raw).split(';') if a.strip()]
-                unique_authors.update(author_ids)
-                total_author_papers += len(author_ids)
-            
-            # Count unique institutions
-            affiliations_raw = self._get_column_value(row, 'Affiliations')
-            if affiliations_raw:
-                affiliations = [a.strip() for a in str(affiliations_raw).split(';') if a.strip()]
-                unique_institutions.update(affiliations)
-                total_institution_papers += len(affiliations)
-            
-            # Count unique keywords
-            for col_name in ['Author Keywords', 'Index Keywords']:
-                keywords_raw = self._get_column_value(row, col_name)
-                if keywords_raw:
-                    keywords = [k.strip() for k in str(keywords_raw).split(';') if k.strip()]
-                    unique_keywords.update(keywords)
-                    total_keyword_papers += len(keywords)
-            
-            # Count funding entries
-            funding_text = self._get_column_value(row, 'Funding Details') or self._get_column_value(row, 'Funding Texts')
-            if funding_text:
-                funding_entries = [f.strip() for f in str(funding_text).split(';') if f.strip()]
-                total_funding_entries += len(funding_entries)
-            
-            # Count citation entries
-            references_text = self._get_column_value(row, 'References')
-            if references_text:
-                # Estimate citations based on text length and patterns
-                citation_count = len([r for r in str(references_text).split(';') if len(r.strip()) > 10])
-                total_citation_entries += citation_count
-        
-        # Update expected counts
-        self.population_tracking["expected"]["authors_master"] = len(unique_authors)
-        self.population_tracking["expected"]["institutions_master"] = len(unique_institutions)
-        self.population_tracking["expected"]["keywords_master"] = len(unique_keywords)
-        self.population_tracking["expected"]["paper_funding"] = total_funding_entries
-        self.population_tracking["expected"]["paper_authors"] = total_author_papers
-        self.population_tracking["expected"]["paper_keywords"] = total_keyword_papers
-        self.population_tracking["expected"]["paper_institutions"] = total_institution_papers
-        self.population_tracking["expected"]["paper_citations"] = total_citation_entries
-        
-        print(f"   📋 Expected papers: {self.population_tracking['expected']['papers']:,}")
-        print(f"   👥 Expected unique authors: {self.population_tracking['expected']['authors_master']:,}")
-        print(f"   🏢 Expected unique institutions: {self.population_tracking['expected']['institutions_master']:,}")
-        print(f"   🔖 Expected unique keywords: {self.population_tracking['expected']['keywords_master']:,}")
-        print(f"   💰 Expected funding entries: {self.population_tracking['expected']['paper_funding']:,}")
-        print(f"   📊 Expected citations: {self.population_tracking['expected']['paper_citations']:,}")
-    
     def _validate_table_population(self) -> Dict:
         """Validate that all tables populated as expected and return validation report."""
         print("\n🔍 VALIDATING DATABASE POPULATION...")
@@ -327,10 +261,16 @@ class OptimalScopusDatabase:
                 validation_report["overall_status"] = "FAIL"
                 print(f"   ❌ {table_name}: Database error - {str(e)}")
         
+        # Foreign keys are checked once after load (see _finalize_database)
+        for issue in self.population_tracking["validation_issues"]:
+            validation_report["critical_issues"].append(issue)
+            validation_report["overall_status"] = "FAIL"
+            print(f"   ❌ {issue}")
+        
         return validation_report
     
-    def _generate_validation_report(self, validation_report: Dict) -> str:
-        """Generate a comprehensive validation report."""
+    def _generate_validation_report(self, validation_report: Dict, population_tracking: Dict = None) -> str:
+        """Generate a comprehensive validation report (population counts from ``population_tracking``, default: current)."""
         from datetime import datetime
         
         report_lines = []
@@ -345,8 +285,9 @@ class OptimalScopusDatabase:
         # Summary statistics
         report_lines.append("POPULATION SUMMARY:")
         report_lines.append("-" * 40)
-        total_expected = sum(self.population_tracking["expected"].values())
-        total_actual = sum(self.population_tracking["actual"].values())
+        population_tracking = population_tracking or self.population_tracking
+        total_expected = sum(population_tracking["expected"].values())
+        total_actual = sum(population_tracking["actual"].values())
         overall_percentage = (total_actual / total_expected * 100) if total_expected > 0 else 0
         
         report_lines.append(f"Total Expected Records: {total_expected:,}")
@@ -408,10 +349,20 @@ class OptimalScopusDatabase:
         print(f"Creating optimal database schema: {self.db_path}")
         
         self.conn = sqlite3.connect(self.db_path)
+        if self.paper_text:
+            register_text_functions(self.conn)
         cursor = self.conn.cursor()
         
-        # Enable foreign keys
-        cursor.execute("PRAGMA foreign_keys = ON")
+        # Build-phase PRAGMAs (journal, sync, cache, deferred foreign key checks)
+        db_config = self.config.get_database_config()
+        self.build_settings = apply_build_profile(
+            self.conn,
+            profile=db_config.get('build_profile', 'fast'),
+            cache_size_mb=db_config.get('build_cache_size_mb', 256),
+            mmap_size_mb=db_config.get('mmap_size_mb', 256)
+        )
+        print(f"   Build profile: {db_config.get('build_profile', 'fast')} "
+              f"(journal_mode={self.build_settings['journal_mode']}, synchronous={self.build_settings['synchronous']})")
         
         # Phase 1: Master entity tables
         self._create_master_tables(cursor)
@@ -421,9 +372,20 @@ class OptimalScopusDatabase:
         
         # Phase 2: Relationship tables
         self._create_relationship_tables(cursor)
-        
-        # Create basic indexes
-        self._create_basic_indexes(cursor)
+
+        # Complex data tables (chemicals, trade names, correspondence, open access)
+        self._create_supplementary_tables(cursor)
+
+        # Phase 3: Materialized analytics tables, filled after the load
+        for table in self.analytics_tables:
+            cursor.execute(ANALYTICS_DDL[table])
+
+        # Optional FTS5 index over titles, abstracts and keywords, filled after the load
+        if self.full_text_search:
+            create_search_index(cursor, papers="paper_details" if self.paper_text else "papers",
+                                keywords="paper_keyword_details" if self.compact_link_tables else "paper_keywords")
+
+        # Secondary indexes are built once after the bulk load (see _create_basic_indexes)
         
         self.conn.commit()
         print("Optimal database schema created successfully")
@@ -464,8 +426,17 @@ class OptimalScopusDatabase:
         """)
     
     def _create_papers_table(self, cursor: sqlite3.Cursor):
-        """Create papers table with raw Scopus data only."""
-        cursor.execute("""
+        """
+        Create papers table with raw Scopus data only.
+        
+        With database.paper_text, scopus_link and abstract are stored in
+        paper_text instead and the paper_details view exposes the inline
+        column layout.
+        """
+        text_columns = "" if self.paper_text else """
+                scopus_link TEXT,
+                abstract TEXT,"""
+        cursor.execute(f"""
             CREATE TABLE papers (
                 paper_id INTEGER PRIMARY KEY,
                 title TEXT NOT NULL,
@@ -477,9 +448,7 @@ class OptimalScopusDatabase:
                 page_start TEXT,
                 page_end TEXT,
                 page_count INTEGER,
-                cited_by INTEGER DEFAULT 0,
-                scopus_link TEXT,
-                abstract TEXT,
+                cited_by INTEGER DEFAULT 0,{text_columns}
                 language_original TEXT,
                 document_type TEXT,
                 publication_stage TEXT,
@@ -488,10 +457,47 @@ class OptimalScopusDatabase:
                 scopus_query TEXT
             )
         """)
+        
+        if self.paper_text:
+            cursor.execute(PAPER_TEXT_DDL)
+            columns = [info[1] for info in cursor.execute("PRAGMA table_info(papers)")]
+            cursor.execute(paper_details_view(columns, compressed=self.compress_paper_text))
     
     def _create_relationship_tables(self, cursor: sqlite3.Cursor):
         """Create relationship tables with raw data only."""
         
+        if self.compact_link_tables:
+            # WITHOUT ROWID link tables with integer-coded keyword_type (see link_tables)
+            for table in LINK_TABLES:
+                cursor.execute(COMPACT_LINK_DDL[table])
+            cursor.execute(PAPER_KEYWORD_DETAILS_VIEW)
+        else:
+            self._create_link_tables(cursor)
+        
+        # Citation relationships: inline reference data, or links to cited_works
+        if self.cited_works:
+            self._create_cited_works_tables(cursor)
+        else:
+            self._create_inline_citations_table(cursor)
+        self._create_citation_graph_view(cursor)
+        
+        # Funding relationships
+        cursor.execute("""
+            CREATE TABLE paper_funding (
+                paper_id INTEGER,
+                funding_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                agency_name TEXT NOT NULL,
+                grant_numbers TEXT, -- JSON array
+                country TEXT,
+                funding_amount REAL,
+                
+                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+            )
+        """)
+    
+    def _create_link_tables(self, cursor: sqlite3.Cursor):
+        """Create the paper-author, paper-keyword and paper-institution tables."""
+        
         # Paper-author relationships
         cursor.execute("""
             CREATE TABLE paper_authors (
@@ -535,8 +541,9 @@ class OptimalScopusDatabase:
                 FOREIGN KEY (institution_id) REFERENCES institutions_master(institution_id)
             )
         """)
-        
-        # Citation relationships (structured with enhanced schema)
+    
+    def _create_inline_citations_table(self, cursor: sqlite3.Cursor):
+        """Create paper_citations with the parsed reference stored on every row."""
         cursor.execute("""
             CREATE TABLE paper_citations (
                 citation_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -558,23 +565,135 @@ class OptimalScopusDatabase:
                 FOREIGN KEY (cited_paper_id) REFERENCES papers(paper_id)
             )
         """)
+    
+    def _create_cited_works_tables(self, cursor: sqlite3.Cursor):
+        """
+        Create cited_works and the link-only paper_citations table.
         
-        # Funding relationships
+        Each distinct cited work (see reference_fingerprint) is stored once
+        with its per-work citation count; paper_citations keeps only the
+        citing paper, the work and the position in the reference list. The
+        paper_citation_details view exposes the inline column layout.
+        """
         cursor.execute("""
-            CREATE TABLE paper_funding (
-                paper_id INTEGER,
-                funding_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                agency_name TEXT NOT NULL,
-                grant_numbers TEXT, -- JSON array
-                country TEXT,
-                funding_amount REAL,
+            CREATE TABLE cited_works (
+                cited_work_id INTEGER PRIMARY KEY,
+                fingerprint TEXT NOT NULL, -- first-author surname|year|title shingle hash
+                reference_text TEXT, -- first occurrence
+                reference_year INTEGER,
+                reference_authors TEXT,
+                reference_title TEXT,
+                reference_journal TEXT,
+                reference_volume TEXT,
+                reference_issue TEXT,
+                reference_pages TEXT,
+                citation_count INTEGER DEFAULT 0, -- filled after the load
+                cited_paper_id INTEGER, -- in-corpus paper, filled by citation resolution
                 
-                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+                FOREIGN KEY (cited_paper_id) REFERENCES papers(paper_id)
+            )
+        """)
+        
+        cursor.execute("""
+            CREATE TABLE paper_citations (
+                citing_paper_id INTEGER,
+                cited_work_id INTEGER,
+                position INTEGER,
+                
+                PRIMARY KEY (citing_paper_id, position),
+                FOREIGN KEY (citing_paper_id) REFERENCES papers(paper_id),
+                FOREIGN KEY (cited_work_id) REFERENCES cited_works(cited_work_id)
             )
         """)
+        
+        cursor.execute("""
+            CREATE VIEW paper_citation_details AS
+            SELECT pc.citing_paper_id, pc.cited_work_id, cw.reference_text,
+                   cw.reference_year, cw.reference_authors, cw.reference_title,
+                   cw.reference_journal, cw.reference_volume, cw.reference_issue,
+                   cw.reference_pages, pc.position, cw.cited_paper_id
+            FROM paper_citations pc
+            JOIN cited_works cw ON cw.cited_work_id = pc.cited_work_id
+        """)
     
-    def _create_basic_indexes(self, cursor: sqlite3.Cursor):
-        """Create basic indexes for query performance."""
+    def _create_citation_graph_view(self, cursor: sqlite3.Cursor):
+        """Create the citation_graph view of resolved paper-to-paper citations."""
+        if self.cited_works:
+            cursor.execute("""
+                CREATE VIEW citation_graph AS
+                SELECT pc.citing_paper_id, cw.cited_paper_id, pc.position
+                FROM paper_citations pc
+                JOIN cited_works cw ON cw.cited_work_id = pc.cited_work_id
+                WHERE cw.cited_paper_id IS NOT NULL
+            """)
+        else:
+            cursor.execute("""
+                CREATE VIEW citation_graph AS
+                SELECT citing_paper_id, cited_paper_id, position
+                FROM paper_citations
+                WHERE cited_paper_id IS NOT NULL
+            """)
+    
+    def _create_supplementary_tables(self, cursor: sqlite3.Cursor):
+        """Create tables for complex data fields parsed alongside each paper."""
+
+        # Chemical substances and CAS numbers
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS paper_chemicals (
+                paper_id INTEGER,
+                chemical_name TEXT,
+                cas_number TEXT,
+                position INTEGER,
+                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+            )
+        """)
+
+        # Trade names and manufacturers
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS paper_trade_names (
+                paper_id INTEGER,
+                trade_name TEXT,
+                manufacturer TEXT,
+                position INTEGER,
+                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+            )
+        """)
+
+        # Correspondence author information
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS paper_correspondence (
+                paper_id INTEGER,
+                author_name TEXT,
+                email TEXT,
+                institution TEXT,
+                PRIMARY KEY (paper_id),
+                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+            )
+        """)
+
+        # Open access and publisher information
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS paper_open_access (
+                paper_id INTEGER,
+                access_type TEXT,
+                publisher TEXT,
+                open_access BOOLEAN DEFAULT FALSE,
+                PRIMARY KEY (paper_id),
+                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+            )
+        """)
+
+    def _create_basic_indexes(self, cursor: sqlite3.Cursor) -> Dict[str, float]:
+        """
+        Create basic indexes for query performance.
+        
+        Called once after the bulk load so inserts only maintain primary keys.
+        SQLite allows a single writer, so indexes are built one at a time; the
+        sort inside each CREATE INDEX uses PRAGMA threads helper threads instead.
+        
+        Returns:
+            Build time in seconds per index name
+        """
         
         indexes = [
             # Papers table indexes
@@ -593,28 +712,121 @@ class OptimalScopusDatabase:
             # Institutions master indexes
             "CREATE INDEX IF NOT EXISTS idx_institutions_name ON institutions_master (canonical_name)",
             "CREATE INDEX IF NOT EXISTS idx_institutions_country ON institutions_master (country)",
-            
-            # Relationship table indexes
-            "CREATE INDEX IF NOT EXISTS idx_paper_authors_paper ON paper_authors (paper_id)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_authors_author ON paper_authors (author_id)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_authors_position ON paper_authors (paper_id, position)",
-            
-            "CREATE INDEX IF NOT EXISTS idx_paper_keywords_paper ON paper_keywords (paper_id)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_keywords_keyword ON paper_keywords (keyword_id)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_keywords_type ON paper_keywords (keyword_type)",
-            
-            "CREATE INDEX IF NOT EXISTS idx_paper_institutions_paper ON paper_institutions (paper_id)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_institutions_institution ON paper_institutions (institution_id)",
-            
-            # Citation table indexes
-            "CREATE INDEX IF NOT EXISTS idx_paper_citations_citing ON paper_citations (citing_paper_id)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_citations_year ON paper_citations (reference_year)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_citations_journal ON paper_citations (reference_journal)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_citations_authors ON paper_citations (reference_authors)"
         ]
         
+        if self.compact_link_tables:
+            # Paper lookups use the clustered primary keys; one covering index per table
+            indexes += COMPACT_LINK_INDEXES
+        else:
+            # Relationship table indexes
+            indexes += [
+                "CREATE INDEX IF NOT EXISTS idx_paper_authors_paper ON paper_authors (paper_id)",
+                "CREATE INDEX IF NOT EXISTS idx_paper_authors_author ON paper_authors (author_id)",
+                "CREATE INDEX IF NOT EXISTS idx_paper_authors_position ON paper_authors (paper_id, position)",
+                
+                "CREATE INDEX IF NOT EXISTS idx_paper_keywords_paper ON paper_keywords (paper_id)",
+                "CREATE INDEX IF NOT EXISTS idx_paper_keywords_keyword ON paper_keywords (keyword_id)",
+                "CREATE INDEX IF NOT EXISTS idx_paper_keywords_type ON paper_keywords (keyword_type)",
+                
+                "CREATE INDEX IF NOT EXISTS idx_paper_institutions_paper ON paper_institutions (paper_id)",
+                "CREATE INDEX IF NOT EXISTS idx_paper_institutions_institution ON paper_institutions (institution_id)",
+            ]
+        
+        if self.cited_works:
+            # Citing-paper lookups use the (citing_paper_id, position) primary key
+            indexes += [
+                "CREATE INDEX IF NOT EXISTS idx_paper_citations_work ON paper_citations (cited_work_id)",
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_cited_works_fingerprint ON cited_works (fingerprint)",
+                "CREATE INDEX IF NOT EXISTS idx_cited_works_count ON cited_works (citation_count)",
+                "CREATE INDEX IF NOT EXISTS idx_cited_works_year ON cited_works (reference_year)",
+                "CREATE INDEX IF NOT EXISTS idx_cited_works_journal ON cited_works (reference_journal)",
+                "CREATE INDEX IF NOT EXISTS idx_cited_works_authors ON cited_works (reference_authors)",
+                "CREATE INDEX IF NOT EXISTS idx_cited_works_paper ON cited_works (cited_paper_id) "
+                "WHERE cited_paper_id IS NOT NULL",
+            ]
+        else:
+            # Citation table indexes
+            indexes += [
+                "CREATE INDEX IF NOT EXISTS idx_paper_citations_citing ON paper_citations (citing_paper_id)",
+                "CREATE INDEX IF NOT EXISTS idx_paper_citations_year ON paper_citations (reference_year)",
+                "CREATE INDEX IF NOT EXISTS idx_paper_citations_journal ON paper_citations (reference_journal)",
+                "CREATE INDEX IF NOT EXISTS idx_paper_citations_authors ON paper_citations (reference_authors)",
+                # Only resolved in-corpus citations are indexed ("who cites paper X")
+                "CREATE INDEX IF NOT EXISTS idx_paper_citations_cited_paper ON paper_citations (cited_paper_id) "
+                "WHERE cited_paper_id IS NOT NULL",
+            ]
+        
+        # Analytics tables: the primary keys serve lookups by the first id of a pair
+        # and by (entity_type, entity_id); the second id and rankings need their own
+        if "author_collaborations" in self.analytics_tables:
+            indexes += [
+                "CREATE INDEX IF NOT EXISTS idx_collaborations_author2 ON author_collaborations (author_id_2)",
+                "CREATE INDEX IF NOT EXISTS idx_collaborations_count ON author_collaborations (collaboration_count)",
+                "CREATE INDEX IF NOT EXISTS idx_collaborations_strength ON author_collaborations (collaboration_strength)",
+            ]
+        if "keyword_cooccurrence" in self.analytics_tables:
+            indexes += [
+                "CREATE INDEX IF NOT EXISTS idx_cooccurrence_keyword2 ON keyword_cooccurrence (keyword_id_2)",
+                "CREATE INDEX IF NOT EXISTS idx_cooccurrence_count ON keyword_cooccurrence (cooccurrence_count)",
+            ]
+        if "temporal_trends" in self.analytics_tables:
+            indexes.append("CREATE INDEX IF NOT EXISTS idx_temporal_year ON temporal_trends (year, entity_type)")
+        if self.entity_metrics:
+            indexes += [
+                "CREATE INDEX IF NOT EXISTS idx_authors_papers ON authors_master (total_papers)",
+                "CREATE INDEX IF NOT EXISTS idx_authors_h_index ON authors_master (h_index)",
+                "CREATE INDEX IF NOT EXISTS idx_institutions_papers ON institutions_master (paper_count)",
+            ]
+        
+        threads = self.config.get_database_config().get('index_build_threads', 0) or min(4, os.cpu_count() or 1)
+        cursor.execute(f"PRAGMA threads = {threads}")
+        
+        timings = {}
         for index_sql in indexes:
+            index_name = index_sql.split(" ON ")[0].split()[-1]
+            start = time.perf_counter()
             cursor.execute(index_sql)
+            timings[index_name] = time.perf_counter() - start
+        self.conn.commit()
+        
+        return timings
+    
+    def _build_indexes(self):
+        """Build secondary indexes after the load and report per-index timings."""
+        if not self.config.get_database_config().get('create_indexes', True):
+            print("\n⏭️ Index creation disabled (database.create_indexes = false)")
+            return
+        
+        print("\n🗂️ Building indexes after bulk load...")
+        cursor = self.conn.cursor()
+        self.index_timings = self._create_basic_indexes(cursor)
+        
+        # An index whose columns are a prefix of another index (including
+        # PRIMARY KEY / UNIQUE autoindexes) on the same table adds little
+        covered = self._find_redundant_indexes(cursor, list(self.index_timings))
+        for index_name, seconds in sorted(self.index_timings.items(), key=lambda item: -item[1]):
+            note = f"  (covered by {covered[index_name]})" if index_name in covered else ""
+            print(f"   {index_name:<42} {seconds:>7.3f}s{note}")
+        print(f"   Total index build time: {sum(self.index_timings.values()):.2f}s")
+    
+    def _find_redundant_indexes(self, cursor: sqlite3.Cursor, index_names: List[str]) -> Dict[str, str]:
+        """Map each index to another index on the same table whose leading columns cover it."""
+        redundant = {}
+        for index_name in index_names:
+            row = cursor.execute("SELECT tbl_name FROM sqlite_master WHERE type = 'index' AND name = ?", (index_name,)).fetchone()
+            if not row:
+                continue
+            columns = [info[2] for info in cursor.execute(f"PRAGMA index_info({index_name})")]
+            for other in cursor.execute(f"PRAGMA index_list({row[0]})").fetchall():
+                other_name = other[1]
+                if other_name == index_name:
+                    continue
+                other_columns = [info[2] for info in cursor.execute(f"PRAGMA index_info({other_name})")]
+                if len(other_columns) > len(columns) and other_columns[:len(columns)] == columns or \
+                        (other_columns == columns and other_name.startswith("sqlite_autoindex")):
+                    redundant[index_name] = other_name
+                    break
+        return redundant
     
     def _create_research_indexes(self, cursor: sqlite3.Cursor):
         """Create performance indexes optimized for research query patterns."""
@@ -673,10 +885,31 @@ class OptimalScopusDatabase:
         Returns:
             Tuple of (unique_records, duplicate_count)
         """
+        unique_records = list(self._deduplicate_stream(zip(all_records, file_sources)))
+        return unique_records, self.stats["duplicates_removed"]
+    
+    def _deduplicate_stream(self, records: Iterable[Tuple[Dict[str, str], str]]) -> Iterator[Dict[str, str]]:
+        """
+        Stream DOI-based deduplication over (record, source_file) pairs.
+        
+        Only the DOIs seen so far and summaries of flagged records are kept in
+        memory; unique records are yielded as soon as they are read. Records
+        without DOI go through a NearDuplicateDetector (database.near_duplicate_detection);
+        confirmed near-duplicates are reported as clusters and, with
+        database.drop_near_duplicates, dropped like DOI duplicates. The
+        deduplication report is printed once the input is exhausted and its
+        JSON logs are handed to the report worker.
+        
+        Args:
+            records: Iterable of (record, source_file) pairs in load order
+            
+        Yields:
+            Unique records (first occurrence of each DOI, plus records without DOI)
+        """
         seen_dois = set()
-        unique_records = []
+        total_records = 0
+        unique_count = 0
         duplicate_count = 0
-        unique_sources = []
         
         # Detailed reporting dictionaries
         doi_duplicates = []
@@ -684,28 +917,41 @@ class OptimalScopusDatabase:
         duplicates_by_year = defaultdict(int)
         missing_doi_by_year = defaultdict(int)
         
+        # Near-duplicate detection over the records without DOI
+        db_config = self.config.get_database_config()
+        near_duplicates = NearDuplicateDetector() if db_config.get('near_duplicate_detection', True) else None
+        drop_near_duplicates = near_duplicates is not None and db_config.get('drop_near_duplicates', False)
+        near_duplicate_count = 0
+        
         print(f"\n🔍 DOI-ONLY DEDUPLICATION ANALYSIS")
-        print(f"   Total records before deduplication: {len(all_records):,}")
         print(f"   Using ONLY DOI for duplicate detection")
+        if near_duplicates:
+            print(f"   Records without DOI: MinHash/LSH near-duplicate detection"
+                  f"{' (duplicates dropped)' if drop_near_duplicates else ''}")
         
-        for i, record in enumerate(all_records):
+        for i, (record, source_file) in enumerate(records):
+            total_records += 1
             doi = record.get('DOI', '').strip()
             title = record.get('Title', '').strip()
             year = record.get('Year', '').strip()
             
-            is_duplicate = False
-            
             if not doi:
                 # NO DOI - Flag for review but include in database
-                missing_doi_records.append({
+                summary = {
                     'record_index': i,
                     'title': title[:100] + '...' if len(title) > 100 else title,
                     'year': year,
-                    'source_file': file_sources[i],
+                    'source_file': source_file,
                     'authors': record.get('Authors', '')[:100] + '...' if len(record.get('Authors', '')) > 100 else record.get('Authors', ''),
                     'source_title': record.get('Source title', ''),
                     'pubmed_id': record.get('PubMed ID', '').strip()
-                })
+                }
+                missing_doi_records.append(summary)
+                
+                if near_duplicates and near_duplicates.add(record, summary) is not None and drop_near_duplicates:
+                    # Confirmed near-duplicate of an earlier record without DOI - Remove
+                    near_duplicate_count += 1
+                    continue
                 
                 # Track missing DOI by year
                 if year:
@@ -717,22 +963,22 @@ class OptimalScopusDatabase:
                         pass
                 
                 # Include record without DOI (no deduplication possible)
-                unique_records.append(record)
-                unique_sources.append(file_sources[i])
+                unique_count += 1
+                yield record
                 
             elif doi in seen_dois:
                 # DOI DUPLICATE - Remove
-                is_duplicate = True
                 duplicate_count += 1
                 
-                # Log DOI duplicate details
-                doi_duplicates.append({
-                    'record_index': i,
-                    'doi': doi,
-                    'title': title[:100] + '...' if len(title) > 100 else title,
-                    'year': year,
-                    'source_file': file_sources[i]
-                })
+                # Log DOI duplicate details (first 100 only, matching the saved report)
+                if len(doi_duplicates) < 100:
+                    doi_duplicates.append({
+                        'record_index': i,
+                        'doi': doi,
+                        'title': title[:100] + '...' if len(title) > 100 else title,
+                        'year': year,
+                        'source_file': source_file
+                    })
                 
                 # Track duplicates by year
                 if year:
@@ -745,13 +991,19 @@ class OptimalScopusDatabase:
             else:
                 # UNIQUE DOI - Keep record
                 seen_dois.add(doi)
-                unique_records.append(record)
-                unique_sources.append(file_sources[i])
+                unique_count += 1
+                yield record
         
-        print(f"   ✅ Unique records after deduplication: {len(unique_records):,}")
+        self.stats["duplicates_removed"] = duplicate_count
+        self.stats["near_duplicates_removed"] = near_duplicate_count
+        near_duplicate_clusters = near_duplicates.clusters() if near_duplicates else []
+        
+        print(f"\n🔍 DOI-ONLY DEDUPLICATION RESULTS")
+        print(f"   Total records before deduplication: {total_records:,}")
+        print(f"   ✅ Unique records after deduplication: {unique_count:,}")
         print(f"   ❌ Duplicate records removed: {duplicate_count:,}")
         if duplicate_count > 0:
-            print(f"   📊 Deduplication rate: {duplicate_count/len(all_records)*100:.1f}%")
+            print(f"   📊 Deduplication rate: {duplicate_count/total_records*100:.1f}%")
         
         # Calculate missing DOI count
         missing_doi_count = len(missing_doi_records)
@@ -760,6 +1012,12 @@ class OptimalScopusDatabase:
         print(f"\n📋 DETAILED DEDUPLICATION REPORT:")
         print(f"   DOI-based deduplication: {duplicate_count:,} duplicates removed")
         print(f"   Records without DOI: {missing_doi_count:,} flagged for review")
+        if near_duplicates:
+            clustered = sum(len(cluster) for cluster in near_duplicate_clusters)
+            print(f"   Near-duplicate clusters without DOI: {len(near_duplicate_clusters):,} "
+                  f"({clustered:,} records, {near_duplicates.stats['candidates']:,} candidate pairs checked)")
+            if drop_near_duplicates:
+                print(f"   Near-duplicate records removed: {near_duplicate_count:,}")
         
         # Report duplicates by publication year
         if duplicates_by_year:
@@ -780,49 +1038,66 @@ class OptimalScopusDatabase:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             duplicate_log = {
                 'summary': {
-                    'total_records': len(all_records),
-                    'unique_records': len(unique_records),
+                    'total_records': total_records,
+                    'unique_records': unique_count,
                     'duplicate_count': duplicate_count,
-                    'deduplication_rate': duplicate_count/len(all_records)*100 if len(all_records) > 0 else 0,
+                    'deduplication_rate': duplicate_count/total_records*100 if total_records > 0 else 0,
                     'missing_doi_count': missing_doi_count,
+                    'near_duplicates_removed': near_duplicate_count,
                     'duplicates_by_year': dict(duplicates_by_year),
                     'missing_doi_by_year': dict(missing_doi_by_year)
                 },
-                'doi_duplicates': doi_duplicates[:100],  # Limit to first 100 for file size
+                'doi_duplicates': doi_duplicates,  # Limited to first 100 for file size
                 'missing_doi_records': missing_doi_records[:100],  # Sample of records needing DOI
                 'generation_timestamp': timestamp
             }
             
-            # Save to JSON file in output directory
+            # Separate missing DOI records file for manual review
+            missing_doi_report = None
+            if missing_doi_count > 0:
+                missing_doi_report = {
+                    'summary': {
+                        'total_missing_doi': missing_doi_count,
+                        'missing_doi_by_year': dict(missing_doi_by_year),
+                        'near_duplicate_clusters': len(near_duplicate_clusters),
+                        'near_duplicates_removed': near_duplicate_count
+                    },
+                    'records_needing_doi': missing_doi_records,
+                    'near_duplicate_clusters': near_duplicate_clusters,
+                    'generation_timestamp': timestamp,
+                    'instructions': ('These records lack DOI. Near-duplicate clusters share year, first author, '
+                                     'source title and a similar title; '
+                                     + ('all but the first record of each cluster were removed. '
+                                        if drop_near_duplicates else 'all records were kept. ')
+                                     + 'Manual DOI identification needed.')
+                }
+            
+            # Save to JSON files in output directory (in the background; the dicts are not touched again)
             if hasattr(self.data_filter, 'log_path'):
-                duplicate_log_path = self.data_filter.log_path.parent / f"deduplication_details_{timestamp}.json"
-                try:
-                    with open(duplicate_log_path, 'w', encoding='utf-8') as f:
-                        json.dump(duplicate_log, f, indent=2, ensure_ascii=False)
-                    print(f"   💾 Detailed duplicate log saved: {duplicate_log_path.name}")
-                except Exception as e:
-                    print(f"   ⚠️ Could not save duplicate log: {e}")
-                
-                # Save separate missing DOI records file for manual review
-                if missing_doi_count > 0:
-                    missing_doi_log_path = self.data_filter.log_path.parent / f"missing_doi_records_{timestamp}.json"
-                    missing_doi_report = {
-                        'summary': {
-                            'total_missing_doi': missing_doi_count,
-                            'missing_doi_by_year': dict(missing_doi_by_year)
-                        },
-                        'records_needing_doi': missing_doi_records,
-                        'generation_timestamp': timestamp,
-                        'instructions': 'These records lack DOI and were not deduplicated. Manual DOI identification needed.'
-                    }
-                    try:
-                        with open(missing_doi_log_path, 'w', encoding='utf-8') as f:
-                            json.dump(missing_doi_report, f, indent=2, ensure_ascii=False)
-                        print(f"   🔍 Missing DOI report saved: {missing_doi_log_path.name}")
-                    except Exception as e:
-                        print(f"   ⚠️ Could not save missing DOI report: {e}")
-        
-        return unique_records, duplicate_count
+                self.report_worker.submit("deduplication_logs", self._save_deduplication_logs,
+                                          timestamp, duplicate_log, missing_doi_report)
+    
+    def _save_deduplication_logs(self, timestamp: str, duplicate_log: Dict, missing_doi_report: Dict = None) -> List[str]:
+        """Save the deduplication log and, when records lack DOI, the missing DOI report; returns lines to print."""
+        lines = []
+        duplicate_log_path = self.data_filter.log_path.parent / f"deduplication_details_{timestamp}.json"
+        try:
+            with open(duplicate_log_path, 'w', encoding='utf-8') as f:
+                json.dump(duplicate_log, f, indent=2, ensure_ascii=False)
+            lines.append(f"   💾 Detailed duplicate log saved: {duplicate_log_path.name}")
+        except Exception as e:
+            lines.append(f"   ⚠️ Could not save duplicate log: {e}")
+        
+        # Save separate missing DOI records file for manual review
+        if missing_doi_report is not None:
+            missing_doi_log_path = self.data_filter.log_path.parent / f"missing_doi_records_{timestamp}.json"
+            try:
+                with open(missing_doi_log_path, 'w', encoding='utf-8') as f:
+                    json.dump(missing_doi_report, f, indent=2, ensure_ascii=False)
+                lines.append(f"   🔍 Missing DOI report saved: {missing_doi_log_path.name}")
+            except Exception as e:
+                lines.append(f"   ⚠️ Could not save missing DOI report: {e}")
+        return lines
     
     def process_csv_to_optimal_db(self):
         """Parse and import Scopus CSV data into structured database with quality filtering."""
@@ -830,121 +1105,94 @@ class OptimalScopusDatabase:
         
         logger.info("🔄 Starting CSV data processing and population")
         
+        # Records stream CSV -> dedup -> filter -> database in bounded chunks,
+        # so the full export is never held in memory
         if self.multi_csv_mode:
-            # Multi-CSV processing
-            print(f"🔄 Loading Multiple CSV files from: {self.csv_path}")
-            raw_data = []
-            file_sources = []
-            
-            for csv_file in self.csv_files:
-                print(f"   📄 Loading: {csv_file.name}")
-                try:
-                    with open(csv_file, 'r', encoding='utf-8-sig') as file:
-                        reader = csv.DictReader(file)
-                        file_data = list(reader)
-                        raw_data.extend(file_data)
-                        # Track which file each record came from
-                        file_sources.extend([csv_file.name] * len(file_data))
-                        print(f"      Records loaded: {len(file_data):,}")
-                except Exception as e:
-                    print(f"      ❌ Error loading {csv_file.name}: {e}")
-                    continue
-            
-            self.stats["csv_files_processed"] = len(self.csv_files)
-            print(f"\n📊 MULTI-CSV SUMMARY:")
-            print(f"   CSV files processed: {self.stats['csv_files_processed']}")
-            print(f"   Total records loaded: {len(raw_data):,}")
-            
-            # Deduplicate records across files
-            if len(raw_data) > 0:
-                raw_data, duplicates_removed = self._deduplicate_records(raw_data, file_sources)
-                self.stats["duplicates_removed"] = duplicates_removed
-            
+            # Multi-CSV processing, deduplicated across files
+            print(f"🔄 Streaming Multiple CSV files from: {self.csv_path}")
+            records = self._deduplicate_stream(self._iter_csv_records(self.csv_files))
         else:
             # Single CSV processing (original behavior)
-            print(f"📄 Loading Single CSV: {self.csv_path}")
-            raw_data = []
-            with open(self.csv_path, 'r', encoding='utf-8-sig') as file:
-                reader = csv.DictReader(file)
-                raw_data = list(reader)
-            
-            print(f"   Records loaded: {len(raw_data):,}")
-            self.stats["csv_files_processed"] = 1
+            print(f"📄 Streaming Single CSV: {self.csv_path}")
+            records = (row for row, _ in self._iter_csv_records([self.csv_path], strict=True))
+        
+        # Apply data quality filtering on the fly
+        logger.info("📊 Starting streaming data quality filtering")
+        data = self.data_filter.filter_records(records)
+        
+        # Database schema already created in main script - skip duplicate creation
+        logger.info("🔧 Database schema already created, proceeding with data import")
         
-        # Apply data quality filtering
-        logger.info(f"📊 Starting data quality filtering on {len(raw_data):,} records")
-        data, filter_report = self.data_filter.filter_csv_data(raw_data)
-        logger.info(f"✅ Data quality filtering completed. Records after filtering: {len(data):,}")
+        # Single fused pass: every record is parsed once and written to all tables
+        # (CSV decoding, deduplication and filtering run inside this phase)
+        print("\n=== Single-Pass Ingestion ===")
+        with self._phase("ingest"):
+            self._ingest_records(data)
+        
+        if self.cited_works:
+            with self._phase("cited_works"):
+                self._count_cited_works()
+        
+        if self.config.get_database_config().get('resolve_citations', True):
+            with self._phase("citation_resolution"):
+                self._resolve_citations()
+        
+        if self.analytics_tables:
+            with self._phase("analytics"):
+                self._build_analytics_tables()
+        
+        if self.entity_metrics:
+            with self._phase("metrics"):
+                self._compute_entity_metrics()
+        
+        if self.full_text_search:
+            with self._phase("search_index"):
+                self._build_search_index()
+        
+        filter_report = self.data_filter.report
+        logger.info(f"✅ Data quality filtering completed. Records after filtering: {filter_report['summary']['included_records']:,}")
         self.stats["papers_filtered_out"] = filter_report["summary"]["excluded_records"]
         
+        if self.multi_csv_mode:
+            print(f"\n📊 MULTI-CSV SUMMARY:")
+            print(f"   CSV files processed: {self.stats['csv_files_processed']}")
+            print(f"   Total records loaded: {self.stats['records_loaded']:,}")
+            print(f"   CSV decode time: {sum(f['seconds'] for f in self.csv_load_stats):.2f}s")
+        
         # Print filtering summary
         self.data_filter.print_exclusion_summary()
         
         print(f"\n📊 FINAL DATASET SUMMARY:")
-        print(f"   Total records in CSV: {len(raw_data):,}")
-        print(f"   Records after filtering: {len(data):,}")
+        print(f"   Total records in CSV: {filter_report['summary']['total_records']:,}")
+        print(f"   Records after filtering: {filter_report['summary']['included_records']:,}")
         print(f"   Quality improvement: {filter_report['summary']['quality_improvement']}")
         print(f"   Detailed exclusion log: {filter_report['log_file']}")
-        print(f"\nProceeding with {len(data)} high-quality research papers...")
+        print(f"   Filter time: {self.data_filter.timings['filter']:.2f}s")
         
-        # Track expected counts before processing
-        self._track_expected_counts(data)
+        # Expected counts are accumulated during the same pass
+        self._report_expected_counts()
         
-        # Database schema already created in main script - skip duplicate creation
-        logger.info("🔧 Database schema already created, proceeding with data import")
+        # Create basic indexes for query performance, once, after the load
+        with self._phase("indexes"):
+            self._build_indexes()
         
-        # Phase 1: Extract and normalize entities
-        print("\n=== Phase 1: Entity Normalization ===")
-        self._import_papers(data)
-        self._normalize_authors(data)
-        self._normalize_institutions(data)
-        self._normalize_keywords(data)
-        
-        # Parse additional complex data fields
-        print("\n=== Phase 1.5: Complex Data Parsing ===")
-        self._parse_funding_data(data)
-        self._parse_references_data(data)
-        self._parse_chemicals_data(data)
-        self._parse_trade_names_data(data)
-        self._parse_correspondence_data(data)
-        self._parse_open_access_data(data)
-        
-        # Phase 2: Build data relationships
-        print("\n=== Phase 2: Data Relationships ===")
-        self._build_paper_author_relationships(data)
-        self._build_paper_keyword_relationships(data)
-        self._build_paper_institution_relationships(data)
-        
-        # Create basic indexes for query performance
-        cursor = self.conn.cursor()
-        self._create_basic_indexes(cursor)
+        # Verify deferred foreign keys, refresh statistics, switch to read profile
+        with self._phase("finalize"):
+            self._finalize_database()
         
         print(f"\n✅ High-quality research database created: {self.db_path}")
         print(f"Database size: {self.db_path.stat().st_size / (1024*1024):.1f} MB")
-        self._print_statistics()
+        with self._phase("statistics"):
+            self._print_statistics()
         
         # Validate database population
-        validation_report = self._validate_table_population()
-        
-        # Generate and save validation report
-        report_content = self._generate_validation_report(validation_report)
-        
-        # Save validation report to file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_filename = f"database_validation_report_{timestamp}.txt"
-        if self.multi_csv_mode:
-            report_path = self.csv_path / "output" / report_filename
-        else:
-            if self.csv_path.parent.name == "raw_scopus":
-                report_path = self.csv_path.parent.parent / "output" / report_filename
-            else:
-                report_path = self.csv_path.parent / report_filename
-        
-        # Ensure output directory exists
-        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._phase("validation"):
+            validation_report = self._validate_table_population()
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        # Generate and save validation report (in the background, from a snapshot)
+        report_path = self._validation_report_path()
+        self.report_worker.submit("validation_report", self._save_validation_report, report_path,
+                                  copy.deepcopy(validation_report), copy.deepcopy(self.population_tracking))
         
         # Print validation summary
         print(f"\n🔍 DATABASE VALIDATION SUMMARY:")
@@ -963,810 +1211,330 @@ class OptimalScopusDatabase:
         else:
             print(f"\n❌ DATABASE VALIDATION FAILED - Check report for critical issues")
             print(f"   Report location: {report_path}")
-    
-    def _import_papers(self, data: List[Dict]):
-        """Import papers with enhanced metadata."""
-        print("Importing papers with research metrics...")
-        cursor = self.conn.cursor()
-        
-        for idx, row in enumerate(data):
-            # Parse basic paper data
-            year = int(row.get('Year', 0)) if str(row.get('Year', '')).isdigit() else None
-            cited_by = int(row.get('Cited by', 0)) if str(row.get('Cited by', '')).isdigit() else 0
-            
-            cursor.execute("""
-                INSERT INTO papers (
-                    paper_id, title, year, doi, source_title, volume, issue,
-                    page_start, page_end, page_count, cited_by, scopus_link,
-                    abstract, language_original, document_type, publication_stage,
-                    issn, isbn, scopus_query
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                idx + 1,  # paper_id (1-based)
-                row.get('Title', ''),
-                year,
-                row.get('DOI', ''),
-                row.get('Source title', ''),
-                row.get('Volume', ''),
-                row.get('Issue', ''),
-                row.get('Page start', ''),
-                row.get('Page end', ''),
-                int(row.get('Page count', 0)) if str(row.get('Page count', '')).isdigit() else None,
-                cited_by,
-                row.get('Link', ''),
-                row.get('Abstract', ''),
-                row.get('Language of Original Document', ''),
-                row.get('Document Type', ''),
-                row.get('Publication Stage', ''),
-                row.get('ISSN', ''),
-                row.get('ISBN', ''),
-                self.scopus_query  # Add the Scopus query for each record
-            ))
-            
-            self.stats["papers_processed"] += 1
-        
-        self.conn.commit()
-        print(f"Imported {self.stats['papers_processed']} papers")
-    
-    def _normalize_authors(self, data: List[Dict]):
-        """Extract and normalize unique authors with disambiguation."""
-        print("Normalizing authors with disambiguation...")
-        cursor = self.conn.cursor()
-        
-        for idx, row in enumerate(data):
-            authors_raw = self._get_column_value(row, 'Authors')
-            author_ids_raw = self._get_column_value(row, 'Author(s) ID')
-            full_names_raw = self._get_column_value(row, 'Author full names')
-            
-            if authors_raw and author_ids_raw:
-                authors = [a.strip() for a in str(authors_raw).split(';') if a.strip()]
-                author_ids = [a.strip() for a in str(author_ids_raw).split(';') if a.strip()]
-                
-                # Extract full names if available
-                full_names = []
-                if full_names_raw:
-                    full_names = [a.strip() for a in str(full_names_raw).split(';') if a.strip()]
-                
-                # Process each author
-                for i, (author, scopus_id) in enumerate(zip(authors, author_ids)):
-                    if scopus_id and scopus_id not in self.authors_registry:
-                        # Extract full name if available
-                        full_name = author
-                        if i < len(full_names):
-                            # Extract name from "Last, First (ID)" format
-                            full_name_part = full_names[i]
-                            if '(' in full_name_part:
-                                full_name = full_name_part.split('(')[0].strip()
-                        
-                        # Create canonical name (simplified for matching)
-                        canonical_name = self._canonicalize_author_name(full_name)
-                        
-                        cursor.execute("""
-                            INSERT INTO authors_master 
-                            (author_id, scopus_id, full_name, canonical_name, abbreviated_name)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, (
-                            self.author_counter, 
-                            scopus_id, 
-                            full_name, 
-                            canonical_name,
-                            author
-                        ))
-                        
-                        self.authors_registry[scopus_id] = self.author_counter
-                        self.author_counter += 1
-                        self.stats["authors_normalized"] += 1
-        
-        self.conn.commit()
-        print(f"Normalized {self.stats['authors_normalized']} unique authors")
-    
-    def _canonicalize_author_name(self, name: str) -> str:
-        """Create canonical version of author name for disambiguation."""
-        if not name:
-            return ""
-        
-        # Remove punctuation and extra spaces
-        import string
-        name = name.translate(str.maketrans('', '', string.punctuation))
-        
-        # Convert to lowercase and split
-        parts = name.lower().split()
-        
-        # Simple canonicalization: "Last, First" -> "first last"
-        if len(parts) >= 2:
-            return ' '.join(sorted(parts))
         
-        return ' '.join(parts)
+        # The run only waits for the background reports here, at exit
+        self._wait_for_reports()
     
-    def _normalize_institutions(self, data: List[Dict]):
-        """Extract and normalize institutions from affiliation data."""
-        print("Normalizing institutions...")
-        cursor = self.conn.cursor()
-        
-        institution_patterns = set()
-        
-        for idx, row in enumerate(data):
-            affiliations_raw = row.get('Affiliations', '')
-            
-            if affiliations_raw:
-                # Split affiliations and extract institution names
-                affiliations = [a.strip() for a in str(affiliations_raw).split(';') if a.strip()]
-                
-                for affiliation in affiliations:
-                    # Extract institution name (simple heuristic)
-                    institution_name = self._extract_institution_name(affiliation)
-                    
-                    if institution_name and institution_name not in self.institutions_registry:
-                        # Extract country if possible
-                        country = self._extract_country(affiliation)
-                        
-                        cursor.execute("""
-                            INSERT INTO institutions_master 
-                            (institution_id, canonical_name, country)
-                            VALUES (?, ?, ?)
-                        """, (self.institution_counter, institution_name, country))
-                        
-                        self.institutions_registry[institution_name] = self.institution_counter
-                        self.institution_counter += 1
-                        self.stats["institutions_normalized"] += 1
-        
-        self.conn.commit()
-        print(f"Normalized {self.stats['institutions_normalized']} unique institutions")
-    
-    def _extract_institution_name(self, affiliation: str) -> str:
-        """Extract institution name from affiliation string."""
-        if not affiliation:
-            return ""
-        
-        # Simple heuristic: take first significant part before comma
-        parts = affiliation.split(',')
-        if parts:
-            # Look for university, institute, etc.
-            for part in parts:
-                part = part.strip()
-                if any(keyword in part.lower() for keyword in ['university', 'institute', 'college', 'school']):
-                    return part
-            
-            # Fallback to first substantial part
-            if len(parts[0].strip()) > 3:
-                return parts[0].strip()
-        
-        return affiliation.strip()
-    
-    def _extract_country(self, affiliation: str) -> str:
-        """Extract country from affiliation string."""
-        if not affiliation:
-            return ""
-        
-        # Simple heuristic: last part is often country
-        parts = [p.strip() for p in affiliation.split(',')]
-        if len(parts) > 1:
-            potential_country = parts[-1]
-            # Basic country validation (length and common patterns)
-            if 2 <= len(potential_country) <= 20 and potential_country.isalpha():
-                return potential_country
-        
-        return ""
+    def _validation_report_path(self) -> Path:
+        """Timestamped path of the validation report."""
+        report_filename = f"database_validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        if self.multi_csv_mode:
+            return self.csv_path / "output" / report_filename
+        if self.csv_path.parent.name == "raw_scopus":
+            return self.csv_path.parent.parent / "output" / report_filename
+        return self.csv_path.parent / report_filename
     
-    def _normalize_keywords(self, data: List[Dict]):
-        """Extract and normalize keywords from both author and index keywords."""
-        print("Normalizing keywords...")
-        cursor = self.conn.cursor()
+    def _save_validation_report(self, report_path: Path, validation_report: Dict, population_tracking: Dict):
+        """Write the validation report for a snapshot of the validation results."""
+        report_content = self._generate_validation_report(validation_report, population_tracking)
         
-        # Process both author and index keywords
-        keyword_columns = [
-            ('Author Keywords', 'author'),
-            ('Index Keywords', 'index')
-        ]
-        
-        for col_name, keyword_type in keyword_columns:
-            for idx, row in enumerate(data):
-                keywords_raw = row.get(col_name, '')
-                
-                if keywords_raw:
-                    keywords = [k.strip() for k in str(keywords_raw).split(';') if k.strip()]
-                    
-                    for keyword in keywords:
-                        # Normalize keyword text
-                        normalized = self._normalize_keyword_text(keyword)
-                        
-                        if normalized and normalized not in self.keywords_registry:
-                            cursor.execute("""
-                                INSERT INTO keywords_master 
-                                (keyword_id, keyword_text, keyword_category, normalized_text)
-                                VALUES (?, ?, ?, ?)
-                            """, (
-                                self.keyword_counter, 
-                                keyword, 
-                                keyword_type,
-                                normalized
-                            ))
-                            
-                            self.keywords_registry[normalized] = self.keyword_counter
-                            self.keyword_counter += 1
-                            self.stats["keywords_normalized"] += 1
+        # Ensure output directory exists
+        report_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.conn.commit()
-        print(f"Normalized {self.stats['keywords_normalized']} unique keywords")
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(report_content)
     
-    def _normalize_keyword_text(self, keyword: str) -> str:
-        """Normalize keyword text for better matching."""
-        if not keyword:
-            return ""
-        
-        # Convert to lowercase, remove extra spaces
-        normalized = ' '.join(keyword.lower().split())
-        
-        # Remove common punctuation
-        import string
-        normalized = normalized.translate(str.maketrans('', '', string.punctuation))
+    def _wait_for_reports(self):
+        """
+        Wait for the background reports and print the latency of each.
         
-        return normalized
+        Raises:
+            ReportError: If a report could not be written (after every report finished)
+        """
+        start = time.perf_counter()
+        print(f"\n📝 REPORT GENERATION ({'background' if self.report_worker.background else 'inline'}):")
+        try:
+            self.report_worker.wait()
+        finally:
+            waited = time.perf_counter() - start
+            self.report_timings = dict(self.report_worker.timings)
+            if "quality_reports" in self.report_timings:
+                self.data_filter.timings["reports"] = self.report_timings["quality_reports"]["seconds"]
+            for name, timing in self.report_timings.items():
+                failed = " (failed)" if name in self.report_worker.errors else ""
+                print(f"   {name}: {timing['latency']:.2f}s latency "
+                      f"({timing['seconds']:.2f}s writing, {timing['queued']:.2f}s queued){failed}")
+            print(f"   Build waited {waited:.2f}s for reports at exit")
     
-    def _build_paper_author_relationships(self, data: List[Dict]):
-        """Build paper-author relationships with position information."""
-        print("Building paper-author relationships...")
-        cursor = self.conn.cursor()
-        
-        for idx, row in enumerate(data):
-            paper_id = idx + 1
-            authors_raw = self._get_column_value(row, 'Authors')
-            author_ids_raw = self._get_column_value(row, 'Author(s) ID')
-            
-            if authors_raw and author_ids_raw:
-                author_ids = [a.strip() for a in str(author_ids_raw).split(';') if a.strip()]
-                
-                for position, scopus_id in enumerate(author_ids, 1):
-                    if scopus_id in self.authors_registry:
-                        author_id = self.authors_registry[scopus_id]
-                        
-                        # Determine author role
-                        first_author = (position == 1)
-                        last_author = (position == len(author_ids))
-                        
-                        cursor.execute("""
-                            INSERT INTO paper_authors 
-                            (paper_id, author_id, position, first_author, last_author)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, (paper_id, author_id, position, first_author, last_author))
-        
-        self.conn.commit()
-        print("Paper-author relationships built")
+    @contextmanager
+    def _phase(self, name: str):
+        """Time a build phase into ``self.phase_timings`` (seconds)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_timings[name] = time.perf_counter() - start
     
-    def _build_paper_keyword_relationships(self, data: List[Dict]):
-        """Build paper-keyword relationships."""
-        print("Building paper-keyword relationships...")
-        cursor = self.conn.cursor()
-        
-        keyword_columns = [
-            ('Author Keywords', 'author'),
-            ('Index Keywords', 'index')
-        ]
+    def _iter_csv_records(self, csv_files: List, strict: bool = False) -> Iterator[Tuple[Dict[str, str], str]]:
+        """
+        Stream records from CSV files, in file order.
         
-        for col_name, keyword_type in keyword_columns:
-            for idx, row in enumerate(data):
-                paper_id = idx + 1
-                keywords_raw = row.get(col_name, '')
-                
-                if keywords_raw:
-                    keywords = [k.strip() for k in str(keywords_raw).split(';') if k.strip()]
-                    
-                    for position, keyword in enumerate(keywords, 1):
-                        normalized = self._normalize_keyword_text(keyword)
-                        
-                        if normalized in self.keywords_registry:
-                            keyword_id = self.keywords_registry[normalized]
-                            
-                            cursor.execute("""
-                                INSERT OR IGNORE INTO paper_keywords 
-                                (paper_id, keyword_id, keyword_type, position)
-                                VALUES (?, ?, ?, ?)
-                            """, (paper_id, keyword_id, keyword_type, position))
+        With ``performance.parallel_processing`` enabled and several files,
+        files are decoded and parsed concurrently in a process pool
+        (``performance.workers`` processes) and handed back in their original
+        order, so deduplication and source attribution are unchanged.
+        Per-file record counts and load times are kept in ``self.csv_load_stats``.
         
-        self.conn.commit()
-        print("Paper-keyword relationships built")
-    
-    def _build_paper_institution_relationships(self, data: List[Dict]):
-        """Build paper-institution relationships."""
-        print("Building paper-institution relationships...")
-        cursor = self.conn.cursor()
+        A file that cannot be opened or decoded is reported and skipped, and
+        the build continues with the next file. Records are streamed, so
+        those read before a mid-file error have already been passed on and
+        are kept (in both serial and parallel loading). With ``strict`` the
+        error is re-raised instead, as for a single CSV input.
         
-        for idx, row in enumerate(data):
-            paper_id = idx + 1
-            affiliations_raw = row.get('Affiliations', '')
+        Args:
+            csv_files: CSV file paths, read in order
+            strict: Re-raise read errors instead of skipping the file
             
-            if affiliations_raw:
-                affiliations = [a.strip() for a in str(affiliations_raw).split(';') if a.strip()]
-                institution_counts = defaultdict(int)
-                
-                for affiliation in affiliations:
-                    institution_name = self._extract_institution_name(affiliation)
-                    if institution_name in self.institutions_registry:
-                        institution_counts[institution_name] += 1
-                
-                # Insert relationships
-                for institution_name, count in institution_counts.items():
-                    institution_id = self.institutions_registry[institution_name]
-                    primary = (count == max(institution_counts.values()))
-                    
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO paper_institutions 
-                        (paper_id, institution_id, author_count, primary_affiliation)
-                        VALUES (?, ?, ?, ?)
-                    """, (paper_id, institution_id, count, primary))
-        
-        self.conn.commit()
-        print("Paper-institution relationships built")
+        Yields:
+            (record, source_file_name) pairs; records are compact read-only
+            ScopusRecord mappings sharing one schema per file
+        """
+        self.stats["csv_files_processed"] = 0
+        self.stats["records_loaded"] = 0
+        self.csv_load_stats = []
+        
+        perf_config = self.config.get_performance_config()
+        encoding = self.config.get_file_handling_config().get('encoding', 'utf-8-sig')
+        workers = perf_config.get('workers', 0) or os.cpu_count() or 1
+        
+        if perf_config.get('parallel_processing', False) and len(csv_files) > 1 and workers > 1:
+            print(f"   ⚡ Loading {len(csv_files)} CSV files with {workers} worker processes")
+            for result in iter_csv_files_parallel(csv_files, workers, encoding):
+                file_name = Path(result.path).name
+                print(f"   📄 Loading: {file_name}")
+                for row in result.rows:
+                    yield row, file_name
+                self._record_csv_load(file_name, len(result.rows), result.seconds, result.error)
+                if strict and result.error:
+                    raise RuntimeError(f"Error loading {file_name}: {result.error}")
+            return
+        
+        for csv_file in csv_files:
+            csv_file = Path(csv_file)
+            print(f"   📄 Loading: {csv_file.name}")
+            file_count = 0
+            read_seconds = 0.0
+            try:
+                with open(csv_file, 'r', encoding=encoding) as file:
+                    reader = read_records(file)
+                    while True:
+                        # Time only decoding/parsing, not the downstream consumer
+                        start = time.perf_counter()
+                        row = next(reader, None)
+                        read_seconds += time.perf_counter() - start
+                        if row is None:
+                            break
+                        file_count += 1
+                        yield row, csv_file.name
+            except Exception as e:
+                self._record_csv_load(csv_file.name, file_count, read_seconds, str(e))
+                if strict:
+                    raise
+                continue
+            self._record_csv_load(csv_file.name, file_count, read_seconds)
     
-    def _parse_funding_data(self, data: List[Dict]):
-        """Parse and import funding information."""
-        print("Parsing funding data...")
-        cursor = self.conn.cursor()
-        
-        for idx, row in enumerate(data):
-            paper_id = idx + 1
-            funding_text = self._get_column_value(row, 'Funding Details') or self._get_column_value(row, 'Funding Texts')
-            
-            if funding_text:
-                # Parse funding agencies and grant numbers
-                funding_entries = [f.strip() for f in str(funding_text).split(';') if f.strip()]
-                
-                for funding_entry in funding_entries:
-                    # Extract agency name and grant numbers
-                    agency_name = funding_entry
-                    grant_numbers = []
-                    
-                    # Look for grant numbers in parentheses or after specific patterns
-                    import re
-                    grant_matches = re.findall(r'[A-Z]{2,}\s*[-\d]+|Grant\s*[#:]?\s*[\w-]+|\d{4,}', funding_entry)
-                    if grant_matches:
-                        grant_numbers = grant_matches
-                        # Remove grant numbers from agency name
-                        for grant in grant_matches:
-                            agency_name = agency_name.replace(grant, '').strip()
-                    
-                    # Clean agency name
-                    agency_name = re.sub(r'[,;]+$', '', agency_name).strip()
-                    
-                    if agency_name and len(agency_name) > 3:  # Filter out very short entries
-                        cursor.execute("""
-                            INSERT INTO paper_funding 
-                            (paper_id, agency_name, grant_numbers)
-                            VALUES (?, ?, ?)
-                        """, (paper_id, agency_name, json.dumps(grant_numbers)))
-        
-        self.conn.commit()
-        print("Funding data parsed and imported")
+    def _record_csv_load(self, file_name: str, records: int, seconds: float, error: str = None):
+        """Print and record the load result for one CSV file."""
+        if error:
+            print(f"      ❌ Error loading {file_name}: {error}")
+            if records:
+                print(f"      ⚠️ {records:,} records read before the error were kept")
+        else:
+            print(f"      Records loaded: {records:,} ({seconds:.2f}s)")
+        
+        self.csv_load_stats.append({
+            "file": file_name,
+            "records": records,
+            "seconds": seconds,
+            "error": error,
+        })
+        self.stats["csv_files_processed"] += 1
+        self.stats["records_loaded"] += records
     
-    def _parse_references_data(self, data: List[Dict]):
-        """Parse and import citation references with structured data extraction."""
-        print("Parsing references data with enhanced structure...")
-        cursor = self.conn.cursor()
+    def _ingest_records(self, data: Iterable[Dict]):
+        """
+        Parse each record exactly once and write its rows to every table.
         
+        Entities, complex fields and relationships are extracted together per
+        record and handed to a BulkWriter, which batches rows per table with
+        executemany (``performance.batch_size`` rows per batch) and groups
+        batches into a few large transactions. Memory stays bounded for any
+        input size.
         
-        for idx, row in enumerate(data):
-            paper_id = idx + 1
-            references_text = row.get('References', '')
-            
-            if references_text:
-                # Split references (typically separated by semicolons)
-                references = [r.strip() for r in str(references_text).split(';') if r.strip()]
-                
-                for ref_idx, reference in enumerate(references, 1):
-                    # Parse structured reference data
-                    parsed_ref = self._parse_single_reference(reference)
-                    
-                    cursor.execute("""
-                        INSERT INTO paper_citations 
-                        (citing_paper_id, reference_text, reference_year, reference_authors,
-                         reference_title, reference_journal, reference_volume, 
-                         reference_issue, reference_pages, position)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        paper_id, 
-                        reference[:500],  # Limit full text length
-                        parsed_ref['year'],
-                        parsed_ref['authors'],
-                        parsed_ref['title'],
-                        parsed_ref['journal'],
-                        parsed_ref['volume'],
-                        parsed_ref['issue'],
-                        parsed_ref['pages'],
-                        ref_idx
-                    ))
+        With ``performance.reference_workers`` set, reference strings are
+        parsed by a pool of worker processes (see ReferencePipeline) and the
+        citation rows are written in order by the same BulkWriter.
         
-        self.conn.commit()
-        print("References data parsed and imported with structured extraction")
-    
-    def _parse_single_reference(self, reference: str) -> Dict:
-        """
-        Parse individual reference string into structured components.
+        With ``performance.parallel_processing`` enabled, records are instead
+        split into shards of ``performance.shard_size`` records that worker
+        processes load in parallel; the shards are merged in input order,
+        giving the same database contents as the serial build.
         
-        Handles multiple reference formats:
-        - Journal articles: "Authors, Title, Journal, Volume, Issue, pp. Pages, (Year)"
-        - Books: "Authors, Title, (Year)" or "Authors, Title, Publisher, (Year)"
-        - Standards: "Standard Name, Standard Number, (Year)"
-        - Web documents: "Title [WWW Document], (Year)"
+        Args:
+            data: Filtered CSV records (list or stream); paper_id is the
+                1-based record position
         """
-        import re
-        
-        result = {
-            'authors': None,
-            'title': None,
-            'journal': None,
-            'volume': None,
-            'issue': None,
-            'pages': None,
-            'year': None
-        }
+        perf_config = self.config.get_performance_config()
+        batch_size = perf_config.get('batch_size', 1000)
         
-        if not reference or len(reference.strip()) < 3:
-            return result
-        
-        # Handle very short references (data quality issues)
-        if len(reference.strip()) < 10:
-            # Try to extract year if it's just a year
-            if re.match(r'^\d{4}$', reference.strip()):
-                result['year'] = int(reference.strip())
-            # For very short text, put it in title
-            elif not reference.strip().isdigit():
-                result['title'] = reference.strip()
-            return result
-        
-        # Handle truncated references starting with comma
-        if reference.strip().startswith(','):
-            reference = reference.strip()[1:].strip()
-        
-        # Extract year first (usually in parentheses at the end)
-        year_match = re.search(r'\((\d{4})\)(?:\s*$)', reference)
-        if year_match:
-            result['year'] = int(year_match.group(1))
-            # Remove year from reference for further parsing
-            reference = reference[:year_match.start()].strip().rstrip(',').strip()
-        else:
-            # Try to find year without parentheses
-            year_match = re.search(r'\b(19|20)\d{2}\b', reference)
-            if year_match:
-                result['year'] = int(year_match.group())
-        
-        # Handle web documents
-        if '[WWW Document]' in reference:
-            # Remove [WWW Document] and treat title as everything before it
-            title_part = reference.replace('[WWW Document]', '').strip().rstrip(',').strip()
-            result['title'] = title_part
-            result['journal'] = 'Web Document'
-            return result
-        
-        # Handle references without commas (books, standards, incomplete)
-        if ',' not in reference:
-            # If it looks like a standard title or incomplete reference
-            if any(word in reference.lower() for word in ['standard', 'specification', 'guideline', 'principles', 'terminology']):
-                result['title'] = reference
-                result['journal'] = 'Standard/Document'
-            elif len(reference.split()) >= 3:  # Reasonable length for a title
-                result['title'] = reference
-            return result
-        
-        # Split by commas to get components
-        parts = [part.strip() for part in reference.split(',') if part.strip()]
-        
-        if len(parts) < 2:
-            # Single part, treat as title
-            result['title'] = reference
-            return result
-        
-        # Detect if this is a standards document
-        if any(keyword in ' '.join(parts).lower() for keyword in 
-               ['iso ', 'astm ', 'standard', 'specification', 'guideline']):
-            # Standards format: "Standard Name, Number, (Year)"
-            result['title'] = ', '.join(parts[:-1]) if len(parts) > 1 else parts[0]
-            result['journal'] = 'Standard'
-            if len(parts) >= 2 and parts[-1].isdigit():
-                result['volume'] = parts[-1]  # Standard number
-            return result
-        
-        # Known journal abbreviations and patterns (common in academic references)
-        journal_patterns = [
-            r'\bJ\b',  # Journal abbreviations like "J Med"
-            r'\bProc\b',  # Proceedings
-            r'\bNature\b', r'\bScience\b',  # Major journals
-            r'\bIEEE\b', r'\bACM\b',  # Tech journals
-            r'\bAnn\b', r'\bArch\b',  # Annals, Archives
-            r'\bBr\b.*\bJ\b',  # British Journal
-            r'\bAm\b.*\bJ\b',  # American Journal
-            r'\bInt\b.*\bJ\b',  # International Journal
-            r'\bEur\b.*\bJ\b',  # European Journal
-            r'\bSci\b.*\bRep\b',  # Scientific Reports
-            r'Surgery|Medicine|Engineering|Robotics|Manufacturing',
-            r'Transaction|Review|Letter|HNO|BMC'
-        ]
+        if perf_config.get('parallel_processing', False):
+            self._ingest_records_sharded(data, perf_config)
+            return
         
-        # Find journal by looking for known patterns
-        journal_idx = None
-        for i in range(1, len(parts)):
-            part = parts[i]
-            
-            # Skip if it's clearly numeric data or pages
-            if parts[i].isdigit() or re.match(r'^pp\.|^\d+-\d+$', part):
-                continue
-                
-            # Check for journal patterns
-            for pattern in journal_patterns:
-                if re.search(pattern, part, re.IGNORECASE):
-                    journal_idx = i
-                    break
-            
-            if journal_idx is not None:
-                break
-        
-        # If no pattern match, use position and content-based heuristic
-        if journal_idx is None:
-            # Journal is usually a short abbreviation or contains specific words after position 1
-            for i in range(2, min(len(parts), 5)):  # Check positions 2-4
-                part = parts[i].strip()
-                if (len(part) > 1 and 
-                    not part.isdigit() and 
-                    not re.match(r'^pp\.|^\d+$|^\d+-\d+$', part)):
-                    
-                    # Prefer shorter parts (journal abbreviations) or those with journal-like words
-                    if (len(part) <= 15 or  # Short abbreviations
-                        len(part.split()) >= 2 or  # Multi-word journal names
-                        any(word in part.lower() for word in ['journal', 'proc', 'lett', 'rev'])):
-                        journal_idx = i
-                        break
-        
-        # Parse based on identified journal position
-        if journal_idx is not None and journal_idx >= 2:
-            # Standard format: Author(s), Title, Journal, Volume, Issue, Pages
-            result['authors'] = parts[0]
-            result['title'] = ', '.join(parts[1:journal_idx])  # Everything between author and journal
-            result['journal'] = parts[journal_idx]
-            
-            # Process remaining parts for volume, issue, pages
-            remaining_parts = parts[journal_idx + 1:]
-            
-            for part in remaining_parts:
-                part = part.strip()
-                
-                # Pages (contains 'pp.' or number ranges)
-                if 'pp.' in part.lower():
-                    pages = re.sub(r'pp\.\s*', '', part, flags=re.IGNORECASE)
-                    result['pages'] = pages.strip()
-                elif re.match(r'^\d+-\d+$', part) and not result['pages']:
-                    result['pages'] = part
-                
-                # Volume (typically first standalone number)
-                elif part.isdigit() and not result['volume']:
-                    result['volume'] = part
-                
-                # Issue (second standalone number)
-                elif part.isdigit() and result['volume'] and not result['issue']:
-                    result['issue'] = part
+        writer = BulkWriter(self.conn, batch_size=batch_size, statements=self.processor.statements)
         
-        else:
-            # Fallback parsing for books and other formats
-            if len(parts) >= 3:
-                result['authors'] = parts[0]
-                result['title'] = parts[1]
-                
-                # Check if third part looks like a journal or publisher
-                third_part = parts[2]
-                if (third_part.isdigit() or 
-                    len(third_part) < 3 or
-                    any(word in third_part.lower() for word in ['press', 'publisher', 'books', 'edition'])):
-                    # Likely a book with volume/edition or publisher
-                    result['journal'] = 'Book/Monograph'
-                    if third_part.isdigit():
-                        result['volume'] = third_part
-                else:
-                    result['journal'] = third_part
-                
-                # Look for numeric parts in remaining
-                for part in parts[3:]:
-                    if part.isdigit() and not result['volume']:
-                        result['volume'] = part
-                    elif part.isdigit() and result['volume'] and not result['issue']:
-                        result['issue'] = part
-                    elif 'pp.' in part.lower() or re.match(r'^\d+-\d+$', part):
-                        pages = re.sub(r'pp\.\s*', '', part, flags=re.IGNORECASE)
-                        result['pages'] = pages.strip()
-            
-            elif len(parts) == 2:
-                # Book format: Author, Title
-                result['authors'] = parts[0]
-                result['title'] = parts[1]
-                result['journal'] = 'Book/Monograph'
-            
-            else:
-                # Single substantial part
-                if len(parts[0]) > 10:
-                    result['title'] = parts[0]
-                else:
-                    result['authors'] = parts[0]
+        reference_workers = perf_config.get('reference_workers', 0)
+        pipeline = None
+        if reference_workers:
+            pipeline = ReferencePipeline(writer, self.processor.emit_citations, workers=reference_workers,
+                                         chunk_size=perf_config.get('reference_chunk_size', 5000))
+            self.processor.reference_pipeline = pipeline
         
-        # Clean up empty strings and normalize whitespace
-        for key in result:
-            if result[key] and isinstance(result[key], str):
-                result[key] = ' '.join(result[key].split())  # Normalize whitespace
-                if result[key] == '':
-                    result[key] = None
+        try:
+            for idx, row in enumerate(data):
+                self.processor.process_record(idx + 1, row, writer)
+            if pipeline:
+                pipeline.close()
+        finally:
+            if pipeline:
+                pipeline.shutdown()
+                self.processor.reference_pipeline = None
+        
+        writer.close()
+        self.bulk_writer = writer
+        self.stats.update(self.processor.stats)
         
-        return result
+        print(f"Imported {self.stats['papers_processed']} papers")
+        print(f"Normalized {self.stats['authors_normalized']} unique authors")
+        print(f"Normalized {self.stats['institutions_normalized']} unique institutions")
+        print(f"Normalized {self.stats['keywords_normalized']} unique keywords")
+        print("Funding, references, chemicals, trade names, correspondence and open access data imported")
+        print("Paper-author, paper-keyword and paper-institution relationships built")
+        if pipeline:
+            print(f"⚡ References parsed in {pipeline.stats['chunks']:,} chunks "
+                  f"across {pipeline.workers} workers")
+        writer.print_summary()
     
-    def _parse_chemicals_data(self, data: List[Dict]):
-        """Parse chemical substances and CAS numbers."""
-        print("Parsing chemicals data...")
-        cursor = self.conn.cursor()
-        
-        # Create chemicals table if needed
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS paper_chemicals (
-                paper_id INTEGER,
-                chemical_name TEXT,
-                cas_number TEXT,
-                position INTEGER,
-                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
-            )
-        """)
-        
-        for idx, row in enumerate(data):
-            paper_id = idx + 1
-            chemicals_text = self._get_column_value(row, 'Chemicals/CAS', ['Chemical'])
-            
-            if chemicals_text:
-                chemicals = [c.strip() for c in str(chemicals_text).split(';') if c.strip()]
-                
-                for chem_idx, chemical in enumerate(chemicals, 1):
-                    # Extract CAS number if present
-                    cas_number = None
-                    chemical_name = chemical
-                    
-                    import re
-                    cas_match = re.search(r'\b\d{2,7}-\d{2}-\d\b', chemical)
-                    if cas_match:
-                        cas_number = cas_match.group()
-                        chemical_name = chemical.replace(cas_number, '').strip()
-                    
-                    if chemical_name:
-                        cursor.execute("""
-                            INSERT INTO paper_chemicals 
-                            (paper_id, chemical_name, cas_number, position)
-                            VALUES (?, ?, ?, ?)
-                        """, (paper_id, chemical_name, cas_number, chem_idx))
+    def _ingest_records_sharded(self, data: Iterable[Dict], perf_config: Dict):
+        """
+        Load records through parallel shard workers and merge them in order.
         
+        Args:
+            data: Filtered CSV records (list or stream)
+            perf_config: Performance configuration section
+        """
         self.conn.commit()
-        print("Chemicals data parsed and imported")
-    
-    def _parse_trade_names_data(self, data: List[Dict]):
-        """Parse trade names and manufacturer information."""
-        print("Parsing trade names data...")
-        cursor = self.conn.cursor()
-        
-        # Create trade names table if needed
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS paper_trade_names (
-                paper_id INTEGER,
-                trade_name TEXT,
-                manufacturer TEXT,
-                position INTEGER,
-                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
-            )
-        """)
-        
-        for idx, row in enumerate(data):
-            paper_id = idx + 1
-            trade_names_text = self._get_column_value(row, 'Tradenames', ['Trade Names'])
-            
-            if trade_names_text:
-                trade_names = [t.strip() for t in str(trade_names_text).split(';') if t.strip()]
-                
-                for trade_idx, trade_name in enumerate(trade_names, 1):
-                    # Try to extract manufacturer (often in parentheses)
-                    manufacturer = None
-                    import re
-                    mfg_match = re.search(r'\(([^)]+)\)', trade_name)
-                    if mfg_match:
-                        manufacturer = mfg_match.group(1)
-                        trade_name = re.sub(r'\([^)]+\)', '', trade_name).strip()
-                    
-                    if trade_name:
-                        cursor.execute("""
-                            INSERT INTO paper_trade_names 
-                            (paper_id, trade_name, manufacturer, position)
-                            VALUES (?, ?, ?, ?)
-                        """, (paper_id, trade_name, manufacturer, trade_idx))
+        shard_dir = self.db_path.parent / f".{self.db_path.stem}_shards"
+        
+        start = time.perf_counter()
+        self.shard_report = sharded_ingest(
+            self.conn, self.processor, data, shard_dir,
+            workers=perf_config.get('workers', 0),
+            shard_size=perf_config.get('shard_size', 2000),
+            batch_size=perf_config.get('batch_size', 1000),
+        )
+        elapsed = time.perf_counter() - start
+        self.bulk_writer = None
+        self.stats.update(self.processor.stats)
         
-        self.conn.commit()
-        print("Trade names data parsed and imported")
+        print(f"Imported {self.stats['papers_processed']} papers")
+        print(f"Normalized {self.stats['authors_normalized']} unique authors")
+        print(f"Normalized {self.stats['institutions_normalized']} unique institutions")
+        print(f"Normalized {self.stats['keywords_normalized']} unique keywords")
+        print(f"⚡ Sharded load: {self.shard_report['shards']} shards across "
+              f"{self.shard_report['workers']} workers in {elapsed:.2f}s")
     
-    def _parse_correspondence_data(self, data: List[Dict]):
-        """Parse correspondence author information."""
-        print("Parsing correspondence data...")
-        cursor = self.conn.cursor()
-        
-        # Create correspondence table if needed
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS paper_correspondence (
-                paper_id INTEGER,
-                author_name TEXT,
-                email TEXT,
-                institution TEXT,
-                PRIMARY KEY (paper_id),
-                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
-            )
+    def _count_cited_works(self):
+        """Store per-work citation counts on cited_works in one grouped pass."""
+        start = time.perf_counter()
+        # Counts go through a keyed temp table so the update is a scalar subquery
+        # lookup per work (UPDATE ... FROM needs SQLite 3.33+)
+        self.conn.execute("DROP TABLE IF EXISTS temp.cited_work_counts")
+        self.conn.execute("""
+            CREATE TEMP TABLE cited_work_counts (cited_work_id INTEGER PRIMARY KEY, citations INTEGER)
         """)
-        
-        for idx, row in enumerate(data):
-            paper_id = idx + 1
-            correspondence = self._get_column_value(row, 'Correspondence Address', ['Corresponding Author'])
-            
-            if correspondence:
-                # Extract email if present
-                import re
-                email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', correspondence)
-                email = email_match.group() if email_match else None
-                
-                # Extract author name (often before the semicolon or comma)
-                author_name = correspondence.split(';')[0].split(',')[0].strip()
-                
-                # Extract institution (often after author name)
-                institution = correspondence.replace(author_name, '').replace(email or '', '').strip()
-                institution = re.sub(r'^[,;]\s*', '', institution).strip()
-                
-                if author_name:
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO paper_correspondence 
-                        (paper_id, author_name, email, institution)
-                        VALUES (?, ?, ?, ?)
-                    """, (paper_id, author_name, email, institution))
-        
-        self.conn.commit()
-        print("Correspondence data parsed and imported")
-    
-    def _parse_open_access_data(self, data: List[Dict]):
-        """Parse open access and publication information."""
-        print("Parsing open access data...")
-        cursor = self.conn.cursor()
-        
-        # Create open access table if needed
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS paper_open_access (
-                paper_id INTEGER,
-                access_type TEXT,
-                publisher TEXT,
-                open_access BOOLEAN DEFAULT FALSE,
-                PRIMARY KEY (paper_id),
-                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
-            )
+        self.conn.execute("""
+            INSERT INTO cited_work_counts
+            SELECT cited_work_id, COUNT(*) FROM paper_citations
+            WHERE cited_work_id IS NOT NULL GROUP BY cited_work_id
         """)
-        
-        for idx, row in enumerate(data):
-            paper_id = idx + 1
-            access_type = self._get_column_value(row, 'Access Type', ['Open Access'])
-            publisher = self._get_column_value(row, 'Publisher')
-            
-            # Determine if it's open access
-            open_access = False
-            if access_type:
-                open_access_keywords = ['open', 'free', 'public', 'gold', 'green']
-                open_access = any(keyword in str(access_type).lower() for keyword in open_access_keywords)
-            
-            if access_type or publisher:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO paper_open_access 
-                    (paper_id, access_type, publisher, open_access)
-                    VALUES (?, ?, ?, ?)
-                """, (paper_id, access_type, publisher, open_access))
-        
+        self.conn.execute("""
+            UPDATE cited_works SET citation_count = (
+                SELECT citations FROM cited_work_counts c WHERE c.cited_work_id = cited_works.cited_work_id)
+            WHERE cited_work_id IN (SELECT cited_work_id FROM cited_work_counts)
+        """)
+        self.conn.execute("DROP TABLE temp.cited_work_counts")
         self.conn.commit()
-        print("Open access data parsed and imported")
-    
+        works = self.conn.execute("SELECT COUNT(*) FROM cited_works").fetchone()[0]
+        print(f"📚 {works:,} distinct cited works counted in {time.perf_counter() - start:.2f}s")
     
+    def _resolve_citations(self):
+        """Link references to the papers of this database they cite (cited_paper_id)."""
+        report = resolve_citations(self.conn, cited_works=self.cited_works)
+        self.stats["citations_resolved"] = report["resolved"]
+        print(f"🔗 {report['resolved']:,} of {report['candidates']:,} "
+              f"{'cited works' if self.cited_works else 'references'} resolved to papers "
+              f"in this database in {report['seconds']:.2f}s")
     
+    def _build_analytics_tables(self):
+        """Fill the co-author, keyword co-occurrence and trend tables in one pass."""
+        memory_limit_mb = self.config.get_performance_config().get('memory_limit_mb', 2048)
+        max_pair_entities = self.config.get_database_config().get('max_pair_entities', 0)
+        report = build_analytics_tables(self.conn, self.analytics_tables, memory_limit_mb=memory_limit_mb,
+                                        max_pair_entities=max_pair_entities)
+        print(f"📈 Analytics tables built from {report['papers']:,} papers in {report['seconds']:.2f}s")
+        for table, rows in report["rows"].items():
+            spills = report["spills"][table]
+            note = f" ({spills} spills to disk)" if spills else ""
+            print(f"   {table}: {rows:,} rows{note}")
+            skipped = report["skipped"].get(table)
+            if skipped:
+                print(f"   ⚠️ {skipped:,} papers with more than {max_pair_entities} entities added no {table} pairs")
     
+    def _compute_entity_metrics(self):
+        """Store paper counts, citation sums and h-index on the master tables."""
+        report = compute_entity_metrics(self.conn)
+        print(f"🏅 Metrics computed for {report['authors']:,} authors and "
+              f"{report['institutions']:,} institutions in {report['seconds']:.2f}s")
     
+    def _build_search_index(self):
+        """Fill the full-text index over titles, abstracts and keywords."""
+        report = rebuild_search_index(self.conn)
+        print(f"🔎 Full-text index built for {report['papers']:,} papers in {report['seconds']:.2f}s")
     
+    def _finalize_database(self):
+        """Run the post-load finalize step and report foreign key violations."""
+        vacuum = self.config.get_database_config().get('vacuum_on_finalize', False)
+        print(f"\n🧹 Finalizing database (foreign_key_check, ANALYZE, optimize{', VACUUM' if vacuum else ''})...")
+        
+        self.finalize_report = finalize_database(self.conn, vacuum=vacuum)
+        
+        violations = self.finalize_report["foreign_key_violations"]
+        if violations:
+            for relation, count in violations.items():
+                message = f"Foreign key violations in {relation}: {count:,}"
+                print(f"   ⚠️ {message}")
+                self.population_tracking["validation_issues"].append(message)
+        else:
+            print("   ✅ Foreign key check passed")
+        
+        for step, seconds in self.finalize_report["timings"].items():
+            print(f"   {step}: {seconds:.2f}s")
+        print(f"   Journal mode for analysts: {self.finalize_report['journal_mode']}")
     
+    def _report_expected_counts(self):
+        """Record and print expected table population counts from the ingestion pass."""
+        print("📊 Calculating expected table population counts...")
+
+        self.population_tracking["expected"].update(self.processor.expected_table_counts())
+
+        print(f"   📋 Expected papers: {self.population_tracking['expected']['papers']:,}")
+        print(f"   👥 Expected unique authors: {self.population_tracking['expected']['authors_master']:,}")
+        print(f"   🏢 Expected unique institutions: {self.population_tracking['expected']['institutions_master']:,}")
+        print(f"   🔖 Expected unique keywords: {self.population_tracking['expected']['keywords_master']:,}")
+        print(f"   💰 Expected funding entries: {self.population_tracking['expected']['paper_funding']:,}")
+        print(f"   📊 Expected citations: {self.population_tracking['expected']['paper_citations']:,}")
+
     def _print_statistics(self):
         """Print database statistics."""
         print("\n" + "="*60)
@@ -1781,6 +1549,8 @@ class OptimalScopusDatabase:
             print(f"CSV files processed: {self.stats['csv_files_processed']:,}")
             if self.stats.get("duplicates_removed", 0) > 0:
                 print(f"Duplicate records removed: {self.stats['duplicates_removed']:,}")
+            if self.stats.get("near_duplicates_removed", 0) > 0:
+                print(f"Near-duplicate records removed: {self.stats['near_duplicates_removed']:,}")
             print(f"Total unique records: {total_input:,}")
         
         if self.stats.get("papers_filtered_out", 0) > 0:
@@ -1795,13 +1565,19 @@ class OptimalScopusDatabase:
         # Core data tables
         tables = [
             ('papers', 'Papers'),
+            ('paper_text', 'Paper Text Rows'),
             ('authors_master', 'Unique Authors'),
             ('institutions_master', 'Unique Institutions'),
             ('keywords_master', 'Unique Keywords'),
             ('paper_authors', 'Paper-Author Relationships'),
             ('paper_keywords', 'Paper-Keyword Relationships'),
             ('paper_institutions', 'Paper-Institution Relationships'),
-            ('paper_citations', 'Citation References')
+            ('paper_citations', 'Citation References'),
+            ('cited_works', 'Distinct Cited Works'),
+            ('citation_graph', 'In-Corpus Citations'),
+            ('author_collaborations', 'Co-Author Pairs'),
+            ('keyword_cooccurrence', 'Keyword Co-occurrence Pairs'),
+            ('temporal_trends', 'Entity-Year Trend Rows')
         ]
         
         for table, label in tables:
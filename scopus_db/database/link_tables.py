@@ -0,0 +1,254 @@
+"""
+Compact Link Tables Module
+
+Storage-optimized layout of the paper_authors, paper_keywords and
+paper_institutions relationship tables (database.compact_link_tables).
+Each table is a WITHOUT ROWID table clustered on its composite primary key,
+so a paper's links are stored together in one B-tree instead of a rowid
+table plus a primary-key index. keyword_type is stored as a small integer
+(0 = author, 1 = index) and role flags as 0/1 integers; SQLite stores the
+integers 0 and 1 without payload bytes. One covering index per table serves
+the entity -> papers direction. compact_link_tables converts the tables of
+an existing database in place.
+"""
+
+import re
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+from .paper_text import register_text_functions
+from .search import SEARCH_CONTENT_VIEW
+
+LINK_TABLES = ("paper_authors", "paper_keywords", "paper_institutions")
+
+KEYWORD_TYPE_CODES = {"author": 0, "index": 1}
+
+COMPACT_LINK_DDL = {
+    "paper_authors": """
+        CREATE TABLE paper_authors (
+            paper_id INTEGER,
+            author_id INTEGER,
+            position INTEGER,
+            corresponding_author INTEGER NOT NULL DEFAULT 0, -- 0/1
+            first_author INTEGER NOT NULL DEFAULT 0,
+            last_author INTEGER NOT NULL DEFAULT 0,
+
+            PRIMARY KEY (paper_id, author_id),
+            FOREIGN KEY (paper_id) REFERENCES papers(paper_id),
+            FOREIGN KEY (author_id) REFERENCES authors_master(author_id)
+        ) WITHOUT ROWID
+    """,
+    "paper_keywords": """
+        CREATE TABLE paper_keywords (
+            paper_id INTEGER,
+            keyword_id INTEGER,
+            keyword_type INTEGER CHECK (keyword_type IN (0, 1)), -- 0 = author, 1 = index
+            position INTEGER,
+
+            PRIMARY KEY (paper_id, keyword_id, keyword_type),
+            FOREIGN KEY (paper_id) REFERENCES papers(paper_id),
+            FOREIGN KEY (keyword_id) REFERENCES keywords_master(keyword_id)
+        ) WITHOUT ROWID
+    """,
+    "paper_institutions": """
+        CREATE TABLE paper_institutions (
+            paper_id INTEGER,
+            institution_id INTEGER,
+            author_count INTEGER DEFAULT 1,
+            primary_affiliation INTEGER NOT NULL DEFAULT 0, -- 0/1
+
+            PRIMARY KEY (paper_id, institution_id),
+            FOREIGN KEY (paper_id) REFERENCES papers(paper_id),
+            FOREIGN KEY (institution_id) REFERENCES institutions_master(institution_id)
+        ) WITHOUT ROWID
+    """,
+}
+
+# Text labels for keyword_type, as in the default layout
+PAPER_KEYWORD_DETAILS_VIEW = """
+    CREATE VIEW paper_keyword_details AS
+    SELECT paper_id, keyword_id,
+           CASE keyword_type WHEN 0 THEN 'author' WHEN 1 THEN 'index' END AS keyword_type,
+           position
+    FROM paper_keywords
+"""
+
+# Lookups by paper use the clustered primary keys. A WITHOUT ROWID index also
+# holds the primary key columns, so each index below covers the entity ->
+# papers direction: author/keyword/institution papers and counts, and the
+# first/last-author sums of the metrics stage.
+COMPACT_LINK_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_paper_authors_author ON paper_authors (author_id, first_author, last_author)",
+    "CREATE INDEX IF NOT EXISTS idx_paper_keywords_keyword ON paper_keywords (keyword_id)",
+    "CREATE INDEX IF NOT EXISTS idx_paper_institutions_institution ON paper_institutions (institution_id)",
+]
+
+# Row conversion from the default layout (NULL flags become 0)
+_COPY_COLUMNS = {
+    "paper_authors": ("paper_id, author_id, position, COALESCE(corresponding_author, 0), "
+                      "COALESCE(first_author, 0), COALESCE(last_author, 0)"),
+    "paper_keywords": ("paper_id, keyword_id, "
+                       "CASE keyword_type WHEN 'author' THEN 0 WHEN 'index' THEN 1 END, position"),
+    "paper_institutions": "paper_id, institution_id, author_count, COALESCE(primary_affiliation, 0)",
+}
+
+# Primary key positions in the converted rows: rows are inserted in key order
+_PRIMARY_KEYS = {
+    "paper_authors": "1, 2",
+    "paper_keywords": "1, 2, 3",
+    "paper_institutions": "1, 2",
+}
+
+# Typical relationship queries (analysis scripts, build statistics, metrics);
+# {author} is the layout's literal for author keywords
+WORKLOAD = {
+    "prolific authors": """
+        SELECT am.full_name, COUNT(*) AS papers FROM authors_master am
+        JOIN paper_authors pa ON pa.author_id = am.author_id
+        GROUP BY am.author_id ORDER BY papers DESC LIMIT 20
+    """,
+    "first/last-author counts": """
+        SELECT author_id, SUM(first_author), SUM(last_author) FROM paper_authors GROUP BY author_id
+    """,
+    "frequent keywords": """
+        SELECT km.keyword_text, COUNT(*) AS frequency FROM keywords_master km
+        JOIN paper_keywords pk ON pk.keyword_id = km.keyword_id
+        GROUP BY km.keyword_id ORDER BY frequency DESC LIMIT 20
+    """,
+    "author keywords per year": """
+        SELECT p.year, COUNT(*) FROM paper_keywords pk JOIN papers p ON p.paper_id = pk.paper_id
+        WHERE pk.keyword_type = {author} GROUP BY p.year
+    """,
+    "institution output": """
+        SELECT im.canonical_name, COUNT(*) AS papers FROM institutions_master im
+        JOIN paper_institutions pi ON pi.institution_id = im.institution_id
+        GROUP BY im.institution_id ORDER BY papers DESC LIMIT 20
+    """,
+    "papers of 200 authors": "SELECT paper_id FROM paper_authors WHERE author_id = ?",
+    "papers of 200 keywords": "SELECT paper_id, keyword_type FROM paper_keywords WHERE keyword_id = ?",
+}
+
+LOOKUPS = 200
+
+
+def is_compact(conn: sqlite3.Connection) -> bool:
+    """True when paper_keywords uses the compact layout."""
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'paper_keywords'").fetchone()
+    return bool(row) and "WITHOUT ROWID" in row[0].upper()
+
+
+def compact_link_tables(conn: sqlite3.Connection, vacuum: bool = True) -> Dict:
+    """
+    Convert the relationship tables of an existing database to the compact layout.
+
+    Views reading the link tables are dropped and recreated; the full-text
+    search view is regenerated to read keyword types through
+    paper_keyword_details. Indexes of the old tables are replaced by
+    COMPACT_LINK_INDEXES.
+
+    Args:
+        conn: Connection to a database built with the default layout
+        vacuum: VACUUM afterwards so the freed pages are returned to the file system
+
+    Returns:
+        Dictionary with 'tables' (converted), 'rows' per table and 'seconds'
+    """
+    start = time.perf_counter()
+    if is_compact(conn):
+        return {"tables": [], "rows": {}, "seconds": 0.0}
+
+    # Renaming re-parses every view, so paper_details needs decompress_text
+    register_text_functions(conn)
+    conn.commit()
+
+    pattern = re.compile(r"\b(" + "|".join(LINK_TABLES) + r")\b")
+    views = [(name, sql) for name, sql in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'view'")
+             if pattern.search(sql)]
+
+    conn.execute("PRAGMA foreign_keys = OFF")
+    conn.execute("BEGIN")
+    for name, _ in views:
+        conn.execute(f"DROP VIEW {name}")
+
+    rows = {}
+    for table in LINK_TABLES:
+        # Renamed tables keep their indexes, which are dropped with them
+        conn.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+        conn.execute(COMPACT_LINK_DDL[table])
+        rows[table] = conn.execute(f"""
+            INSERT INTO {table} SELECT {_COPY_COLUMNS[table]}
+            FROM {table}_old ORDER BY {_PRIMARY_KEYS[table]}
+        """).rowcount
+        conn.execute(f"DROP TABLE {table}_old")
+    for index_sql in COMPACT_LINK_INDEXES:
+        conn.execute(index_sql)
+
+    conn.execute(PAPER_KEYWORD_DETAILS_VIEW)
+    for name, sql in views:
+        if name == "paper_search_content":
+            papers = "paper_details" if re.search(r"\bpaper_details\b", sql) else "papers"
+            sql = SEARCH_CONTENT_VIEW.format(papers=papers, keywords="paper_keyword_details")
+        conn.execute(sql)
+    conn.commit()
+
+    conn.execute("ANALYZE")
+    if vacuum:
+        conn.execute("VACUUM")
+        # In WAL mode the vacuumed pages reach the file at checkpoint time
+        conn.execute("PRAGMA main.wal_checkpoint(TRUNCATE)")
+    return {"tables": list(LINK_TABLES), "rows": rows, "seconds": time.perf_counter() - start}
+
+
+def _table_mb(conn: sqlite3.Connection, table: str) -> Optional[float]:
+    """Bytes held by a table and its indexes, in MB (None without dbstat)."""
+    try:
+        row = conn.execute("""
+            SELECT SUM(pgsize) FROM dbstat
+            WHERE name IN (SELECT name FROM sqlite_master WHERE tbl_name = ?)
+        """, (table,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return (row[0] or 0) / (1024 * 1024)
+
+
+def _lookup_ids(conn: sqlite3.Connection, sql: str) -> List[int]:
+    """Most linked entity ids for the point-lookup queries (same ids in either layout)."""
+    column, table = ("author_id", "paper_authors") if "paper_authors" in sql else ("keyword_id", "paper_keywords")
+    return [row[0] for row in conn.execute(
+        f"SELECT {column} FROM {table} GROUP BY {column} ORDER BY COUNT(*) DESC, {column} LIMIT {LOOKUPS}")]
+
+
+def link_table_report(conn: sqlite3.Connection, repeat: int = 3) -> Dict:
+    """
+    Size of the link tables and timings of the relationship workload.
+
+    Args:
+        conn: Connection to a database in either layout
+        repeat: Runs per query (the fastest is reported)
+
+    Returns:
+        Dictionary with 'db_mb', 'table_mb' per link table and 'query_ms' per WORKLOAD query
+    """
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    pages = conn.execute("PRAGMA page_count").fetchone()[0]
+    author = KEYWORD_TYPE_CODES["author"] if is_compact(conn) else "'author'"
+
+    query_ms = {}
+    for name, sql in WORKLOAD.items():
+        sql = sql.format(author=author)
+        params = [(value,) for value in _lookup_ids(conn, sql)] if "?" in sql else [()]
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for values in params:
+                conn.execute(sql, values).fetchall()
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        query_ms[name] = best
+
+    return {
+        "db_mb": page_size * pages / (1024 * 1024),
+        "table_mb": {table: _table_mb(conn, table) for table in LINK_TABLES},
+        "query_ms": query_ms,
+    }
@@ -0,0 +1,173 @@
+"""
+Entity Metrics Module
+
+Precomputed author and institution metrics stored on the master tables:
+paper counts, citation sums (from papers.cited_by), h-index and
+first/last-author counts. The metrics are aggregated with grouped scans of
+each relationship table into a keyed temporary table, and each master
+table is then updated by a single UPDATE with scalar subqueries on that
+key. Passing the paper_ids of appended or changed papers restricts the
+aggregates, and the updates, to the authors and institutions linked to
+them. Only SQL available in every SQLite release Python ships with is used
+(no UPDATE ... FROM, no window functions).
+"""
+
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional
+
+# Metric columns added to each master table (NULL until computed)
+METRIC_COLUMNS = {
+    "authors_master": (
+        ("total_papers", "INTEGER"),
+        ("total_citations", "INTEGER"),
+        ("h_index", "INTEGER"),
+        ("first_author_papers", "INTEGER"),
+        ("last_author_papers", "INTEGER"),
+    ),
+    "institutions_master": (
+        ("paper_count", "INTEGER"),
+        ("total_citations", "INTEGER"),
+    ),
+}
+
+# Author-paper pairs numbered in (author, citations descending) order, so a
+# paper's rank within its author is its position minus the author's first
+# position plus one (no window functions needed)
+_AUTHOR_PAPERS = """
+    CREATE TEMP TABLE metrics_author_papers (
+        position INTEGER PRIMARY KEY,
+        author_id INTEGER,
+        cited_by INTEGER,
+        first_author INTEGER,
+        last_author INTEGER
+    )
+"""
+
+_RANK_AUTHOR_PAPERS = """
+    INSERT INTO metrics_author_papers (author_id, cited_by, first_author, last_author)
+    SELECT pa.author_id, COALESCE(p.cited_by, 0),
+           COALESCE(pa.first_author, 0), COALESCE(pa.last_author, 0)
+    FROM paper_authors pa
+    JOIN papers p ON p.paper_id = pa.paper_id
+    {scope}
+    ORDER BY pa.author_id, COALESCE(p.cited_by, 0) DESC
+"""
+
+_AUTHOR_STARTS = """
+    CREATE TEMP TABLE metrics_author_starts AS
+    SELECT author_id, MIN(position) AS start
+    FROM metrics_author_papers
+    GROUP BY author_id
+"""
+
+# h-index: papers whose citations reach their rank
+_AUTHOR_METRICS = """
+    CREATE TEMP TABLE metrics_authors AS
+    SELECT ap.author_id,
+           COUNT(*) AS papers,
+           SUM(ap.cited_by) AS citations,
+           SUM(ap.cited_by >= ap.position - s.start + 1) AS h_index,
+           SUM(ap.first_author) AS first_author_papers,
+           SUM(ap.last_author) AS last_author_papers
+    FROM metrics_author_papers ap
+    JOIN metrics_author_starts s ON s.author_id = ap.author_id
+    GROUP BY ap.author_id
+"""
+
+_INSTITUTION_METRICS = """
+    CREATE TEMP TABLE metrics_institutions AS
+    SELECT pi.institution_id, COUNT(*) AS papers, SUM(COALESCE(p.cited_by, 0)) AS citations
+    FROM paper_institutions pi
+    JOIN papers p ON p.paper_id = pi.paper_id
+    {scope}
+    GROUP BY pi.institution_id
+"""
+
+# Incremental runs: entities linked to the papers in metrics_papers
+_TOUCHED_ENTITIES = """
+    CREATE TEMP TABLE metrics_touched_{entity}s AS
+    SELECT DISTINCT {entity}_id FROM paper_{entity}s
+    WHERE paper_id IN (SELECT paper_id FROM metrics_papers)
+"""
+_SCOPES = {
+    "author": "WHERE pa.author_id IN (SELECT author_id FROM metrics_touched_authors)",
+    "institution": "WHERE pi.institution_id IN (SELECT institution_id FROM metrics_touched_institutions)",
+}
+
+# (master table, key, aggregate table, master column -> aggregate column)
+_UPDATES = (
+    ("authors_master", "author_id", "metrics_authors", (
+        ("total_papers", "papers"),
+        ("total_citations", "citations"),
+        ("h_index", "h_index"),
+        ("first_author_papers", "first_author_papers"),
+        ("last_author_papers", "last_author_papers"),
+    )),
+    ("institutions_master", "institution_id", "metrics_institutions", (
+        ("paper_count", "papers"),
+        ("total_citations", "citations"),
+    )),
+)
+
+_TEMP_TABLES = ("metrics_papers", "metrics_touched_authors", "metrics_touched_institutions",
+                "metrics_author_papers", "metrics_author_starts", "metrics_authors", "metrics_institutions")
+
+
+def ensure_metric_columns(conn: sqlite3.Connection):
+    """Add missing metric columns to the master tables (also for existing databases)."""
+    for table, columns in METRIC_COLUMNS.items():
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for column, column_type in columns:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+
+def compute_entity_metrics(conn: sqlite3.Connection, paper_ids: Optional[Iterable[int]] = None) -> Dict:
+    """
+    Compute author and institution metrics.
+
+    Args:
+        conn: Connection to a populated database
+        paper_ids: Appended or changed papers; only their authors and
+            institutions are recomputed (all entities when None)
+
+    Returns:
+        Dictionary with 'authors' and 'institutions' (rows updated) and 'seconds'
+    """
+    start = time.perf_counter()
+    ensure_metric_columns(conn)
+
+    for table in _TEMP_TABLES:
+        conn.execute(f"DROP TABLE IF EXISTS temp.{table}")
+    scopes = {"author": "", "institution": ""}
+    if paper_ids is not None:
+        conn.execute("CREATE TEMP TABLE metrics_papers (paper_id INTEGER PRIMARY KEY)")
+        conn.executemany("INSERT OR IGNORE INTO metrics_papers VALUES (?)", ((paper_id,) for paper_id in paper_ids))
+        for entity in scopes:
+            conn.execute(_TOUCHED_ENTITIES.format(entity=entity))
+            conn.execute(f"CREATE UNIQUE INDEX temp.idx_metrics_touched_{entity}s "
+                         f"ON metrics_touched_{entity}s ({entity}_id)")
+        scopes = _SCOPES
+
+    conn.execute(_AUTHOR_PAPERS)
+    conn.execute(_RANK_AUTHOR_PAPERS.format(scope=scopes["author"]))
+    conn.execute(_AUTHOR_STARTS)
+    conn.execute("CREATE UNIQUE INDEX temp.idx_metrics_author_starts ON metrics_author_starts (author_id)")
+    conn.execute(_AUTHOR_METRICS)
+    conn.execute(_INSTITUTION_METRICS.format(scope=scopes["institution"]))
+
+    updated = {}
+    for table, key, aggregate, columns in _UPDATES:
+        conn.execute(f"CREATE UNIQUE INDEX temp.idx_{aggregate} ON {aggregate} ({key})")
+        assignments = ",\n".join(f"{column} = (SELECT {value} FROM {aggregate} m WHERE m.{key} = {table}.{key})"
+                                  for column, value in columns)
+        updated[table] = conn.execute(f"UPDATE {table} SET {assignments} "
+                                      f"WHERE {key} IN (SELECT {key} FROM {aggregate})").rowcount
+
+    for table in _TEMP_TABLES:
+        conn.execute(f"DROP TABLE IF EXISTS temp.{table}")
+    conn.commit()
+
+    return {"authors": updated["authors_master"], "institutions": updated["institutions_master"],
+            "seconds": time.perf_counter() - start}
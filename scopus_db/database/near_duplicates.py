@@ -0,0 +1,189 @@
+"""
+Near-Duplicate Detection Module
+
+Finds records without DOI that describe the same paper, typically the same
+article appearing in overlapping yearly exports with small title
+differences (case, punctuation, a dropped subtitle word). Titles are
+reduced to character shingles and summarized by a one-permutation MinHash
+signature; signatures are split into bands and only records sharing a band
+bucket are compared, so detection stays near-linear in the number of records instead
+of comparing all pairs. Buckets are also keyed on year and first-author
+surname, which confirmed duplicates must share anyway; candidates are then
+confirmed on source title and shingle similarity.
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+from ..parsers.references import surname_key
+
+# MinHash signature length, split into BANDS bands of ROWS_PER_BAND values.
+# Pairs with title similarity 0.8 share a bucket with probability ~0.98,
+# pairs below 0.4 rarely do.
+SIGNATURE_SIZE = 32
+BANDS = 8
+ROWS_PER_BAND = SIGNATURE_SIZE // BANDS
+
+# Character shingle length over the normalized title
+SHINGLE_SIZE = 5
+
+# Minimum Jaccard similarity of title shingles for a confirmed duplicate
+SIMILARITY_THRESHOLD = 0.8
+
+_WORDS = re.compile(r'\w+')
+
+# One-permutation MinHash: each shingle hash is mixed once and lands in one of
+# SIGNATURE_SIZE bins by its top bits; a bin keeps its minimum low bits
+_BIN_BITS = SIGNATURE_SIZE.bit_length() - 1
+_VALUE_BITS = 32 - _BIN_BITS
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_MIX = 0x9E3779B1  # odd multiplier (golden ratio), a bijection on 32-bit values
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Lowercased title words joined by single spaces."""
+    return ' '.join(_WORDS.findall(title.lower())) if title else ''
+
+
+def title_shingles(normalized: str) -> Set[int]:
+    """CRC32 hashes of the SHINGLE_SIZE-byte shingles of a normalized title."""
+    data = normalized.encode('utf-8')
+    if len(data) <= SHINGLE_SIZE:
+        return {zlib.crc32(data)} if data else set()
+    crc32 = zlib.crc32
+    return {crc32(data[i:i + SHINGLE_SIZE]) for i in range(len(data) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(shingles: Set[int]) -> Tuple[int, ...]:
+    """
+    One-permutation MinHash signature of a shingle set.
+
+    Hashing every shingle once instead of once per signature value keeps
+    the cost linear in the title length. Empty bins (short titles) borrow
+    the value of the next non-empty bin, offset by the distance, so two sets
+    still agree on a bin with probability close to their Jaccard similarity.
+    """
+    bins = [None] * SIGNATURE_SIZE
+    for shingle in shingles:
+        mixed = (shingle * _MIX) & 0xFFFFFFFF
+        index, value = mixed >> _VALUE_BITS, mixed & _VALUE_MASK
+        current = bins[index]
+        if current is None or value < current:
+            bins[index] = value
+    if None in bins:
+        filled = [i for i, value in enumerate(bins) if value is not None]
+        for i in range(SIGNATURE_SIZE):
+            if bins[i] is None:
+                source = next((j for j in filled if j > i), filled[0])
+                distance = (source - i) % SIGNATURE_SIZE
+                bins[i] = bins[source] + (distance << _VALUE_BITS)
+    return tuple(bins)
+
+
+def jaccard(first: Set[int], second: Set[int]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class NearDuplicateDetector:
+    """
+    Incremental MinHash/LSH index over records without DOI.
+
+    Records are added in load order; ``add`` returns the earliest confirmed
+    near-duplicate already in the index, so the first occurrence of a paper
+    is the one kept, as with DOI deduplication. Only the normalized title
+    and the verification fields of each record are held in memory.
+    Confirmed pairs are merged into clusters with a union-find.
+    """
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        """
+        Initialize detector.
+
+        Args:
+            threshold: Minimum title shingle similarity of a confirmed duplicate
+        """
+        self.threshold = threshold
+        self.buckets: Dict[Tuple, List[int]] = defaultdict(list)
+        self.entries: List[Tuple[str, str, str, str]] = []  # (normalized title, year, surname, source)
+        self.summaries: List[Dict] = []
+        self._parent: List[int] = []
+        self.stats = {"records": 0, "candidates": 0, "confirmed": 0}
+
+    def add(self, record: Mapping[str, str], summary: Dict) -> Optional[int]:
+        """
+        Index a record and look up its near-duplicates.
+
+        Args:
+            record: Scopus record without DOI
+            summary: Report entry for the record (kept for ``clusters``)
+
+        Returns:
+            Entry number of the earliest confirmed duplicate, or None
+        """
+        normalized = normalize_title(record.get('Title'))
+        entry = (normalized,
+                 (record.get('Year') or '').strip(),
+                 surname_key(record.get('Authors')),
+                 normalize_title(record.get('Source title')))
+        entry_id = len(self.entries)
+        self.entries.append(entry)
+        self.summaries.append(summary)
+        self._parent.append(entry_id)
+        self.stats["records"] += 1
+
+        shingles = title_shingles(normalized)
+        if not shingles:
+            return None
+
+        signature = minhash_signature(shingles)
+        candidates = set()
+        for band in range(BANDS):
+            key = (band, entry[1], entry[2], signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+            bucket = self.buckets[key]
+            candidates.update(bucket)
+            bucket.append(entry_id)
+
+        match = None
+        self.stats["candidates"] += len(candidates)
+        for candidate in sorted(candidates):
+            if self._confirm(entry, shingles, self.entries[candidate]):
+                self._union(candidate, entry_id)
+                if match is None:
+                    match = candidate
+        if match is not None:
+            self.stats["confirmed"] += 1
+        return match
+
+    def _confirm(self, entry: Tuple[str, str, str, str], shingles: Set[int],
+                 other: Tuple[str, str, str, str]) -> bool:
+        """Verify a bucket candidate (same year and first author) on source title and title similarity."""
+        source, other_source = entry[3], other[3]
+        if source and other_source and source != other_source:
+            return False
+        return jaccard(shingles, title_shingles(other[0])) >= self.threshold
+
+    def _find(self, entry_id: int) -> int:
+        """Cluster root of an entry (with path halving)."""
+        parent = self._parent
+        while parent[entry_id] != entry_id:
+            parent[entry_id] = parent[parent[entry_id]]
+            entry_id = parent[entry_id]
+        return entry_id
+
+    def _union(self, first: int, second: int):
+        """Merge two clusters, rooted at the earlier entry."""
+        first, second = self._find(first), self._find(second)
+        if first != second:
+            self._parent[max(first, second)] = min(first, second)
+
+    def clusters(self) -> List[List[Dict]]:
+        """Summaries of every cluster with more than one record, in load order."""
+        groups = defaultdict(list)
+        for entry_id in range(len(self.entries)):
+            groups[self._find(entry_id)].append(self.summaries[entry_id])
+        return [members for _, members in sorted(groups.items()) if len(members) > 1]
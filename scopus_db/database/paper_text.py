@@ -0,0 +1,83 @@
+"""
+Paper Text Module
+
+Optional narrow papers layout. With database.paper_text, the long text
+columns (scopus_link, abstract) are stored in a paper_text side table keyed
+by paper_id, so year, citation and document-type aggregates over papers read
+a table of small rows. With database.compress_paper_text, values that shrink
+under zlib are stored as compressed BLOBs; the decompress_text SQL function
+returns them as text again (and passes plain text through), and the
+paper_details view restores the inline papers column layout.
+"""
+
+import sqlite3
+import zlib
+from typing import List, Optional, Union
+
+# Long text columns moved out of papers, in papers column order
+TEXT_COLUMNS = ("scopus_link", "abstract")
+
+# Shorter values rarely shrink enough to pay for the BLOB header
+MIN_COMPRESS_LENGTH = 64
+
+# zlib level: 6 is within a few percent of 9 at half the CPU time
+COMPRESSION_LEVEL = 6
+
+PAPER_TEXT_DDL = """
+    CREATE TABLE paper_text (
+        paper_id INTEGER PRIMARY KEY,
+        scopus_link TEXT, -- zlib-compressed BLOB when compress_paper_text saves space
+        abstract TEXT,
+
+        FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+    )
+"""
+
+
+def compress_text(value: Optional[str]) -> Union[str, bytes, None]:
+    """Compress a text value when that makes it smaller; otherwise return it unchanged."""
+    if not value or len(value) < MIN_COMPRESS_LENGTH:
+        return value
+    compressed = zlib.compress(value.encode("utf-8"), COMPRESSION_LEVEL)
+    return compressed if len(compressed) < len(value) else value
+
+
+def decompress_text(value: Union[str, bytes, None]) -> Optional[str]:
+    """Inverse of compress_text (registered as the decompress_text SQL function)."""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+def register_text_functions(conn: sqlite3.Connection):
+    """
+    Register decompress_text on a connection.
+
+    Needed to read paper_details (or paper_text through decompress_text) in a
+    database built with compress_paper_text; SQL functions are per connection.
+    """
+    conn.create_function("decompress_text", 1, decompress_text, deterministic=True)
+
+
+def paper_details_view(papers_columns: List[str], compressed: bool) -> str:
+    """
+    CREATE VIEW statement joining papers and paper_text back into the inline layout.
+
+    Args:
+        papers_columns: Column names of the narrow papers table, in order; the
+            text columns are placed after cited_by, as in the inline table
+        compressed: Wrap the text columns in decompress_text
+    """
+    text = [f"decompress_text(t.{column}) AS {column}" if compressed else f"t.{column}"
+            for column in TEXT_COLUMNS]
+    select = []
+    for column in papers_columns:
+        select.append(f"p.{column}")
+        if column == "cited_by":
+            select.extend(text)
+    return f"""
+        CREATE VIEW paper_details AS
+        SELECT {', '.join(select)}
+        FROM papers p
+        LEFT JOIN paper_text t ON t.paper_id = p.paper_id
+    """
@@ -0,0 +1,111 @@
+"""
+SQLite PRAGMA Profiles Module
+
+Connection settings for the two lifecycles of a master database:
+a write-heavy build phase and a read-optimized analyst phase.
+The finalize step verifies deferred foreign keys, refreshes planner
+statistics and switches the file to the read profile.
+"""
+
+import sqlite3
+import time
+from typing import Dict
+
+
+# Build profiles trade durability for load speed. A build always starts from
+# an empty file, so a crash mid-build is recovered by rebuilding, not by the journal.
+BUILD_PROFILES = {
+    "fast": {
+        "journal_mode": "OFF",
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+        "foreign_keys": "OFF",   # verified once by foreign_key_check on finalize
+    },
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+}
+
+# Settings left on the file (journal mode) and recommended for analyst connections
+READ_PROFILE = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+}
+
+
+def apply_build_profile(conn: sqlite3.Connection, profile: str = "fast",
+                        cache_size_mb: int = 256, mmap_size_mb: int = 256) -> Dict[str, str]:
+    """
+    Apply build-phase PRAGMAs to a connection.
+
+    Args:
+        conn: Open SQLite connection (no transaction in progress)
+        profile: Name of a BUILD_PROFILES entry ('fast' or 'safe')
+        cache_size_mb: Page cache size in MB
+        mmap_size_mb: Memory-mapped I/O size in MB (0 disables)
+
+    Returns:
+        Dictionary of applied PRAGMA settings
+    """
+    if profile not in BUILD_PROFILES:
+        raise ValueError(f"Unknown build profile '{profile}'. Choose from: {', '.join(BUILD_PROFILES)}")
+
+    settings = dict(BUILD_PROFILES[profile])
+    # Negative cache_size is interpreted by SQLite as KiB
+    settings["cache_size"] = str(-cache_size_mb * 1024)
+    settings["mmap_size"] = str(mmap_size_mb * 1024 * 1024)
+
+    for pragma, value in settings.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+    return settings
+
+
+def finalize_database(conn: sqlite3.Connection, vacuum: bool = False) -> Dict:
+    """
+    Verify and optimize a freshly built database, then switch it to the read profile.
+
+    Runs PRAGMA foreign_key_check (covering rows inserted while checks were
+    deferred), ANALYZE, PRAGMA optimize and optionally VACUUM, and finally
+    enables WAL journaling with foreign keys on.
+
+    Args:
+        conn: Open SQLite connection to the built database
+        vacuum: Whether to VACUUM the file (slower, smallest file)
+
+    Returns:
+        Report with foreign key violations per table and step timings
+    """
+    conn.commit()
+    report = {"foreign_key_violations": {}, "timings": {}}
+
+    start = time.perf_counter()
+    for table, _rowid, parent, _fkid in conn.execute("PRAGMA foreign_key_check"):
+        key = f"{table} -> {parent}"
+        report["foreign_key_violations"][key] = report["foreign_key_violations"].get(key, 0) + 1
+    report["timings"]["foreign_key_check"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    conn.execute("ANALYZE")
+    conn.commit()
+    report["timings"]["analyze"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    conn.execute("PRAGMA optimize")
+    report["timings"]["optimize"] = time.perf_counter() - start
+
+    if vacuum:
+        start = time.perf_counter()
+        conn.execute("VACUUM")
+        report["timings"]["vacuum"] = time.perf_counter() - start
+
+    for pragma, value in READ_PROFILE.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    conn.execute("PRAGMA main.wal_checkpoint(TRUNCATE)")
+    report["journal_mode"] = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    return report
@@ -0,0 +1,120 @@
+"""
+Reference Pipeline Module
+
+Parallel reference parsing for the serial ingest path. Reference parsing is
+the most expensive part of processing a record, so with
+``performance.reference_workers`` set the record processor hands each
+paper's reference list to a ReferencePipeline instead of parsing it inline.
+Reference strings are batched into chunks that worker processes parse; the
+main process collects the parsed tuples strictly in submission order and
+hands them to the processor's emit_citations, which queues the citation rows
+on the single BulkWriter, so rows are written in (citing_paper_id, position)
+order and the database is identical to an inline build.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from ..parsers.references import DEFAULT_CACHE_SIZE, ReferenceParser
+
+# Per-process parser, created by the pool initializer so each worker keeps
+# its own memo across chunks
+_worker_parser: Optional[ReferenceParser] = None
+
+
+def _init_worker(cache_size: int):
+    global _worker_parser
+    _worker_parser = ReferenceParser(cache_size=cache_size)
+
+
+def parse_chunk(references: List[str]) -> List[tuple]:
+    """Worker entry point: parse a chunk of reference strings in order."""
+    parse = _worker_parser.parse
+    return [parse(reference) for reference in references]
+
+
+class ReferencePipeline:
+    """
+    Fans reference parsing out to worker processes and writes results in order.
+
+    Papers are submitted with ``submit(paper_id, references)``. Once a chunk
+    holds ``chunk_size`` references it is sent to the pool; at most
+    ``2 * workers`` chunks are in flight, and finished chunks are written as
+    soon as every earlier chunk has been written. ``close()`` writes the
+    remainder and stops the pool.
+    """
+
+    def __init__(self, writer, emit_citations, workers: int = 0, chunk_size: int = 5000,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize reference pipeline.
+
+        Args:
+            writer: Object with an ``add(table, values)`` method (single writer)
+            emit_citations: ``emit_citations(paper_id, references, parsed, add)``
+                writing one paper's citation rows
+            workers: Worker processes (0 = one per CPU)
+            chunk_size: References per chunk sent to a worker
+            cache_size: Reference memo size inside each worker
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.writer = writer
+        self.emit_citations = emit_citations
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                        initargs=(cache_size,))
+
+        self._papers = []       # (paper_id, references) of the chunk being filled
+        self._references = []   # flattened references of the chunk being filled
+        self._pending = deque() # (future, papers) in submission order
+
+        self.stats = {"references": 0, "chunks": 0}
+
+    def submit(self, paper_id: int, references: List[str]):
+        """Queue one paper's references (in citation order) for parsing."""
+        if not references:
+            return
+        self._papers.append((paper_id, references))
+        self._references.extend(references)
+        if len(self._references) >= self.chunk_size:
+            self._submit_chunk()
+
+    def _submit_chunk(self):
+        if not self._papers:
+            return
+        self._pending.append((self.pool.submit(parse_chunk, self._references), self._papers))
+        self.stats["references"] += len(self._references)
+        self.stats["chunks"] += 1
+        self._papers, self._references = [], []
+
+        # Write finished chunks in order; block on the oldest once the window is full
+        while self._pending and (len(self._pending) >= 2 * self.workers or self._pending[0][0].done()):
+            self._write_chunk(*self._pending.popleft())
+
+    def _write_chunk(self, future, papers):
+        parsed = future.result()
+        add = self.writer.add
+        start = 0
+        for paper_id, references in papers:
+            end = start + len(references)
+            self.emit_citations(paper_id, references, parsed[start:end], add)
+            start = end
+
+    def close(self):
+        """Parse and write all remaining references, then stop the workers."""
+        try:
+            self._submit_chunk()
+            while self._pending:
+                self._write_chunk(*self._pending.popleft())
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """Stop the worker pool without writing pending results."""
+        self._pending.clear()
+        self.pool.shutdown(wait=True, cancel_futures=True)
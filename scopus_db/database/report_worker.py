@@ -0,0 +1,130 @@
+"""
+Background Report Worker Module
+
+Writes build reports off the critical path. The quality filter reports
+(JSON/CSV/text/HTML from the exclusion log), the deduplication logs and the
+validation report only read data that is final once they are submitted:
+snapshots of the statistics taken at submission and the closed exclusion
+log. A single worker thread writes them while the database load, index
+build and validation continue; the build waits for them once, at the end,
+and records how long each report took.
+
+Writers return the lines they would print instead of printing them, and
+the worker thread returns each report's timings and error with those
+lines; ``wait`` prints and records them on the calling thread, so report
+output does not interleave with the build's own progress output.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class ReportError(Exception):
+    """Exception raised when one or more reports could not be written."""
+
+    def __init__(self, errors: Dict[str, Exception]):
+        self.errors = errors
+        super().__init__("Could not write report(s): " +
+                         "; ".join(f"{name}: {error}" for name, error in errors.items()))
+
+
+class ReportWorker:
+    """
+    Runs report writers on a background thread, in submission order.
+
+    ``timings`` maps each report name to its "queued" (submission to start),
+    "seconds" (writing) and "latency" (submission to completion) times and
+    ``errors`` each failed report to its exception; both are only updated on
+    the submitting thread. With ``background=False`` reports are written
+    inline when submitted.
+    """
+
+    def __init__(self, background: bool = True):
+        """
+        Initialize report worker.
+
+        Args:
+            background: Write reports on a worker thread (inline when False)
+        """
+        self.background = background
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.errors: Dict[str, Exception] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._jobs: List[Tuple[str, object]] = []
+
+    def submit(self, name: str, writer: Callable, *args):
+        """
+        Queue a report writer.
+
+        Arguments must be snapshots: the caller may keep mutating its own
+        state while the report is written. Inline, the report's lines are
+        printed and its error raised before returning.
+
+        Args:
+            name: Report name (key of ``timings``)
+            writer: Function writing the report; returns the lines to print (or None)
+            *args: Arguments for ``writer``
+        """
+        submitted = time.perf_counter()
+        if not self.background:
+            error = self._collect(name, self._run(submitted, writer, args))
+            if error is not None:
+                raise error
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+        self._jobs.append((name, self._pool.submit(self._run, submitted, writer, args)))
+
+    @staticmethod
+    def _run(submitted: float, writer: Callable, args: Tuple):
+        """Write one report; returns its timings, output lines and error (touches no shared state)."""
+        started = time.perf_counter()
+        output, error = None, None
+        try:
+            output = writer(*args)
+        except Exception as e:
+            error = e
+        finished = time.perf_counter()
+        timing = {
+            "queued": started - submitted,
+            "seconds": finished - started,
+            "latency": finished - submitted,
+        }
+        return timing, output, error
+
+    def _collect(self, name: str, result: Tuple[Dict[str, float], Optional[Iterable[str]], Optional[Exception]]):
+        """Record and print the result of one report; returns its error."""
+        timing, output, error = result
+        self.timings[name] = timing
+        for line in output or ():
+            print(line)
+        if error is not None:
+            self.errors[name] = error
+        return error
+
+    def wait(self) -> Dict[str, Dict[str, float]]:
+        """
+        Wait for every queued report and stop the worker thread.
+
+        Every report is waited for, and its output printed, before failures
+        are raised.
+
+        Returns:
+            Report timings
+
+        Raises:
+            ReportError: If any queued report failed (``errors`` maps report names to exceptions)
+        """
+        jobs, self._jobs = self._jobs, []
+        failed = {}
+        for name, future in jobs:
+            error = self._collect(name, future.result())
+            if error is not None:
+                failed[name] = error
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if failed:
+            raise ReportError(failed) from next(iter(failed.values()))
+        return self.timings
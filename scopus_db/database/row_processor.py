@@ -0,0 +1,732 @@
+"""
+Scopus Record Processor Module
+
+Single-pass extraction of database rows from Scopus CSV records.
+Each record is visited exactly once and split into paper, entity,
+relationship, funding, citation, chemical, trade-name, correspondence
+and open-access rows, which are handed to a writer as they are produced.
+"""
+
+import json
+import re
+import string
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from ..parsers.headers import header_map_for
+from ..parsers.references import ReferenceParser, reference_fingerprint
+from .link_tables import KEYWORD_TYPE_CODES
+from .paper_text import compress_text
+
+
+# Insert statements keyed by table, in foreign-key dependency order:
+# parents (papers, master tables) always come before the tables referencing them.
+INSERT_STATEMENTS = {
+    "papers": """
+        INSERT INTO papers (
+            paper_id, title, year, doi, source_title, volume, issue,
+            page_start, page_end, page_count, cited_by, scopus_link,
+            abstract, language_original, document_type, publication_stage,
+            issn, isbn, scopus_query
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "authors_master": """
+        INSERT INTO authors_master
+        (author_id, scopus_id, full_name, canonical_name, abbreviated_name)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    "institutions_master": """
+        INSERT INTO institutions_master
+        (institution_id, canonical_name, country)
+        VALUES (?, ?, ?)
+    """,
+    "keywords_master": """
+        INSERT INTO keywords_master
+        (keyword_id, keyword_text, keyword_category, normalized_text)
+        VALUES (?, ?, ?, ?)
+    """,
+    # Author keywords relabel an earlier index-only keywords_master entry
+    "keyword_relabels": """
+        UPDATE keywords_master
+        SET keyword_text = ?, keyword_category = ?
+        WHERE keyword_id = ?
+    """,
+    "paper_funding": """
+        INSERT INTO paper_funding
+        (paper_id, agency_name, grant_numbers)
+        VALUES (?, ?, ?)
+    """,
+    "paper_citations": """
+        INSERT INTO paper_citations
+        (citing_paper_id, reference_text, reference_year, reference_authors,
+         reference_title, reference_journal, reference_volume,
+         reference_issue, reference_pages, position)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "paper_chemicals": """
+        INSERT INTO paper_chemicals
+        (paper_id, chemical_name, cas_number, position)
+        VALUES (?, ?, ?, ?)
+    """,
+    "paper_trade_names": """
+        INSERT INTO paper_trade_names
+        (paper_id, trade_name, manufacturer, position)
+        VALUES (?, ?, ?, ?)
+    """,
+    "paper_correspondence": """
+        INSERT OR REPLACE INTO paper_correspondence
+        (paper_id, author_name, email, institution)
+        VALUES (?, ?, ?, ?)
+    """,
+    "paper_open_access": """
+        INSERT OR REPLACE INTO paper_open_access
+        (paper_id, access_type, publisher, open_access)
+        VALUES (?, ?, ?, ?)
+    """,
+    "paper_authors": """
+        INSERT INTO paper_authors
+        (paper_id, author_id, position, first_author, last_author)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    "paper_keywords": """
+        INSERT OR IGNORE INTO paper_keywords
+        (paper_id, keyword_id, keyword_type, position)
+        VALUES (?, ?, ?, ?)
+    """,
+    "paper_institutions": """
+        INSERT OR IGNORE INTO paper_institutions
+        (paper_id, institution_id, author_count, primary_affiliation)
+        VALUES (?, ?, ?, ?)
+    """,
+}
+
+# With database.cited_works, each distinct cited work is stored once and
+# paper_citations only links citing papers to it
+CITED_WORK_STATEMENTS = {
+    "cited_works": """
+        INSERT INTO cited_works
+        (cited_work_id, fingerprint, reference_text, reference_year,
+         reference_authors, reference_title, reference_journal,
+         reference_volume, reference_issue, reference_pages)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "paper_citations": """
+        INSERT INTO paper_citations
+        (citing_paper_id, cited_work_id, position)
+        VALUES (?, ?, ?)
+    """,
+}
+
+# With database.paper_text, scopus_link and abstract go to the paper_text side table
+PAPER_TEXT_STATEMENTS = {
+    "papers": """
+        INSERT INTO papers (
+            paper_id, title, year, doi, source_title, volume, issue,
+            page_start, page_end, page_count, cited_by,
+            language_original, document_type, publication_stage,
+            issn, isbn, scopus_query
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "paper_text": """
+        INSERT INTO paper_text
+        (paper_id, scopus_link, abstract)
+        VALUES (?, ?, ?)
+    """,
+}
+
+TABLE_ORDER = list(INSERT_STATEMENTS)
+TABLE_ORDER.insert(TABLE_ORDER.index("paper_citations"), "cited_works")
+TABLE_ORDER.insert(TABLE_ORDER.index("papers") + 1, "paper_text")
+
+# Position of scopus_link and abstract in the papers row (see _paper_values)
+_TEXT_VALUES = slice(11, 13)
+
+KEYWORD_COLUMNS = [
+    ('Author Keywords', 'author'),
+    ('Index Keywords', 'index')
+]
+
+INSTITUTION_KEYWORDS = ['university', 'institute', 'college', 'school']
+OPEN_ACCESS_KEYWORDS = ['open', 'free', 'public', 'gold', 'green']
+
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+_GRANT_PATTERN = re.compile(r'[A-Z]{2,}\s*[-\d]+|Grant\s*[#:]?\s*[\w-]+|\d{4,}')
+_TRAILING_SEPARATORS = re.compile(r'[,;]+$')
+_CAS_PATTERN = re.compile(r'\b\d{2,7}-\d{2}-\d\b')
+_MANUFACTURER_PATTERN = re.compile(r'\(([^)]+)\)')
+_EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_LEADING_SEPARATOR = re.compile(r'^[,;]\s*')
+
+
+def insert_statements(cited_works: bool = False, paper_text: bool = False) -> Dict[str, str]:
+    """Insert statement per table for the citation layout (inline or cited_works) and papers layout."""
+    statements = dict(INSERT_STATEMENTS)
+    if cited_works:
+        statements.update(CITED_WORK_STATEMENTS)
+    if paper_text:
+        statements.update(PAPER_TEXT_STATEMENTS)
+    return statements
+
+
+def split_field(value) -> List[str]:
+    """Split a semicolon-separated Scopus field into stripped, non-empty parts."""
+    return [part.strip() for part in str(value).split(';') if part.strip()]
+
+
+class ScopusRecordProcessor:
+    """
+    Turns Scopus records into database rows in a single pass.
+
+    Owns the entity registries used for normalization, so an author,
+    institution or keyword receives its id the first time any record
+    mentions it. Rows are emitted through ``writer.add(table, values)``
+    in TABLE_ORDER for each record, keeping foreign keys satisfiable.
+    """
+
+    def __init__(self, scopus_query: Optional[str] = None, cited_works: bool = False,
+                 paper_text: bool = False, compress_paper_text: bool = False,
+                 compact_link_tables: bool = False):
+        """
+        Initialize record processor.
+
+        Args:
+            scopus_query: Scopus query string stored with every paper (optional)
+            cited_works: Store distinct cited works once in cited_works and
+                link them from paper_citations
+            paper_text: Store scopus_link and abstract in paper_text
+            compress_paper_text: zlib-compress paper_text values (see compress_text)
+            compact_link_tables: Store keyword_type as its integer code
+                (see link_tables.KEYWORD_TYPE_CODES)
+        """
+        self.scopus_query = scopus_query
+        self.cited_works = cited_works
+        self.paper_text = paper_text
+        self.compress_paper_text = paper_text and compress_paper_text
+        self.compact_link_tables = compact_link_tables
+        self.statements = insert_statements(cited_works, paper_text)
+        self.reference_parser = ReferenceParser()
+        self.reference_pipeline = None  # ReferencePipeline parsing references out of process
+
+        # Entity registries for normalization
+        self.authors_registry = {}      # scopus_id -> author_id
+        self.institutions_registry = {} # canonical_name -> institution_id
+        self.keywords_registry = {}     # normalized_text -> keyword_id
+        self.cited_works_registry = {}  # fingerprint -> cited_work_id
+        self._author_keywords = set()   # normalized_text seen as an author keyword
+
+        # Counters for entity IDs
+        self.author_counter = 1
+        self.institution_counter = 1
+        self.keyword_counter = 1
+        self.cited_work_counter = 1
+
+        self.stats = {
+            "papers_processed": 0,
+            "authors_normalized": 0,
+            "institutions_normalized": 0,
+            "keywords_normalized": 0,
+            "cited_works_normalized": 0,
+        }
+
+        # Expected table population, accumulated during the same pass
+        self.expected_counts = {
+            "papers": 0,
+            "authors_master": 0,
+            "institutions_master": 0,
+            "keywords_master": 0,
+            "paper_funding": 0,
+            "paper_authors": 0,
+            "paper_keywords": 0,
+            "paper_institutions": 0,
+            "paper_citations": 0
+        }
+        self._unique_authors = set()
+        self._unique_institutions = set()
+        self._unique_keywords = set()
+
+        # Header of the record being processed, resolved once per record
+        self._header_row = None
+        self._header = None
+
+    def layout_options(self) -> Dict[str, bool]:
+        """Storage layout keyword arguments, for building an equivalent processor (e.g. in a shard worker)."""
+        return {
+            "cited_works": self.cited_works,
+            "paper_text": self.paper_text,
+            "compress_paper_text": self.compress_paper_text,
+            "compact_link_tables": self.compact_link_tables,
+        }
+
+    def _get_column_value(self, row: Dict, column_name: str, alternatives: List[str] = None) -> str:
+        """
+        Get column value handling BOM and formatting issues in CSV headers.
+
+        The header is resolved once per distinct CSV header (see HeaderMap),
+        so this is a dictionary lookup per call.
+
+        Args:
+            row: CSV row dictionary
+            column_name: Primary column name to look for
+            alternatives: Alternative column names to try
+
+        Returns:
+            Column value or empty string if not found
+        """
+        header = self._header if row is self._header_row else header_map_for(row)
+        key = header.resolve(column_name, alternatives or ())
+        return row.get(key, '') if key is not None else ''
+
+    def expected_table_counts(self) -> Dict[str, int]:
+        """Return expected table population counts for the records seen so far."""
+        counts = dict(self.expected_counts)
+        counts["authors_master"] = len(self._unique_authors)
+        counts["institutions_master"] = len(self._unique_institutions)
+        counts["keywords_master"] = len(self._unique_keywords)
+        return counts
+
+    def expected_state(self) -> Tuple[Dict[str, int], set, set, set]:
+        """Return expected-count state so another processor can merge it."""
+        return (dict(self.expected_counts), self._unique_authors,
+                self._unique_institutions, self._unique_keywords)
+
+    def merge_expected_state(self, state: Tuple[Dict[str, int], set, set, set]):
+        """Merge expected-count state produced by another processor (e.g. a shard worker)."""
+        counts, unique_authors, unique_institutions, unique_keywords = state
+        for table, count in counts.items():
+            self.expected_counts[table] += count
+        self._unique_authors.update(unique_authors)
+        self._unique_institutions.update(unique_institutions)
+        self._unique_keywords.update(unique_keywords)
+
+    def process_record(self, paper_id: int, row: Dict, writer):
+        """
+        Extract every database row for one record and hand it to the writer.
+
+        Args:
+            paper_id: 1-based paper id assigned to this record
+            row: CSV row dictionary
+            writer: Object with an ``add(table, values)`` method
+        """
+        add = writer.add
+        self._header_row = row
+        self._header = header_map_for(row)
+
+        # Each multi-valued field is split exactly once per record
+        authors_raw = self._get_column_value(row, 'Authors')
+        author_ids_raw = self._get_column_value(row, 'Author(s) ID')
+        has_authors = bool(authors_raw and author_ids_raw)
+        author_ids = split_field(author_ids_raw) if has_authors else []
+
+        affiliations_raw = self._get_column_value(row, 'Affiliations')
+        affiliations = split_field(affiliations_raw) if affiliations_raw else []
+
+        keyword_lists = []
+        for col_name, keyword_type in KEYWORD_COLUMNS:
+            keywords_raw = self._get_column_value(row, col_name)
+            keyword_lists.append((keyword_type, split_field(keywords_raw) if keywords_raw else []))
+
+        funding_text = self._get_column_value(row, 'Funding Details') or self._get_column_value(row, 'Funding Texts')
+        funding_entries = split_field(funding_text) if funding_text else []
+
+        # References (typically separated by semicolons)
+        references_text = self._get_column_value(row, 'References')
+        references = split_field(references_text) if references_text else []
+
+        self._track_expected(author_ids, affiliations, keyword_lists, funding_entries, references)
+
+        # Papers
+        paper = self._paper_values(paper_id, row)
+        if self.paper_text:
+            scopus_link, abstract = paper[_TEXT_VALUES]
+            if self.compress_paper_text:
+                scopus_link, abstract = compress_text(scopus_link), compress_text(abstract)
+            add("papers", paper[:_TEXT_VALUES.start] + paper[_TEXT_VALUES.stop:])
+            add("paper_text", (paper_id, scopus_link, abstract))
+        else:
+            add("papers", paper)
+        self.stats["papers_processed"] += 1
+
+        # Master entities (registered before any relationship references them)
+        if has_authors:
+            self._register_authors(row, authors_raw, author_ids, add)
+        institution_names = self._register_institutions(affiliations, add)
+        normalized_keywords = self._register_keywords(keyword_lists, add)
+
+        # Complex data fields
+        self._emit_funding(paper_id, funding_entries, add)
+        self._emit_references(paper_id, references, add)
+        self._emit_chemicals(paper_id, row, add)
+        self._emit_trade_names(paper_id, row, add)
+        self._emit_correspondence(paper_id, row, add)
+        self._emit_open_access(paper_id, row, add)
+
+        # Relationships
+        self._emit_paper_authors(paper_id, author_ids, add)
+        self._emit_paper_keywords(paper_id, normalized_keywords, add)
+        self._emit_paper_institutions(paper_id, institution_names, add)
+
+    def _track_expected(self, author_ids: List[str], affiliations: List[str], keyword_lists: List,
+                        funding_entries: List[str], references: List[str]):
+        """Update expected table population counts from the split fields of one record."""
+        expected = self.expected_counts
+        expected["papers"] += 1
+
+        self._unique_authors.update(author_ids)
+        expected["paper_authors"] += len(author_ids)
+
+        self._unique_institutions.update(affiliations)
+        expected["paper_institutions"] += len(affiliations)
+
+        for _, keywords in keyword_lists:
+            self._unique_keywords.update(keywords)
+            expected["paper_keywords"] += len(keywords)
+
+        expected["paper_funding"] += len(funding_entries)
+
+        # Estimate citations based on text length
+        expected["paper_citations"] += sum(1 for reference in references if len(reference) > 10)
+
+    def _paper_values(self, paper_id: int, row: Dict) -> tuple:
+        """Build the papers row for a record."""
+        year = int(row.get('Year', 0)) if str(row.get('Year', '')).isdigit() else None
+        cited_by = int(row.get('Cited by', 0)) if str(row.get('Cited by', '')).isdigit() else 0
+
+        return (
+            paper_id,
+            row.get('Title', ''),
+            year,
+            row.get('DOI', ''),
+            row.get('Source title', ''),
+            row.get('Volume', ''),
+            row.get('Issue', ''),
+            row.get('Page start', ''),
+            row.get('Page end', ''),
+            int(row.get('Page count', 0)) if str(row.get('Page count', '')).isdigit() else None,
+            cited_by,
+            row.get('Link', ''),
+            row.get('Abstract', ''),
+            row.get('Language of Original Document', ''),
+            row.get('Document Type', ''),
+            row.get('Publication Stage', ''),
+            row.get('ISSN', ''),
+            row.get('ISBN', ''),
+            self.scopus_query  # Add the Scopus query for each record
+        )
+
+    def _register_authors(self, row: Dict, authors_raw: str, author_ids: List[str], add):
+        """Register unseen authors of a record in authors_master."""
+        authors = split_field(authors_raw)
+
+        # Extract full names if available
+        full_names = []
+        full_names_raw = self._get_column_value(row, 'Author full names')
+        if full_names_raw:
+            full_names = split_field(full_names_raw)
+
+        for i, (author, scopus_id) in enumerate(zip(authors, author_ids)):
+            if scopus_id and scopus_id not in self.authors_registry:
+                # Extract full name if available
+                full_name = author
+                if i < len(full_names):
+                    # Extract name from "Last, First (ID)" format
+                    full_name_part = full_names[i]
+                    if '(' in full_name_part:
+                        full_name = full_name_part.split('(')[0].strip()
+
+                # Create canonical name (simplified for matching)
+                canonical_name = self._canonicalize_author_name(full_name)
+
+                add("authors_master", (self.author_counter, scopus_id, full_name, canonical_name, author))
+
+                self.authors_registry[scopus_id] = self.author_counter
+                self.author_counter += 1
+                self.stats["authors_normalized"] += 1
+
+    def _register_institutions(self, affiliations: List[str], add) -> List[str]:
+        """Register unseen institutions and return the institution name per affiliation."""
+        institution_names = []
+        for affiliation in affiliations:
+            # Extract institution name (simple heuristic)
+            institution_name = self._extract_institution_name(affiliation)
+            institution_names.append(institution_name)
+
+            if institution_name and institution_name not in self.institutions_registry:
+                # Extract country if possible
+                country = self._extract_country(affiliation)
+
+                add("institutions_master", (self.institution_counter, institution_name, country))
+
+                self.institutions_registry[institution_name] = self.institution_counter
+                self.institution_counter += 1
+                self.stats["institutions_normalized"] += 1
+
+        return institution_names
+
+    def _register_keywords(self, keyword_lists: List, add) -> List:
+        """Register unseen keywords and return (keyword_type, normalized keywords) per column."""
+        normalized_lists = []
+        for keyword_type, keywords in keyword_lists:
+            normalized_keywords = []
+            for keyword in keywords:
+                # Normalize keyword text
+                normalized = self._normalize_keyword_text(keyword)
+                normalized_keywords.append(normalized)
+
+                if not normalized:
+                    continue
+
+                if normalized not in self.keywords_registry:
+                    add("keywords_master", (self.keyword_counter, keyword, keyword_type, normalized))
+
+                    self.keywords_registry[normalized] = self.keyword_counter
+                    self.keyword_counter += 1
+                    self.stats["keywords_normalized"] += 1
+                elif keyword_type == 'author' and normalized not in self._author_keywords:
+                    # Author keywords take precedence over index keywords for the
+                    # master entry, so an earlier index-only entry is relabelled
+                    add("keyword_relabels", (keyword, keyword_type, self.keywords_registry[normalized]))
+
+                if keyword_type == 'author':
+                    self._author_keywords.add(normalized)
+            normalized_lists.append((keyword_type, normalized_keywords))
+
+        return normalized_lists
+
+    def _emit_paper_authors(self, paper_id: int, author_ids: List[str], add):
+        """Emit paper-author relationships with position information."""
+        for position, scopus_id in enumerate(author_ids, 1):
+            if scopus_id in self.authors_registry:
+                author_id = self.authors_registry[scopus_id]
+
+                # Determine author role
+                first_author = (position == 1)
+                last_author = (position == len(author_ids))
+
+                add("paper_authors", (paper_id, author_id, position, first_author, last_author))
+
+    def _emit_paper_keywords(self, paper_id: int, normalized_lists: List, add):
+        """Emit paper-keyword relationships."""
+        for keyword_type, normalized_keywords in normalized_lists:
+            if self.compact_link_tables:
+                keyword_type = KEYWORD_TYPE_CODES[keyword_type]
+            for position, normalized in enumerate(normalized_keywords, 1):
+                if normalized in self.keywords_registry:
+                    keyword_id = self.keywords_registry[normalized]
+                    add("paper_keywords", (paper_id, keyword_id, keyword_type, position))
+
+    def _emit_paper_institutions(self, paper_id: int, institution_names: List[str], add):
+        """Emit paper-institution relationships."""
+        if not institution_names:
+            return
+
+        institution_counts = defaultdict(int)
+        for institution_name in institution_names:
+            if institution_name in self.institutions_registry:
+                institution_counts[institution_name] += 1
+
+        # Insert relationships
+        for institution_name, count in institution_counts.items():
+            institution_id = self.institutions_registry[institution_name]
+            primary = (count == max(institution_counts.values()))
+            add("paper_institutions", (paper_id, institution_id, count, primary))
+
+    def _emit_funding(self, paper_id: int, funding_entries: List[str], add):
+        """Parse funding agencies and grant numbers."""
+        for funding_entry in funding_entries:
+            # Extract agency name and grant numbers
+            agency_name = funding_entry
+            grant_numbers = []
+
+            # Look for grant numbers in parentheses or after specific patterns
+            grant_matches = _GRANT_PATTERN.findall(funding_entry)
+            if grant_matches:
+                grant_numbers = grant_matches
+                # Remove grant numbers from agency name
+                for grant in grant_matches:
+                    agency_name = agency_name.replace(grant, '').strip()
+
+            # Clean agency name
+            agency_name = _TRAILING_SEPARATORS.sub('', agency_name).strip()
+
+            if agency_name and len(agency_name) > 3:  # Filter out very short entries
+                add("paper_funding", (paper_id, agency_name, json.dumps(grant_numbers)))
+
+    def _emit_references(self, paper_id: int, references: List[str], add):
+        """Parse citation references with structured data extraction."""
+        if not references:
+            return
+
+        if self.reference_pipeline is not None:
+            self.reference_pipeline.submit(paper_id, references)
+            return
+
+        parse = self.reference_parser.parse
+        self.emit_citations(paper_id, references, [parse(reference) for reference in references], add)
+
+    def emit_citations(self, paper_id: int, references: List[str], parsed_references: List[tuple], add):
+        """
+        Emit the citation rows of one paper from its parsed references.
+
+        Args:
+            paper_id: Citing paper id
+            references: Reference strings in citation order
+            parsed_references: parse_reference result per reference
+            add: Writer ``add(table, values)`` method
+        """
+        if not self.cited_works:
+            for ref_idx, (reference, parsed) in enumerate(zip(references, parsed_references), 1):
+                # Structured fields come back in paper_citations column order
+                add("paper_citations", (paper_id, reference[:500], *parsed, ref_idx))
+            return
+
+        registry = self.cited_works_registry
+        for ref_idx, (reference, parsed) in enumerate(zip(references, parsed_references), 1):
+            fingerprint = reference_fingerprint(reference, parsed)
+            cited_work_id = registry.get(fingerprint)
+            if cited_work_id is None:
+                # The first occurrence provides the stored text and fields
+                cited_work_id = self.cited_work_counter
+                registry[fingerprint] = cited_work_id
+                self.cited_work_counter += 1
+                self.stats["cited_works_normalized"] += 1
+                add("cited_works", (cited_work_id, fingerprint, reference[:500], *parsed))
+            add("paper_citations", (paper_id, cited_work_id, ref_idx))
+
+    def _emit_chemicals(self, paper_id: int, row: Dict, add):
+        """Parse chemical substances and CAS numbers."""
+        chemicals_text = self._get_column_value(row, 'Chemicals/CAS', ['Chemical'])
+        if not chemicals_text:
+            return
+
+        for chem_idx, chemical in enumerate(split_field(chemicals_text), 1):
+            # Extract CAS number if present
+            cas_number = None
+            chemical_name = chemical
+
+            cas_match = _CAS_PATTERN.search(chemical)
+            if cas_match:
+                cas_number = cas_match.group()
+                chemical_name = chemical.replace(cas_number, '').strip()
+
+            if chemical_name:
+                add("paper_chemicals", (paper_id, chemical_name, cas_number, chem_idx))
+
+    def _emit_trade_names(self, paper_id: int, row: Dict, add):
+        """Parse trade names and manufacturer information."""
+        trade_names_text = self._get_column_value(row, 'Tradenames', ['Trade Names'])
+        if not trade_names_text:
+            return
+
+        for trade_idx, trade_name in enumerate(split_field(trade_names_text), 1):
+            # Try to extract manufacturer (often in parentheses)
+            manufacturer = None
+            mfg_match = _MANUFACTURER_PATTERN.search(trade_name)
+            if mfg_match:
+                manufacturer = mfg_match.group(1)
+                trade_name = _MANUFACTURER_PATTERN.sub('', trade_name).strip()
+
+            if trade_name:
+                add("paper_trade_names", (paper_id, trade_name, manufacturer, trade_idx))
+
+    def _emit_correspondence(self, paper_id: int, row: Dict, add):
+        """Parse correspondence author information."""
+        correspondence = self._get_column_value(row, 'Correspondence Address', ['Corresponding Author'])
+        if not correspondence:
+            return
+
+        # Extract email if present
+        email_match = _EMAIL_PATTERN.search(correspondence)
+        email = email_match.group() if email_match else None
+
+        # Extract author name (often before the semicolon or comma)
+        author_name = correspondence.split(';')[0].split(',')[0].strip()
+
+        # Extract institution (often after author name)
+        institution = correspondence.replace(author_name, '').replace(email or '', '').strip()
+        institution = _LEADING_SEPARATOR.sub('', institution).strip()
+
+        if author_name:
+            add("paper_correspondence", (paper_id, author_name, email, institution))
+
+    def _emit_open_access(self, paper_id: int, row: Dict, add):
+        """Parse open access and publication information."""
+        access_type = self._get_column_value(row, 'Access Type', ['Open Access'])
+        publisher = self._get_column_value(row, 'Publisher')
+
+        # Determine if it's open access
+        open_access = False
+        if access_type:
+            open_access = any(keyword in str(access_type).lower() for keyword in OPEN_ACCESS_KEYWORDS)
+
+        if access_type or publisher:
+            add("paper_open_access", (paper_id, access_type, publisher, open_access))
+
+    def _canonicalize_author_name(self, name: str) -> str:
+        """Create canonical version of author name for disambiguation."""
+        if not name:
+            return ""
+
+        # Remove punctuation and extra spaces
+        name = name.translate(_PUNCTUATION_TABLE)
+
+        # Convert to lowercase and split
+        parts = name.lower().split()
+
+        # Simple canonicalization: "Last, First" -> "first last"
+        if len(parts) >= 2:
+            return ' '.join(sorted(parts))
+
+        return ' '.join(parts)
+
+    def _extract_institution_name(self, affiliation: str) -> str:
+        """Extract institution name from affiliation string."""
+        if not affiliation:
+            return ""
+
+        # Simple heuristic: take first significant part before comma
+        parts = affiliation.split(',')
+        if parts:
+            # Look for university, institute, etc.
+            for part in parts:
+                part = part.strip()
+                lowered = part.lower()
+                if any(keyword in lowered for keyword in INSTITUTION_KEYWORDS):
+                    return part
+
+            # Fallback to first substantial part
+            if len(parts[0].strip()) > 3:
+                return parts[0].strip()
+
+        return affiliation.strip()
+
+    def _extract_country(self, affiliation: str) -> str:
+        """Extract country from affiliation string."""
+        if not affiliation:
+            return ""
+
+        # Simple heuristic: last part is often country
+        parts = [p.strip() for p in affiliation.split(',')]
+        if len(parts) > 1:
+            potential_country = parts[-1]
+            # Basic country validation (length and common patterns)
+            if 2 <= len(potential_country) <= 20 and potential_country.isalpha():
+                return potential_country
+
+        return ""
+
+    def _normalize_keyword_text(self, keyword: str) -> str:
+        """Normalize keyword text for better matching."""
+        if not keyword:
+            return ""
+
+        # Convert to lowercase, remove extra spaces, drop common punctuation
+        return ' '.join(keyword.lower().split()).translate(_PUNCTUATION_TABLE)
+
+    def _parse_single_reference(self, reference: str) -> Dict:
+        """
+        Parse individual reference string into structured components.
+
+        See scopus_db.parsers.references.parse_reference for the supported
+        formats; results are memoized per raw reference string.
+        """
+        return self.reference_parser.parse_dict(reference)
@@ -0,0 +1,134 @@
+"""
+Full-Text Search Module
+
+Optional FTS5 index over paper titles, abstracts and author/index keywords.
+The index is external-content: papers_fts stores only the inverted index,
+while column values are read through the paper_search_content view over
+papers and paper_keywords, so the text is not stored twice. The index is
+filled with one bulk 'rebuild' after the load; appended papers are added
+with index_papers. Queries use FTS5 MATCH syntax and are ranked by bm25.
+"""
+
+import sqlite3
+import time
+from typing import Dict, Iterable, List
+
+SEARCH_TABLE = "papers_fts"
+SEARCH_COLUMNS = ("title", "abstract", "author_keywords", "index_keywords")
+
+# bm25 column weights: a term in the title or author keywords says more
+# about a paper than the same term somewhere in its abstract
+SEARCH_WEIGHTS = (4.0, 1.0, 2.0, 1.5)
+
+# {papers} is papers, or paper_details in the database.paper_text layout;
+# {keywords} is paper_keywords, or paper_keyword_details with compact link tables
+SEARCH_CONTENT_VIEW = """
+    CREATE VIEW paper_search_content AS
+    SELECT p.paper_id, p.title, p.abstract,
+           (SELECT group_concat(k.keyword_text, '; ')
+            FROM {keywords} pk JOIN keywords_master k ON k.keyword_id = pk.keyword_id
+            WHERE pk.paper_id = p.paper_id AND pk.keyword_type = 'author') AS author_keywords,
+           (SELECT group_concat(k.keyword_text, '; ')
+            FROM {keywords} pk JOIN keywords_master k ON k.keyword_id = pk.keyword_id
+            WHERE pk.paper_id = p.paper_id AND pk.keyword_type = 'index') AS index_keywords
+    FROM {papers} p
+"""
+
+SEARCH_TABLE_DDL = f"""
+    CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(
+        {', '.join(SEARCH_COLUMNS)},
+        content='paper_search_content',
+        content_rowid='paper_id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+"""
+
+
+def create_search_index(conn: sqlite3.Connection, papers: str = "papers", keywords: str = "paper_keywords"):
+    """
+    Create the search content view and the (empty) FTS5 table.
+
+    Args:
+        conn: Connection (or cursor) of the database being built
+        papers: Table or view holding title and abstract
+        keywords: Table or view with text keyword_type labels
+    """
+    conn.execute(SEARCH_CONTENT_VIEW.format(papers=papers, keywords=keywords))
+    conn.execute(SEARCH_TABLE_DDL)
+
+
+def rebuild_search_index(conn: sqlite3.Connection) -> Dict:
+    """
+    Index every paper in one bulk pass.
+
+    Returns:
+        Dictionary with 'papers' (indexed) and 'seconds'
+    """
+    start = time.perf_counter()
+    conn.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+    # Merge the b-tree segments written by the rebuild into one
+    conn.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+    conn.commit()
+    papers = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+    return {"papers": papers, "seconds": time.perf_counter() - start}
+
+
+def index_papers(conn: sqlite3.Connection, paper_ids: Iterable[int]) -> int:
+    """
+    Add appended papers to the index.
+
+    Papers whose text or keywords changed after they were indexed need a
+    rebuild_search_index instead: an external-content FTS5 entry can only
+    be removed with the values it was indexed with.
+    In a database built with compress_paper_text, register_text_functions
+    must have been called on the connection.
+
+    Args:
+        conn: Connection to a database with a search index
+        paper_ids: Newly inserted papers (with their keywords)
+
+    Returns:
+        Number of papers added
+    """
+    columns = ", ".join(SEARCH_COLUMNS)
+    cursor = conn.executemany(f"""
+        INSERT INTO {SEARCH_TABLE}(rowid, {columns})
+        SELECT paper_id, {columns} FROM paper_search_content WHERE paper_id = ?
+    """, ((paper_id,) for paper_id in paper_ids))
+    conn.commit()
+    return cursor.rowcount
+
+
+def search_papers(conn: sqlite3.Connection, query: str, limit: int = 20, offset: int = 0) -> List[Dict]:
+    """
+    Rank papers matching an FTS5 query.
+
+    Args:
+        conn: Connection to a database with a search index
+        query: FTS5 query ("laser welding", "title:topology", "powder NOT metal", "addit*")
+        limit: Maximum results
+        offset: Results to skip (paging)
+
+    Returns:
+        List of {'paper_id', 'bm25'} dicts, best first; as in SQLite, a
+        lower (more negative) bm25 score is a better match
+
+    Raises:
+        ValueError: If the database has no search index or the query is malformed
+    """
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (SEARCH_TABLE,)).fetchone():
+        raise ValueError("Database has no full-text index (build with database.full_text_search enabled)")
+
+    weights = ", ".join(str(weight) for weight in SEARCH_WEIGHTS)
+    try:
+        rows = conn.execute(f"""
+            SELECT rowid, bm25({SEARCH_TABLE}, {weights}) AS bm25
+            FROM {SEARCH_TABLE}
+            WHERE {SEARCH_TABLE} MATCH ?
+            ORDER BY bm25
+            LIMIT ? OFFSET ?
+        """, (query, limit, offset)).fetchall()
+    except sqlite3.OperationalError as e:
+        raise ValueError(f"Invalid search query '{query}': {e}") from e
+
+    return [{"paper_id": paper_id, "bm25": bm25} for paper_id, bm25 in rows]
@@ -0,0 +1,332 @@
+"""
+Sharded Build Module
+
+Multi-process ingestion for OptimalScopusDatabase. Filtered records are cut
+into contiguous chunks; each worker process parses and normalizes its chunk
+into its own shard SQLite file with shard-local paper and entity ids. Shards
+are merged strictly in input order: local author/institution/keyword ids are
+remapped onto the global registries (first occurrence wins, exactly as in the
+serial build) and rows are copied with ATTACH + INSERT ... SELECT in rowid
+order, so the merged tables match the serial build row for row.
+"""
+
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .bulk_writer import BulkWriter
+from .pragmas import apply_build_profile
+from .row_processor import ScopusRecordProcessor
+
+
+# How rows of each paper-level table are copied from a shard:
+# paper_col is offset by the papers merged so far, remap maps a column
+# through a shard-local -> global id table, omit lists AUTOINCREMENT keys
+# that the target assigns itself (in the same order as a serial build).
+# Tables the configured layout does not create (paper_text) are skipped.
+MAP_TABLES = ("author_map", "institution_map", "keyword_map", "cited_work_map")
+
+COPY_SPECS = {
+    "papers": {"paper_col": "paper_id"},
+    "paper_text": {"paper_col": "paper_id"},
+    "paper_funding": {"paper_col": "paper_id", "omit": ["funding_id"]},
+    "paper_citations": {"paper_col": "citing_paper_id", "omit": ["citation_id"],
+                        "remap": {"cited_work_id": "cited_work_map"}},
+    "paper_chemicals": {"paper_col": "paper_id"},
+    "paper_trade_names": {"paper_col": "paper_id"},
+    "paper_correspondence": {"paper_col": "paper_id"},
+    "paper_open_access": {"paper_col": "paper_id"},
+    "paper_authors": {"paper_col": "paper_id", "remap": {"author_id": "author_map"}},
+    "paper_keywords": {"paper_col": "paper_id", "remap": {"keyword_id": "keyword_map"}},
+    "paper_institutions": {"paper_col": "paper_id", "remap": {"institution_id": "institution_map"}},
+}
+
+
+def build_shard(shard_path: str, table_ddl: List[str], records: List[Dict],
+                scopus_query: Optional[str], batch_size: int, layout: Optional[Dict] = None) -> Dict:
+    """
+    Worker entry point: load one chunk of records into a shard database.
+
+    Args:
+        shard_path: Path of the shard SQLite file to create
+        table_ddl: CREATE TABLE statements copied from the master schema
+        records: Contiguous chunk of filtered records
+        scopus_query: Scopus query stored with each paper
+        batch_size: BulkWriter batch size
+        layout: Storage layout options of the master processor
+            (ScopusRecordProcessor.layout_options)
+
+    Returns:
+        Shard summary with paper count, processor stats, expected-count state and timing
+    """
+    start = time.perf_counter()
+    conn = sqlite3.connect(shard_path)
+    apply_build_profile(conn, "fast", cache_size_mb=64, mmap_size_mb=0)
+    for ddl in table_ddl:
+        conn.execute(ddl)
+
+    processor = ScopusRecordProcessor(scopus_query=scopus_query, **(layout or {}))
+    writer = BulkWriter(conn, batch_size=batch_size, statements=processor.statements)
+    for idx, row in enumerate(records):
+        processor.process_record(idx + 1, row, writer)
+    writer.close()
+    conn.close()
+
+    return {
+        "shard_path": shard_path,
+        "papers": len(records),
+        "stats": processor.stats,
+        "expected_state": processor.expected_state(),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+class ShardMerger:
+    """
+    Merges shard databases into the master database in input order.
+
+    Uses the global ScopusRecordProcessor's registries and counters, so ids
+    are assigned exactly as a serial build assigns them.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, processor: ScopusRecordProcessor):
+        """
+        Initialize shard merger.
+
+        Args:
+            conn: Connection to the master database (schema already created)
+            processor: Global record processor holding the entity registries
+        """
+        self.conn = conn
+        self.processor = processor
+        self.paper_offset = 0
+        self.shards_merged = 0
+
+        cursor = conn.cursor()
+        for map_table in MAP_TABLES:
+            cursor.execute(f"CREATE TEMP TABLE {map_table} (local_id INTEGER PRIMARY KEY, global_id INTEGER)")
+
+        tables = {name for (name,) in conn.execute("SELECT name FROM main.sqlite_master WHERE type = 'table'")}
+        self._copy_sql = {table: self._build_copy_sql(table, spec)
+                          for table, spec in COPY_SPECS.items() if table in tables}
+
+    def _build_copy_sql(self, table: str, spec: Dict) -> str:
+        """Build the INSERT ... SELECT statement copying one table from the attached shard."""
+        columns = [info[1] for info in self.conn.execute(f"PRAGMA main.table_info({table})")]
+        columns = [c for c in columns if c not in spec.get("omit", [])]
+
+        select_exprs = []
+        joins = []
+        for column in columns:
+            if column == spec["paper_col"]:
+                select_exprs.append(f"s.{column} + ?")
+            elif column in spec.get("remap", {}):
+                map_table = spec["remap"][column]
+                joins.append(f"JOIN temp.{map_table} m_{column} ON m_{column}.local_id = s.{column}")
+                select_exprs.append(f"m_{column}.global_id")
+            else:
+                select_exprs.append(f"s.{column}")
+
+        # WITHOUT ROWID tables (compact link tables) are stored in key order whatever the insert order
+        ddl = self.conn.execute("SELECT sql FROM main.sqlite_master WHERE name = ?", (table,)).fetchone()[0]
+        order = "" if "WITHOUT ROWID" in ddl.upper() else "ORDER BY s.rowid"
+
+        return (f"INSERT INTO main.{table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(select_exprs)} FROM shard.{table} s {' '.join(joins)} "
+                f"{order}")
+
+    def merge(self, shard_result: Dict):
+        """Merge one shard (the next in input order) into the master database."""
+        processor = self.processor
+        cursor = self.conn.cursor()
+        cursor.execute("ATTACH DATABASE ? AS shard", (shard_result["shard_path"],))
+
+        # Papers first so relationship rows always reference existing parents
+        cursor.execute(self._copy_sql["papers"], (self.paper_offset,))
+
+        # Authors: scopus_id identifies the entity
+        author_map = []
+        new_authors = []
+        for local_id, scopus_id, full_name, canonical_name, abbreviated_name in cursor.execute(
+                "SELECT author_id, scopus_id, full_name, canonical_name, abbreviated_name "
+                "FROM shard.authors_master ORDER BY author_id").fetchall():
+            global_id = processor.authors_registry.get(scopus_id)
+            if global_id is None:
+                global_id = processor.author_counter
+                processor.authors_registry[scopus_id] = global_id
+                processor.author_counter += 1
+                processor.stats["authors_normalized"] += 1
+                new_authors.append((global_id, scopus_id, full_name, canonical_name, abbreviated_name))
+            author_map.append((local_id, global_id))
+        cursor.executemany("INSERT INTO main.authors_master (author_id, scopus_id, full_name, canonical_name, abbreviated_name) "
+                           "VALUES (?, ?, ?, ?, ?)", new_authors)
+
+        # Institutions: canonical name identifies the entity
+        institution_map = []
+        new_institutions = []
+        for local_id, canonical_name, country in cursor.execute(
+                "SELECT institution_id, canonical_name, country "
+                "FROM shard.institutions_master ORDER BY institution_id").fetchall():
+            global_id = processor.institutions_registry.get(canonical_name)
+            if global_id is None:
+                global_id = processor.institution_counter
+                processor.institutions_registry[canonical_name] = global_id
+                processor.institution_counter += 1
+                processor.stats["institutions_normalized"] += 1
+                new_institutions.append((global_id, canonical_name, country))
+            institution_map.append((local_id, global_id))
+        cursor.executemany("INSERT INTO main.institutions_master (institution_id, canonical_name, country) "
+                           "VALUES (?, ?, ?)", new_institutions)
+
+        # Keywords: normalized text identifies the entity; the first author
+        # keyword occurrence overrides an index-only entry, as in the serial build
+        keyword_map = []
+        new_keywords = []
+        relabelled_keywords = []
+        for local_id, keyword_text, category, normalized in cursor.execute(
+                "SELECT keyword_id, keyword_text, keyword_category, normalized_text "
+                "FROM shard.keywords_master ORDER BY keyword_id").fetchall():
+            global_id = processor.keywords_registry.get(normalized)
+            if global_id is None:
+                global_id = processor.keyword_counter
+                processor.keywords_registry[normalized] = global_id
+                processor.keyword_counter += 1
+                processor.stats["keywords_normalized"] += 1
+                new_keywords.append((global_id, keyword_text, category, normalized))
+            elif category == 'author' and normalized not in processor._author_keywords:
+                relabelled_keywords.append((keyword_text, category, global_id))
+            if category == 'author':
+                processor._author_keywords.add(normalized)
+            keyword_map.append((local_id, global_id))
+        cursor.executemany("INSERT INTO main.keywords_master (keyword_id, keyword_text, keyword_category, "
+                           "normalized_text) VALUES (?, ?, ?, ?)", new_keywords)
+        cursor.executemany("UPDATE main.keywords_master SET keyword_text = ?, keyword_category = ? "
+                           "WHERE keyword_id = ?", relabelled_keywords)
+
+        # Cited works: the fingerprint identifies the work, first occurrence wins
+        cited_work_map = []
+        if processor.cited_works:
+            new_works = []
+            for row in cursor.execute(
+                    "SELECT cited_work_id, fingerprint, reference_text, reference_year, reference_authors, "
+                    "reference_title, reference_journal, reference_volume, reference_issue, reference_pages "
+                    "FROM shard.cited_works ORDER BY cited_work_id").fetchall():
+                local_id, fingerprint = row[0], row[1]
+                global_id = processor.cited_works_registry.get(fingerprint)
+                if global_id is None:
+                    global_id = processor.cited_work_counter
+                    processor.cited_works_registry[fingerprint] = global_id
+                    processor.cited_work_counter += 1
+                    processor.stats["cited_works_normalized"] += 1
+                    new_works.append((global_id,) + row[1:])
+                cited_work_map.append((local_id, global_id))
+            cursor.executemany(processor.statements["cited_works"], new_works)
+
+        for map_table, mapping in (("author_map", author_map),
+                                   ("institution_map", institution_map),
+                                   ("keyword_map", keyword_map),
+                                   ("cited_work_map", cited_work_map)):
+            cursor.execute(f"DELETE FROM temp.{map_table}")
+            cursor.executemany(f"INSERT INTO temp.{map_table} (local_id, global_id) VALUES (?, ?)", mapping)
+
+        # Paper-level tables, remapped and offset, in shard insertion order
+        for table, sql in self._copy_sql.items():
+            if table != "papers":
+                cursor.execute(sql, (self.paper_offset,))
+
+        self.conn.commit()
+        cursor.execute("DETACH DATABASE shard")
+
+        processor.stats["papers_processed"] += shard_result["papers"]
+        processor.merge_expected_state(shard_result["expected_state"])
+        self.paper_offset += shard_result["papers"]
+        self.shards_merged += 1
+
+    def close(self):
+        """Drop the id-map temp tables."""
+        for map_table in MAP_TABLES:
+            self.conn.execute(f"DROP TABLE temp.{map_table}")
+        self.conn.commit()
+
+
+def _chunks(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Cut a record stream into contiguous lists of at most ``size`` records."""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _shard_table_ddl(conn: sqlite3.Connection) -> List[str]:
+    """CREATE TABLE statements of the master schema, without virtual tables (FTS5) and their shadow tables."""
+    tables = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY rowid").fetchall()
+    virtual = [name for name, sql in tables if sql.upper().startswith("CREATE VIRTUAL TABLE")]
+    return [sql for name, sql in tables
+            if name not in virtual and not any(name.startswith(f"{table}_") for table in virtual)]
+
+
+def sharded_ingest(conn: sqlite3.Connection, processor: ScopusRecordProcessor,
+                   records: Iterable[Dict], shard_dir: Path, workers: int = 0,
+                   shard_size: int = 2000, batch_size: int = 1000) -> Dict:
+    """
+    Ingest records with a pool of worker processes and merge the shards in order.
+
+    At most ``2 * workers`` chunks are in flight, so memory stays bounded while
+    the main process merges finished shards as soon as their predecessors are merged.
+
+    Args:
+        conn: Connection to the master database (schema already created)
+        processor: Global record processor holding the entity registries
+        records: Filtered records (list or stream)
+        shard_dir: Directory for temporary shard files
+        workers: Worker processes (0 = one per CPU)
+        shard_size: Records per shard
+        batch_size: BulkWriter batch size inside each worker
+
+    Returns:
+        Summary with shard count, worker count and per-shard timings
+    """
+    workers = workers or os.cpu_count() or 1
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    table_ddl = _shard_table_ddl(conn)
+    merger = ShardMerger(conn, processor)
+    shard_timings = []
+
+    def merge_result(future):
+        result = future.result()
+        merger.merge(result)
+        shard_timings.append(result["seconds"])
+        os.remove(result["shard_path"])
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for shard_index, chunk in enumerate(_chunks(records, shard_size)):
+            shard_path = str(shard_dir / f"shard_{shard_index:05d}.db")
+            pending.append(pool.submit(build_shard, shard_path, table_ddl, chunk,
+                                       processor.scopus_query, batch_size, processor.layout_options()))
+            # Merge strictly in order once the in-flight window is full
+            while len(pending) >= 2 * workers:
+                merge_result(pending.pop(0))
+        for future in pending:
+            merge_result(future)
+    merger.close()
+
+    try:
+        shard_dir.rmdir()
+    except OSError:
+        pass
+
+    return {
+        "workers": workers,
+        "shards": merger.shards_merged,
+        "shard_seconds": shard_timings,
+    }
@@ -0,0 +1,255 @@
+"""
+Exclusion Log Module
+
+Append-only sink for the records excluded by the data quality filters.
+Excluded records carry every column of the original row, and on exports
+where a third of the rows fail a check (usually MISSING_DOI) keeping them
+in a list would hold gigabytes of dicts for the whole run. ExclusionLog
+writes each entry to a JSON Lines file as soon as it is logged and keeps
+only counters and the column names seen in memory. Reports are produced by
+``replay``, which reads the file once and feeds every entry to a set of
+sinks (the streamed JSON log, CSV exports, samples for the text and HTML
+reports).
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Mapping, Optional
+
+# Bookkeeping keys of an exclusion entry (the remaining keys are CSV columns)
+ENTRY_KEYS = ('row_index', 'reason', 'category')
+
+
+class ExclusionLog:
+    """
+    Exclusion entries in an append-only JSONL file.
+
+    Entries are dicts with row_index, reason and category followed by the
+    cleaned CSV columns of the excluded row. ``counts`` holds the number of
+    entries per category and ``fields`` / ``category_fields`` the keys seen,
+    in first-seen order, so report headers need no extra pass. Iterating
+    reads the entries back from disk in logging order.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize exclusion log.
+
+        Args:
+            path: JSONL file to write (replaced when the first entry is logged)
+        """
+        self.path = Path(path)
+        self.counts: Dict[str, int] = {}
+        self.fields: Dict[str, None] = {}
+        self.category_fields: Dict[str, Dict[str, None]] = {}
+        self._file: Optional[IO[str]] = None
+        self._length = 0
+
+    def append(self, entry: Mapping[str, object]):
+        """Write one exclusion entry."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write(json.dumps(entry, ensure_ascii=False))
+        self._file.write('\n')
+
+        category = entry.get('category', 'OTHER')
+        self.counts[category] = self.counts.get(category, 0) + 1
+        self._length += 1
+        category_fields = self.category_fields.setdefault(category, {})
+        for key in entry:
+            if key not in category_fields:
+                category_fields[key] = None
+                self.fields.setdefault(key, None)
+
+    def close(self):
+        """Flush and close the file; entries can be read back afterwards."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.entries()
+
+    def entries(self, category: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Stream the logged entries back from disk.
+
+        Args:
+            category: Only entries of this category (all when None)
+
+        Yields:
+            Exclusion entries in logging order
+        """
+        if self._file is not None:
+            self._file.flush()
+        if not self._length:
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                if category is None or entry.get('category') == category:
+                    yield entry
+
+
+class JsonEntriesSink:
+    """
+    Writes ``document`` as json.dump(..., indent=indent) would, streaming one list.
+
+    The value of ``entries_key`` in ``document`` only marks the position of
+    the list; its items are passed to ``add`` one by one, so the output is
+    byte-identical to dumping the fully built document.
+    """
+
+    def __init__(self, path, document: Mapping[str, object], entries_key: str, indent: int = 2):
+        """
+        Initialize sink and write the keys before the streamed list.
+
+        Args:
+            path: JSON file to write
+            document: Top-level object (key order is kept)
+            entries_key: Key whose list is streamed
+            indent: Indentation step
+        """
+        self.path = Path(path)
+        self.pad, self.item_pad = ' ' * indent, ' ' * (2 * indent)
+        self.indent = indent
+        keys = list(document)
+        position = keys.index(entries_key)
+        self._tail = [(key, document[key]) for key in keys[position + 1:]]
+        self._empty = True
+        self._first_key = True
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write('{')
+        for key in keys[:position + 1]:
+            self._write_key(key)
+            if key != entries_key:
+                self._write_value(document[key])
+
+    def _write_key(self, key: str):
+        self._file.write('\n' if self._first_key else ',\n')
+        self._first_key = False
+        self._file.write(f"{self.pad}{json.dumps(key, ensure_ascii=False)}: ")
+
+    def _write_value(self, value: object):
+        self._file.write(json.dumps(value, indent=self.indent, ensure_ascii=False).replace('\n', '\n' + self.pad))
+
+    def add(self, entry: Mapping[str, object]):
+        """Write the next list item."""
+        self._file.write('[\n' if self._empty else ',\n')
+        self._file.write(self.item_pad + json.dumps(entry, indent=self.indent, ensure_ascii=False)
+                         .replace('\n', '\n' + self.item_pad))
+        self._empty = False
+
+    def close(self):
+        """Close the list, write the remaining keys and close the file."""
+        self._file.write('[]' if self._empty else f'\n{self.pad}]')
+        for key, value in self._tail:
+            self._write_key(key)
+            self._write_value(value)
+        self._file.write('\n}')
+        self._file.close()
+
+
+class CsvEntriesSink:
+    """Writes entries (optionally one category, optionally mapped by ``row``) to a CSV file."""
+
+    def __init__(self, path, fieldnames: List[str], category: Optional[str] = None,
+                 row: Optional[Callable[[Dict], Dict]] = None):
+        """
+        Initialize sink and write the header.
+
+        Args:
+            path: CSV file to write
+            fieldnames: CSV header
+            category: Only write entries of this category (all when None)
+            row: Maps an entry to its CSV row (the entry itself when None)
+        """
+        self.path = Path(path)
+        self.category = category
+        self.row = row
+        self.rows = 0
+        self._file = open(self.path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames)
+        self._writer.writeheader()
+
+    def add(self, entry: Dict):
+        """Write the entry if it belongs to this sink's category."""
+        if self.category is not None and entry.get('category') != self.category:
+            return
+        self._writer.writerow(self.row(entry) if self.row else entry)
+        self.rows += 1
+
+    def close(self):
+        self._file.close()
+
+
+class CategorySamples:
+    """Keeps the first entry of each category, up to ``limit`` entries."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.samples: List[Dict] = []
+        self._categories = set()
+
+    def add(self, entry: Dict):
+        if len(self.samples) < self.limit and entry["category"] not in self._categories:
+            self._categories.add(entry["category"])
+            self.samples.append(entry)
+
+    def close(self):
+        pass
+
+
+class FirstEntries:
+    """Keeps the first ``limit`` entries."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.entries: List[Dict] = []
+
+    def add(self, entry: Dict):
+        if len(self.entries) < self.limit:
+            self.entries.append(entry)
+
+    def close(self):
+        pass
+
+
+def replay(log: 'ExclusionLog', sinks: List) -> int:
+    """
+    Feed every entry of the log to every sink in one pass, then close the sinks.
+
+    Sinks are objects with ``add(entry)`` and ``close()`` (JsonEntriesSink,
+    CsvEntriesSink, CategorySamples, FirstEntries, ...), so all reports are
+    produced from a single read of the exclusion log.
+
+    Args:
+        log: Exclusion log to read
+        sinks: Report sinks
+
+    Returns:
+        Number of entries read
+    """
+    count = 0
+    try:
+        for entry in log:
+            for sink in sinks:
+                sink.add(entry)
+            count += 1
+    finally:
+        for sink in sinks:
+            sink.close()
+    return count
+
+
+def csv_columns(fields: Iterable[str], leading: List[str]) -> List[str]:
+    """``leading`` columns present in ``fields``, then the remaining ones sorted."""
+    remaining = set(fields)
+    ordered = [column for column in leading if column in remaining]
+    remaining.difference_update(ordered)
+    return ordered + sorted(remaining)
@@ -0,0 +1,228 @@
+"""
+Filter Rules Module
+
+Compiles the configured data quality criteria (``data_quality.quality_criteria``)
+into specialized Python predicates. Each rule becomes one inline expression
+in generated source, with the header key of its field resolved once per
+CSV header, so evaluating a row is a single function call without looping
+over rule objects or re-reading the configuration.
+
+Rows are evaluated by one compiled ``reason`` function per header. It runs
+the rules ordered by the rejection rate observed on the first rows of the
+run (most selective first, so rejected rows exit early); when a rule fails,
+only the rules configured before it that were not evaluated yet are
+checked, so the reason is always the first failing rule in configured order
+and every rule is evaluated at most once per row.
+"""
+
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .parsers.headers import HeaderMap, header_map_for
+
+# Criteria applied when none are configured (the filter's historical checks)
+DEFAULT_CRITERIA = {
+    "require_authors": True,
+    "require_author_ids": True,
+    "require_title": True,
+    "require_year": True,
+    "require_doi": False,
+    "require_affiliations": True,
+    "require_abstract": True,
+}
+
+# Rows evaluated rule by rule to observe rejection rates before the ordered predicate is compiled
+SAMPLE_SIZE = 1000
+
+# Field names spelled differently in reasons than field.replace('_', ' ')
+FIELD_LABELS = {"doi": "DOI"}
+
+
+class FilterRule(NamedTuple):
+    """One compiled check: rows whose ``field`` value fails it are excluded with ``reason``."""
+    kind: str       # "require", "min_length", "min_words", "year_range" or "allowlist"
+    field: str      # Filter field name (resolved against the header)
+    reason: str     # "CATEGORY: description"
+    argument: object = None
+
+    @property
+    def category(self) -> str:
+        return self.reason.split(':')[0]
+
+    def failure(self, constant: str) -> str:
+        """Python expression, over ``value``, that is true when the row fails this rule."""
+        if self.kind == "require":
+            # Same test as value.strip() == "": str.isspace and str.strip agree on whitespace
+            return "not value or value.isspace()"
+        if self.kind == "min_length":
+            return f"len((value or '').strip()) < {constant}"
+        if self.kind == "min_words":
+            return f"len((value or '').split()) < {constant}"
+        # year_range and allowlist: membership in a precomputed frozenset
+        if self.kind == "year_range":
+            return f"(value or '').strip() not in {constant}"
+        return f"(value or '').strip().lower() not in {constant}"
+
+    def constant(self) -> object:
+        """Value bound to the rule's constant in the compiled function."""
+        if self.kind == "year_range":
+            first, last = self.argument
+            return frozenset(str(year) for year in range(first, last + 1))
+        if self.kind == "allowlist":
+            return frozenset(value.strip().lower() for value in self.argument)
+        return self.argument
+
+
+def build_rules(criteria: Optional[Mapping[str, object]] = None) -> List[FilterRule]:
+    """
+    Rules for a ``quality_criteria`` mapping, in configured (reason) order.
+
+    ``require_<field>: true`` requires a non-blank field; ``min_title_length``
+    (characters) and ``min_abstract_words`` (words) reject shorter values;
+    ``year_range`` ([first, last]) rejects other years and ``document_types``
+    (list) rejects types not listed, case-insensitively. Blank values count
+    as length 0 and fail year_range/document_types. Keys starting with "_"
+    are comments.
+
+    Args:
+        criteria: Quality criteria (DEFAULT_CRITERIA when None)
+
+    Returns:
+        Enabled rules
+    """
+    criteria = DEFAULT_CRITERIA if criteria is None else criteria
+    rules = []
+    for key, enabled in criteria.items():
+        if key.startswith("require_") and enabled:
+            field = key[len("require_"):]
+            label = FIELD_LABELS.get(field, field.replace('_', ' '))
+            rules.append(FilterRule("require", field, f"MISSING_{field.upper()}: No {label} provided"))
+
+    min_title_length = criteria.get("min_title_length") or 0
+    if min_title_length > 0:
+        rules.append(FilterRule("min_length", "title",
+                                f"SHORT_TITLE: Title shorter than {min_title_length} characters",
+                                min_title_length))
+    min_abstract_words = criteria.get("min_abstract_words") or 0
+    if min_abstract_words > 0:
+        rules.append(FilterRule("min_words", "abstract",
+                                f"SHORT_ABSTRACT: Abstract shorter than {min_abstract_words} words",
+                                min_abstract_words))
+    year_range = criteria.get("year_range")
+    if year_range:
+        first, last = (int(year) for year in year_range)
+        rules.append(FilterRule("year_range", "year",
+                                f"YEAR_OUT_OF_RANGE: Publication year outside {first}-{last}", (first, last)))
+    document_types = criteria.get("document_types")
+    if document_types:
+        rules.append(FilterRule("allowlist", "document_type",
+                                f"EXCLUDED_DOCUMENT_TYPE: Document type not in {', '.join(document_types)}",
+                                tuple(document_types)))
+    return rules
+
+
+class _HeaderPredicates(NamedTuple):
+    """Functions compiled for one CSV header."""
+    failures: Callable  # row -> tuple of per-rule failure flags (sampling)
+    reason: Callable    # row -> reason of the first failing rule in configured order, or None
+
+
+class CompiledFilter:
+    """
+    Quality rules compiled per CSV header into specialized predicates.
+
+    The first ``sample_size`` rows are evaluated rule by rule and their
+    failures counted; the rules are then ordered by rejection count (ties
+    keep the configured order) and ``reason`` is recompiled in that order
+    for the rest of the run. ``rejections`` holds the sampled counts and
+    ``order`` the categories in evaluation order.
+    """
+
+    def __init__(self, rules: Sequence[FilterRule], variations: Mapping[str, Tuple[str, ...]] = None,
+                 sample_size: int = SAMPLE_SIZE):
+        """
+        Initialize compiled filter.
+
+        Args:
+            rules: Rules in configured order
+            variations: Known header spellings of each field (for HeaderMap.resolve_field)
+            sample_size: Rows evaluated rule by rule before the order is fixed
+        """
+        self.rules = list(rules)
+        self.variations = variations or {}
+        self.sample_size = sample_size
+        self.rejections = [0] * len(self.rules)
+        self.sampled = 0
+        self.order: Optional[List[int]] = None
+        self._compiled: Dict[HeaderMap, _HeaderPredicates] = {}
+
+    def reason(self, row: Mapping[str, str]) -> Optional[str]:
+        """
+        Exclusion reason of a row.
+
+        Args:
+            row: CSV row dictionary or ScopusRecord
+
+        Returns:
+            Reason of the first failing rule in configured order, or None if the row passes
+        """
+        header = header_map_for(row)
+        compiled = self._compiled.get(header)
+        if compiled is None:
+            compiled = self._compile(header)
+
+        if self.order is not None:
+            return compiled.reason(row)
+
+        # Sampling: count every failing rule, then fix the order once enough rows were seen
+        failed = compiled.failures(row)
+        reason = None
+        for i, failure in enumerate(failed):
+            if failure:
+                self.rejections[i] += 1
+                if reason is None:
+                    reason = self.rules[i].reason
+        self.sampled += 1
+        if self.sampled >= self.sample_size:
+            self._fix_order()
+        return reason
+
+    def categories(self) -> List[str]:
+        """Rule categories in evaluation order (configured order until the order is fixed)."""
+        indexes = self.order if self.order is not None else range(len(self.rules))
+        return [self.rules[i].category for i in indexes]
+
+    def _fix_order(self):
+        """Order rules by sampled rejections and recompile ``reason`` for every known header."""
+        self.order = sorted(range(len(self.rules)), key=lambda i: -self.rejections[i])
+        for header in list(self._compiled):
+            self._compile(header)
+
+    def _compile(self, header: HeaderMap) -> _HeaderPredicates:
+        """Compile the predicates of one header."""
+        keys = [header.resolve_field(rule.field, self.variations.get(rule.field, ())) for rule in self.rules]
+        namespace = {f"_c{i}": rule.constant() for i, rule in enumerate(self.rules)}
+        namespace.update({f"_r{i}": rule.reason for i, rule in enumerate(self.rules)})
+
+        def value_line(i: int) -> str:
+            return f"    value = row[{keys[i]!r}]" if keys[i] is not None else "    value = None"
+
+        source = ["def failures(row):", "    failed = []"]
+        for i, rule in enumerate(self.rules):
+            source += [value_line(i), f"    failed.append({rule.failure(f'_c{i}')})"]
+        source.append("    return tuple(failed)")
+
+        # Rules in evaluation order; a failing rule first checks the rules configured
+        # before it that come later in evaluation order (the earlier ones passed)
+        order = self.order if self.order is not None else list(range(len(self.rules)))
+        source.append("def reason(row):")
+        for position, i in enumerate(order):
+            source += [value_line(i), f"    if {self.rules[i].failure(f'_c{i}')}:"]
+            for j in sorted(j for j in order[position + 1:] if j < i):
+                source += ["    " + value_line(j), f"        if {self.rules[j].failure(f'_c{j}')}: return _r{j}"]
+            source.append(f"        return _r{i}")
+        source.append("    return None")
+
+        exec(compile("\n".join(source), f"<filter rules {len(self._compiled)}>", "exec"), namespace)
+        compiled = _HeaderPredicates(namespace["failures"], namespace["reason"])
+        self._compiled[header] = compiled
+        return compiled
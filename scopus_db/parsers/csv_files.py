@@ -0,0 +1,79 @@
+"""
+CSV File Loading Module
+
+Reads Scopus CSV exports either in-process or concurrently in a process
+pool. Files are always returned in the order they were given, so callers
+that depend on input order (first-occurrence-wins deduplication, source
+file attribution) behave identically in both modes.
+"""
+
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Mapping, NamedTuple, Optional
+
+from .records import read_records
+
+
+class CSVFileResult(NamedTuple):
+    """Rows and load statistics for one CSV file."""
+    path: str
+    rows: List[Mapping[str, str]]
+    seconds: float
+    error: Optional[str]
+
+
+def read_csv_file(path: str, encoding: str = 'utf-8-sig') -> CSVFileResult:
+    """
+    Decode and parse one CSV file into compact records (see ScopusRecord).
+
+    A read error is reported in ``error`` rather than raised, and the rows
+    parsed before it are kept. OptimalScopusDatabase._iter_csv_records
+    treats a file read in-process the same way: it streams records, so
+    rows read before the error have already been loaded. (Before streaming,
+    a failed file contributed no rows.)
+
+    Args:
+        path: CSV file path
+        encoding: File encoding ('utf-8-sig' strips a BOM)
+
+    Returns:
+        CSVFileResult with rows, elapsed seconds and error message (if any)
+    """
+    start = time.perf_counter()
+    rows = []
+    error = None
+    try:
+        with open(path, 'r', encoding=encoding) as file:
+            rows.extend(read_records(file))
+    except Exception as e:
+        error = str(e)
+    return CSVFileResult(str(path), rows, time.perf_counter() - start, error)
+
+
+def iter_csv_files_parallel(csv_files: List, workers: int,
+                            encoding: str = 'utf-8-sig') -> Iterator[CSVFileResult]:
+    """
+    Read CSV files in a process pool, yielding results in input order.
+
+    At most ``workers + 1`` files are in flight, so memory is bounded by a
+    few files' rows regardless of how many files there are.
+
+    Args:
+        csv_files: CSV file paths
+        workers: Worker process count
+        encoding: File encoding
+
+    Yields:
+        CSVFileResult per file, in the order of ``csv_files``
+    """
+    paths = [str(Path(f)) for f in csv_files]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for path in paths:
+            pending.append(pool.submit(read_csv_file, path, encoding))
+            if len(pending) > workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
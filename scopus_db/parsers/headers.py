@@ -0,0 +1,156 @@
+"""
+CSV Header Resolution Module
+
+Scopus exports are read with csv.DictReader, so every row carries the file's
+header as its keys. Header names can arrive with a UTF-8 BOM or stray quotes
+around them, which is why lookups fall back to fuzzy key matching. HeaderMap
+performs that matching once per distinct header and caches the
+canonical-column -> actual-key answer, so row access afterwards is a single
+dictionary lookup.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+
+class HeaderMap:
+    """
+    Resolves canonical column names against one CSV header.
+
+    Resolution results are cached per column name, so fuzzy matching runs at
+    most once per header rather than once per row.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        """
+        Initialize header map.
+
+        Args:
+            keys: Header keys in file order (as produced by csv.DictReader)
+        """
+        # csv.DictReader uses None as the key for surplus fields
+        self.keys = tuple(key for key in keys if isinstance(key, str))
+        self.positions = {key: i for i, key in enumerate(self.keys)}
+        self._resolved: Dict[object, Optional[str]] = {}
+        self._resolved_fields: Dict[Tuple, Optional[str]] = {}
+
+    def resolve(self, column_name: str, alternatives: Iterable[str] = ()) -> Optional[str]:
+        """
+        Find the key holding a column: exact name, then a key containing it
+        (BOM/quote variants), then the same for each alternative name.
+
+        Args:
+            column_name: Primary column name
+            alternatives: Alternative column names, in order of preference
+
+        Returns:
+            Actual header key, or None if the column is absent
+        """
+        cache_key = (column_name, *alternatives) if alternatives else column_name
+        try:
+            return self._resolved[cache_key]
+        except KeyError:
+            pass
+
+        key = None
+        for name in (column_name, *alternatives):
+            key = self._match(name)
+            if key is not None:
+                break
+        self._resolved[cache_key] = key
+        return key
+
+    def _match(self, name: str) -> Optional[str]:
+        """Exact key match, else the first key containing ``name``."""
+        if name in self.positions:
+            return name
+        for key in self.keys:
+            if name in key:
+                return key
+        return None
+
+    def resolve_field(self, field_name: str, variations: Iterable[str] = ()) -> Optional[str]:
+        """
+        Find the key holding a loosely named field: exact name, then a key
+        containing it case-insensitively, then exact or case-insensitive
+        matches of each variation.
+
+        Args:
+            field_name: Field name (e.g. 'authors')
+            variations: Known header spellings of the field
+
+        Returns:
+            Actual header key, or None if the field is absent
+        """
+        cache_key = (field_name, tuple(variations))
+        try:
+            return self._resolved_fields[cache_key]
+        except KeyError:
+            pass
+
+        key = self._match_field(field_name, cache_key[1])
+        self._resolved_fields[cache_key] = key
+        return key
+
+    def _match_field(self, field_name: str, variations: Tuple[str, ...]) -> Optional[str]:
+        """Uncached resolve_field lookup."""
+        if field_name in self.positions:
+            return field_name
+
+        lowered = field_name.lower()
+        for key in self.keys:
+            if lowered in key.lower():
+                return key
+
+        for variant in variations:
+            if variant in self.positions:
+                return variant
+            for key in self.keys:
+                if variant.lower() == key.lower():
+                    return key
+        return None
+
+    def position(self, column_name: str, alternatives: Iterable[str] = ()) -> Optional[int]:
+        """
+        Column index of a resolved column, for list-based rows.
+
+        Args:
+            column_name: Primary column name
+            alternatives: Alternative column names
+
+        Returns:
+            Zero-based column index, or None if the column is absent
+        """
+        key = self.resolve(column_name, alternatives)
+        return None if key is None else self.positions[key]
+
+
+@lru_cache(maxsize=64)
+def header_map_for_keys(keys: Tuple) -> HeaderMap:
+    """
+    Return the cached HeaderMap for a header.
+
+    Args:
+        keys: Header keys in file order
+
+    Returns:
+        HeaderMap shared by every caller passing the same keys
+    """
+    return HeaderMap(keys)
+
+
+def header_map_for(row: Mapping[str, str]) -> HeaderMap:
+    """
+    Return the cached HeaderMap for a row's header.
+
+    Args:
+        row: CSV row dictionary or ScopusRecord
+
+    Returns:
+        HeaderMap shared by every row with the same header
+    """
+    # ScopusRecords carry their resolved header in the shared schema
+    schema = getattr(row, 'schema', None)
+    if schema is not None:
+        return schema.header
+    return header_map_for_keys(tuple(row))
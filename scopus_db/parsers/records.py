@@ -0,0 +1,180 @@
+"""
+Compact Scopus Record Module
+
+csv.DictReader builds a fresh dict with ~40 keys for every row. ScopusRecord
+instead stores one tuple of values per row and shares a RecordSchema (field
+names, key -> position index and resolved HeaderMap) across all rows of a
+file. Values of low-cardinality columns are interned so repeated journal
+names, publishers and document types are stored once.
+
+ScopusRecord is a read-only Mapping with DictReader semantics (missing
+trailing fields are None), so filter, deduplication and ingestion code that
+uses ``row.get(...)``, ``row[...]`` and ``row.items()`` works unchanged.
+"""
+
+import csv
+import sys
+from collections.abc import Mapping
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Union
+
+from .headers import HeaderMap, header_map_for_keys
+
+
+# Columns with few distinct values across an export; their values are interned
+INTERNED_COLUMNS = (
+    'Document Type',
+    'Language of Original Document',
+    'Publication Stage',
+    'Source title',
+    'Abbreviated Source Title',
+    'Publisher',
+    'Source',
+)
+
+
+class RecordSchema:
+    """Field layout shared by every record read from one CSV header."""
+
+    __slots__ = ('fields', 'keys', 'index', 'header', 'intern_positions')
+
+    def __init__(self, fieldnames: Sequence[str]):
+        """
+        Initialize record schema.
+
+        Args:
+            fieldnames: CSV header row, in file order
+        """
+        self.fields = tuple(fieldnames)
+        # Same key semantics as dict(zip(fieldnames, values)): first-seen
+        # order, last position wins for duplicate names
+        self.keys = tuple(dict.fromkeys(self.fields))
+        self.index = {name: i for i, name in enumerate(self.fields)}
+        self.header: HeaderMap = header_map_for_keys(self.keys)
+
+        positions = set()
+        for column in INTERNED_COLUMNS:
+            key = self.header.resolve(column)
+            if key is not None:
+                positions.add(self.index[key])
+        self.intern_positions = tuple(sorted(positions))
+
+    def record(self, values: List[str]) -> Union['ScopusRecord', Dict]:
+        """
+        Build a record from one parsed CSV row.
+
+        Args:
+            values: Field values from csv.reader
+
+        Returns:
+            ScopusRecord, or a plain DictReader-style dict for the rare row
+            with more fields than the header (surplus values under key None)
+        """
+        width = len(self.fields)
+        if len(values) > width:
+            row = dict(zip(self.fields, values))
+            row[None] = values[width:]
+            return row
+        if len(values) < width:
+            values = values + [None] * (width - len(values))
+
+        intern = sys.intern
+        for i in self.intern_positions:
+            value = values[i]
+            if value:
+                values[i] = intern(value)
+        return ScopusRecord(self, tuple(values))
+
+
+class ScopusRecord(Mapping):
+    """
+    Read-only Scopus CSV row backed by a value tuple and a shared schema.
+
+    Behaves like the dict produced by csv.DictReader for lookups and
+    iteration; ``copy()`` returns a mutable dict for code that edits rows.
+    """
+
+    __slots__ = ('schema', 'data')
+
+    def __init__(self, schema: RecordSchema, data: tuple):
+        self.schema = schema
+        self.data = data
+
+    def __getitem__(self, key):
+        return self.data[self.schema.index[key]]
+
+    def get(self, key, default=None):
+        i = self.schema.index.get(key)
+        return default if i is None else self.data[i]
+
+    def __contains__(self, key):
+        return key in self.schema.index
+
+    def __iter__(self):
+        return iter(self.schema.keys)
+
+    def __len__(self):
+        return len(self.schema.keys)
+
+    def copy(self) -> Dict[str, Optional[str]]:
+        """Return the record as a mutable dict."""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"ScopusRecord({self.copy()!r})"
+
+    def __getstate__(self):
+        return self.schema, self.data
+
+    def __setstate__(self, state):
+        self.schema, self.data = state
+
+
+def read_records(file: TextIO) -> Iterator[Union[ScopusRecord, Dict]]:
+    """
+    Read Scopus records from an open CSV file.
+
+    Equivalent to iterating csv.DictReader(file) (blank lines are skipped,
+    short rows are padded with None) but yields compact ScopusRecords.
+
+    Args:
+        file: Text file opened for reading
+
+    Yields:
+        One record per data row
+    """
+    reader = csv.reader(file)
+    try:
+        fieldnames = next(reader)
+    except StopIteration:
+        return
+
+    make_record = RecordSchema(fieldnames).record
+    for values in reader:
+        if values:
+            yield make_record(values)
+
+
+def record_columns(records: Sequence[Mapping], columns: Sequence[str]) -> Dict[str, Sequence[Optional[str]]]:
+    """
+    Transpose a chunk of records into column -> values (``record.get(column)``).
+
+    When every record is a ScopusRecord of one schema each column is read
+    from the value tuples with a C-level itemgetter, without a Python-level
+    ``get`` per value; other chunks fall back to ``get``.
+
+    Args:
+        records: Records of the chunk
+        columns: Column names to extract
+
+    Returns:
+        Values of each column in record order (None where absent)
+    """
+    schema = getattr(records[0], 'schema', None) if records else None
+    if schema is None or not all(type(record) is ScopusRecord and record.schema is schema for record in records):
+        return {column: [record.get(column) for record in records] for column in columns}
+
+    data = list(map(attrgetter('data'), records))
+    index = schema.index
+    return {column: list(map(itemgetter(index[column]), data)) if column in index else [None] * len(data)
+            for column in columns}
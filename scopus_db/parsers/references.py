@@ -0,0 +1,363 @@
+"""
+Reference Parsing Module
+
+Splits the free-text entries of the Scopus "References" column into
+structured citation fields (authors, title, journal, volume, issue, pages,
+year). Large exports contain millions of references and highly cited works
+recur across thousands of papers, so ReferenceParser memoizes results on the
+raw reference string and recognises the dominant journal-article shape
+without falling through the full heuristic chain. reference_fingerprint
+identifies the cited work behind a reference, so the many occurrences of
+one work can share a single cited_works row.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Field order of a parsed reference tuple (matches the paper_citations columns)
+REFERENCE_FIELDS = ('year', 'authors', 'title', 'journal', 'volume', 'issue', 'pages')
+
+ParsedReference = Tuple[Optional[int], Optional[str], Optional[str], Optional[str],
+                        Optional[str], Optional[str], Optional[str]]
+
+EMPTY_REFERENCE: ParsedReference = (None,) * len(REFERENCE_FIELDS)
+
+DEFAULT_CACHE_SIZE = 32768
+
+_YEAR_ONLY = re.compile(r'^\d{4}$')
+_TRAILING_YEAR = re.compile(r'\((\d{4})\)(?:\s*$)')
+_ANY_YEAR = re.compile(r'\b(19|20)\d{2}\b')
+_PAGES_OR_RANGE = re.compile(r'^pp\.|^\d+-\d+$')
+_PAGES_NUMBER_OR_RANGE = re.compile(r'^pp\.|^\d+$|^\d+-\d+$')
+_PAGE_RANGE = re.compile(r'^\d+-\d+$')
+_PAGES_PREFIX = re.compile(r'pp\.\s*', re.IGNORECASE)
+
+# Known journal abbreviations and patterns (common in academic references),
+# matched against the lowercased part: a single case-sensitive search is
+# several times faster than a dozen IGNORECASE searches. The "Br/Am/Int/Eur
+# ... J" patterns of the original list are implied by the standalone "J".
+_JOURNAL_PATTERN = re.compile(
+    r'\b(?:j|proc|ann|arch)\b'  # Journal abbreviations, proceedings, annals, archives
+    r'|\b(?:nature|science|ieee|acm)\b'  # Major and tech journals
+    r'|\bsci\b.*\brep\b'  # Scientific Reports
+    r'|surgery|medicine|engineering|robotics|manufacturing'
+    r'|transaction|review|letter|hno|bmc'
+)
+
+# Fingerprints: first-author surname letters, word tokens, and the leading run
+# of author segments ("Smith J.", "Choi P.-P.", "Liu J", "Et al.") skipped to
+# reach the title, matched in one pass over the reference
+_SURNAME = re.compile(r'[^\W\d_]+')
+_WORDS = re.compile(r'\w+')
+_INITIALS = r"(?:[^\W\d_]{1,2}\.(?:-?\s?[^\W\d_]{1,2}\.)*|[A-Z]{1,3})"
+_AUTHOR_PREFIX = re.compile(
+    rf"(?:\s*(?:(?=[^,]*[a-z])[^\W\d_][^\W\d_'’\-]*(?:[ '’\-][^\W\d_]+){{0,2}}\s+{_INITIALS}|[Ee]t al\.?)?\s*(?:,|$))*"
+)
+SHINGLE_WORDS = 8
+MIN_SHINGLE_WORDS = 4
+
+_STANDARD_WORDS = ('standard', 'specification', 'guideline', 'principles', 'terminology')
+_STANDARD_KEYWORDS = ('iso ', 'astm ', 'standard', 'specification', 'guideline')
+_JOURNAL_WORDS = ('journal', 'proc', 'lett', 'rev')
+_PUBLISHER_WORDS = ('press', 'publisher', 'books', 'edition')
+
+
+def _clean(value):
+    """Normalize whitespace; empty strings become None."""
+    if value and isinstance(value, str):
+        value = ' '.join(value.split())
+        if value == '':
+            return None
+    return value
+
+
+def _is_journal(part: str) -> bool:
+    """Whether a comma-separated part looks like a journal name."""
+    return _JOURNAL_PATTERN.search(part.lower()) is not None
+
+
+def _canonical_tail(parts) -> Optional[int]:
+    """
+    Index of the journal in the dominant article shape
+    "Authors, Title..., Journal, Volume[, Issue], pp. X-Y", or None.
+
+    Volume/issue parts are skipped by journal detection, so when the part
+    before them is the first journal-like one the numeric tail can be
+    assigned directly.
+    """
+    count = len(parts)
+    if count < 5 or not parts[-1].startswith('pp.') or not parts[-2].isdigit():
+        return None
+    journal_idx = count - 4 if parts[-3].isdigit() else count - 3
+    if journal_idx < 2:
+        return None
+    return journal_idx
+
+
+def parse_reference(reference: str) -> ParsedReference:
+    """
+    Parse an individual reference string into structured components.
+
+    Handles multiple reference formats:
+    - Journal articles: "Authors, Title, Journal, Volume, Issue, pp. Pages, (Year)"
+    - Books: "Authors, Title, (Year)" or "Authors, Title, Publisher, (Year)"
+    - Standards: "Standard Name, Standard Number, (Year)"
+    - Web documents: "Title [WWW Document], (Year)"
+
+    Args:
+        reference: Raw reference text
+
+    Returns:
+        Tuple of values in REFERENCE_FIELDS order
+    """
+    if not reference:
+        return EMPTY_REFERENCE
+    stripped = reference.strip()
+    if len(stripped) < 3:
+        return EMPTY_REFERENCE
+
+    # Handle very short references (data quality issues)
+    if len(stripped) < 10:
+        # Try to extract year if it's just a year
+        if _YEAR_ONLY.match(stripped):
+            return (int(stripped), None, None, None, None, None, None)
+        # For very short text, put it in title
+        if not stripped.isdigit():
+            return (None, None, stripped, None, None, None, None)
+        return EMPTY_REFERENCE
+
+    # Handle truncated references starting with comma
+    if stripped.startswith(','):
+        reference = stripped[1:].strip()
+
+    # Extract year first (usually in parentheses at the end)
+    year = None
+    year_match = _TRAILING_YEAR.search(reference)
+    if year_match:
+        year = int(year_match.group(1))
+        # Remove year from reference for further parsing
+        reference = reference[:year_match.start()].strip().rstrip(',').strip()
+    else:
+        # Try to find year without parentheses
+        year_match = _ANY_YEAR.search(reference)
+        if year_match:
+            year = int(year_match.group())
+
+    # Handle web documents
+    if '[WWW Document]' in reference:
+        # Remove [WWW Document] and treat title as everything before it
+        title = reference.replace('[WWW Document]', '').strip().rstrip(',').strip()
+        return (year, None, title, 'Web Document', None, None, None)
+
+    # Handle references without commas (books, standards, incomplete)
+    if ',' not in reference:
+        # If it looks like a standard title or incomplete reference
+        if any(word in reference.lower() for word in _STANDARD_WORDS):
+            return (year, None, reference, 'Standard/Document', None, None, None)
+        if len(reference.split()) >= 3:  # Reasonable length for a title
+            return (year, None, reference, None, None, None, None)
+        return (year, None, None, None, None, None, None)
+
+    # Split by commas to get components
+    parts = [part.strip() for part in reference.split(',') if part.strip()]
+
+    if len(parts) < 2:
+        # Single part, treat as title
+        return (year, None, reference, None, None, None, None)
+
+    # Detect if this is a standards document
+    joined = ' '.join(parts).lower()
+    if any(keyword in joined for keyword in _STANDARD_KEYWORDS):
+        # Standards format: "Standard Name, Number, (Year)"
+        volume = parts[-1] if parts[-1].isdigit() else None  # Standard number
+        return (year, None, ', '.join(parts[:-1]), 'Standard', volume, None, None)
+
+    # Fast path: the dominant article shape, taken when the part before the
+    # numeric tail is the first journal-like part
+    tail_idx = _canonical_tail(parts)
+    if (tail_idx is not None and not _PAGES_OR_RANGE.match(parts[tail_idx])
+            and _is_journal(parts[tail_idx])):
+        for i in range(1, tail_idx):
+            part = parts[i]
+            if not (part.isdigit() or _PAGES_OR_RANGE.match(part)) and _is_journal(part):
+                break
+        else:
+            issue = parts[-2] if tail_idx == len(parts) - 4 else None
+            volume = parts[-3] if issue else parts[-2]
+            return (year, _clean(parts[0]), _clean(', '.join(parts[1:tail_idx])), _clean(parts[tail_idx]),
+                    volume, issue, _clean(_PAGES_PREFIX.sub('', parts[-1]).strip()))
+
+    # Find journal by looking for known patterns
+    journal_idx = None
+    for i in range(1, len(parts)):
+        part = parts[i]
+
+        # Skip if it's clearly numeric data or pages
+        if part.isdigit() or _PAGES_OR_RANGE.match(part):
+            continue
+
+        if _is_journal(part):
+            journal_idx = i
+            break
+
+    # If no pattern match, use position and content-based heuristic
+    if journal_idx is None:
+        # Journal is usually a short abbreviation or contains specific words after position 1
+        for i in range(2, min(len(parts), 5)):  # Check positions 2-4
+            part = parts[i]
+            if (len(part) > 1 and
+                    not part.isdigit() and
+                    not _PAGES_NUMBER_OR_RANGE.match(part)):
+
+                # Prefer shorter parts (journal abbreviations) or those with journal-like words
+                if (len(part) <= 15 or  # Short abbreviations
+                        len(part.split()) >= 2 or  # Multi-word journal names
+                        any(word in part.lower() for word in _JOURNAL_WORDS)):
+                    journal_idx = i
+                    break
+
+    authors = title = journal = volume = issue = pages = None
+
+    # Parse based on identified journal position
+    if journal_idx is not None and journal_idx >= 2:
+        # Standard format: Author(s), Title, Journal, Volume, Issue, Pages
+        authors = parts[0]
+        title = ', '.join(parts[1:journal_idx])  # Everything between author and journal
+        journal = parts[journal_idx]
+
+        # Process remaining parts for volume, issue, pages
+        for part in parts[journal_idx + 1:]:
+            # Pages (contains 'pp.' or number ranges)
+            if 'pp.' in part.lower():
+                pages = _PAGES_PREFIX.sub('', part).strip()
+            elif _PAGE_RANGE.match(part) and not pages:
+                pages = part
+
+            # Volume (typically first standalone number)
+            elif part.isdigit() and not volume:
+                volume = part
+
+            # Issue (second standalone number)
+            elif part.isdigit() and volume and not issue:
+                issue = part
+
+    # Fallback parsing for books and other formats
+    elif len(parts) >= 3:
+        authors = parts[0]
+        title = parts[1]
+
+        # Check if third part looks like a journal or publisher
+        third_part = parts[2]
+        if (third_part.isdigit() or
+                len(third_part) < 3 or
+                any(word in third_part.lower() for word in _PUBLISHER_WORDS)):
+            # Likely a book with volume/edition or publisher
+            journal = 'Book/Monograph'
+            if third_part.isdigit():
+                volume = third_part
+        else:
+            journal = third_part
+
+        # Look for numeric parts in remaining
+        for part in parts[3:]:
+            if part.isdigit() and not volume:
+                volume = part
+            elif part.isdigit() and volume and not issue:
+                issue = part
+            elif 'pp.' in part.lower() or _PAGE_RANGE.match(part):
+                pages = _PAGES_PREFIX.sub('', part).strip()
+
+    elif len(parts) == 2:
+        # Book format: Author, Title
+        authors, title = parts
+        journal = 'Book/Monograph'
+
+    # Single substantial part
+    elif len(parts[0]) > 10:
+        title = parts[0]
+    else:
+        authors = parts[0]
+
+    # Clean up empty strings and normalize whitespace
+    return (year, _clean(authors), _clean(title), _clean(journal),
+            _clean(volume), _clean(issue), _clean(pages))
+
+
+def surname_key(authors: Optional[str]) -> str:
+    """Lowercased leading letter run of an author name ("Acevedo Reyes D." -> "acevedo")."""
+    match = _SURNAME.search(authors.lower()) if authors else None
+    return match.group() if match else ''
+
+
+def title_words(reference: str, count: int = SHINGLE_WORDS) -> List[str]:
+    """First ``count`` lowercased words of a reference after its author segments."""
+    title = reference[_AUTHOR_PREFIX.match(reference).end():]
+    return _WORDS.findall(title.lower())[:count]
+
+
+def _title_shingle(reference: str) -> List[str]:
+    """Leading word tokens of the title: the text after the author segments."""
+    title = reference[_AUTHOR_PREFIX.match(reference).end():]
+
+    # Very short first segments ("Physicochemical properties, ...") take the next one too
+    words = []
+    for segment in title.split(','):
+        words.extend(_WORDS.findall(segment.lower()))
+        if len(words) >= MIN_SHINGLE_WORDS:
+            break
+    return words[:SHINGLE_WORDS]
+
+
+def reference_fingerprint(reference: str, parsed: ParsedReference) -> str:
+    """
+    Normalized identity of the work a reference cites.
+
+    Combines the first author's surname, the year and a hash of the first
+    SHINGLE_WORDS lowercased words of the title, found by skipping the
+    author segments of the raw reference (the parsed title field often
+    still starts with co-authors). Case, punctuation, co-author initials and
+    journal, volume or page differences between citations of one work
+    collapse to one fingerprint. References without any usable words hash
+    their full text instead.
+
+    Args:
+        reference: Raw reference text
+        parsed: parse_reference result for the reference
+
+    Returns:
+        "surname|year|shingle-hash" fingerprint
+    """
+    year, surname = parsed[0], surname_key(parsed[1])
+    words = _title_shingle(reference) or _WORDS.findall(reference.lower())
+    digest = hashlib.blake2b(' '.join(words).encode('utf-8'), digest_size=8).hexdigest()
+    return f"{surname}|{year or ''}|{digest}"
+
+
+class ReferenceParser:
+    """
+    Memoizing reference parser.
+
+    Results are cached per raw reference string in an LRU of ``cache_size``
+    entries (0 disables the cache). Parsed references are immutable tuples,
+    so cached values can be shared between papers safely.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize reference parser.
+
+        Args:
+            cache_size: Maximum number of memoized references
+        """
+        self.cache_size = cache_size
+        self.parse = lru_cache(maxsize=cache_size)(parse_reference) if cache_size else parse_reference
+
+    def parse_dict(self, reference: str) -> Dict:
+        """Parse a reference into a dict keyed by REFERENCE_FIELDS."""
+        return dict(zip(REFERENCE_FIELDS, self.parse(reference)))
+
+    def cache_info(self):
+        """LRU statistics (hits, misses, maxsize, currsize), or None when uncached."""
+        return self.parse.cache_info() if self.cache_size else None
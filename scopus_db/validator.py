@@ -14,6 +14,8 @@ import csv
 from pathlib import Path
 from collections import defaultdict
 
+from .database.paper_text import register_text_functions
+
 
 class DatabaseValidator:
     """Comprehensive validation suite for Scopus database integrity."""
@@ -46,6 +48,7 @@ class DatabaseValidator:
         # Connect to database
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
+        register_text_functions(self.conn)
         
         # Run test categories
         self.test_paper_count()
@@ -104,13 +107,18 @@ class DatabaseValidator:
         cursor = self.conn.cursor()
         mismatches = []
         
+        # Databases built with database.paper_text keep the abstract in paper_text
+        has_details = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'view' AND name = 'paper_details'").fetchone()
+        papers = "paper_details" if has_details else "papers"
+        
         # Check first 100 papers in detail
         for idx, csv_row in enumerate(self.csv_data[:100]):
             paper_id = idx + 1
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT title, year, doi, cited_by, abstract, source_title,
                        document_type, issn, isbn
-                FROM papers WHERE paper_id = ?
+                FROM {papers} WHERE paper_id = ?
             """, (paper_id,))
             
             db_row = cursor.fetchone()
@@ -179,10 +187,13 @@ class DatabaseValidator:
         """Test 4: Verify keyword parsing and categorization."""
         cursor = self.conn.cursor()
         
-        # Count keywords by type
-        cursor.execute("""
+        # Count keywords by type (compact link tables store integer codes)
+        has_details = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'view' AND name = 'paper_keyword_details'").fetchone()
+        paper_keywords = "paper_keyword_details" if has_details else "paper_keywords"
+        cursor.execute(f"""
             SELECT keyword_type, COUNT(*) as count
-            FROM paper_keywords
+            FROM {paper_keywords}
             GROUP BY keyword_type
         """)
         keyword_counts = {row['keyword_type']: row['count'] for row in cursor.fetchall()}
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures: sample Scopus records, CSV and database helpers, and
+per-test configuration overrides.
+"""
+
+import copy
+import csv
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.config_loader import get_config
+from scopus_db.database.creator import OptimalScopusDatabase
+
+
+SAMPLE_RECORDS = [
+    {
+        'Authors': 'Smith J.; Doe A.',
+        'Author full names': 'Smith, John (111); Doe, Anna (222)',
+        'Author(s) ID': '111; 222',
+        'Title': 'Laser powder bed fusion of steel',
+        'Year': '2021',
+        'DOI': '10.1000/a',
+        'Affiliations': 'Dept. of Engineering, University of Leeds, Leeds, UK; Fraunhofer Institute, Germany',
+        'Author Keywords': 'Additive manufacturing; Powder bed',
+        'Index Keywords': 'Steel; additive manufacturing',
+        'References': 'Smith J., Laser melting, J Mater Process Technol, 12, 3, pp. 1-10, (2019); ISO 52900, Standard terminology, (2015)',
+        'Funding Details': 'National Science Foundation, NSF 12345',
+        'Chemicals/CAS': 'iron, 7439-89-6',
+        'Correspondence Address': 'J. Smith; University of Leeds; email: j.smith@leeds.ac.uk',
+        'Open Access': 'All Open Access; Gold Open Access',
+        'Publisher': 'Elsevier',
+    },
+    {
+        'Authors': 'Doe A.; Lee K.',
+        'Author full names': 'Doe, Anna (222); Lee, Kim (333)',
+        'Author(s) ID': '222; 333',
+        'Title': 'Binder jetting review',
+        'Year': '2022',
+        'DOI': '10.1000/b',
+        'Affiliations': 'Fraunhofer Institute, Germany',
+        'Author Keywords': 'Steel',
+        'Index Keywords': 'Binder jetting',
+        'References': '',
+        'Publisher': 'Springer',
+    },
+]
+
+
+class CollectingWriter:
+    """Writer stub that records the order rows are produced in."""
+
+    def __init__(self):
+        self.rows = []
+
+    def add(self, table, values):
+        self.rows.append((table, values))
+
+
+def _record(doi, title, abstract='An abstract'):
+    return {
+        'Authors': 'Smith J.',
+        'Author(s) ID': '111',
+        'Title': title,
+        'Year': '2021',
+        'DOI': doi,
+        'Affiliations': 'University of Leeds, Leeds, UK',
+        'Abstract': abstract,
+    }
+
+
+def _write_csv(path: Path, records):
+    """Write records to a CSV whose columns are every key, in first-seen order."""
+    fieldnames = list(dict.fromkeys(key for record in records for key in record))
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _dump(db_path: Path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return list(conn.iterdump())
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def sample_records():
+    """Two records covering every entity and relationship table (a fresh copy per test)."""
+    return copy.deepcopy(SAMPLE_RECORDS)
+
+
+@pytest.fixture
+def make_record():
+    """Factory of minimal records that pass the default quality filter: make_record(doi, title, abstract)."""
+    return _record
+
+
+@pytest.fixture
+def write_csv():
+    """Writes records to a CSV file: write_csv(path, records)."""
+    return _write_csv
+
+
+@pytest.fixture
+def dump_database():
+    """SQL dump of a database, for comparing builds: dump_database(db_path)."""
+    return _dump
+
+
+@pytest.fixture
+def collecting_writer():
+    """Writer stub class recording (table, values) rows."""
+    return CollectingWriter
+
+
+@pytest.fixture
+def config_settings(monkeypatch):
+    """
+    Override configuration keys for the current test: config_settings(key=value, ...).
+
+    Keys of the database section are set there, any other key in the
+    performance section. Overrides stay in effect until the test ends.
+    """
+    database = get_config().get_database_config()
+    performance = get_config().get_performance_config()
+
+    def apply(**settings):
+        for key, value in settings.items():
+            monkeypatch.setitem(database if key in database else performance, key, value)
+    return apply
+
+
+@pytest.fixture
+def build_database(config_settings):
+    """
+    Build a database from records without filtering: build_database(records, directory, **settings).
+
+    ``settings`` are applied with config_settings before the build.
+    """
+    def build(records, directory: Path, **settings) -> Path:
+        config_settings(**settings)
+        csv_path = directory / "scopus.csv"
+        _write_csv(csv_path, records)
+
+        creator = OptimalScopusDatabase(str(csv_path), enable_data_filtering=False)
+        creator.create_optimal_schema()
+        creator.process_csv_to_optimal_db()
+        creator.conn.close()
+        return creator.db_path
+    return build
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the materialized collaboration, co-occurrence and trend tables.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.database.analytics_tables import analytics_tables, build_analytics_tables
+
+TABLES = ["author_collaborations", "keyword_cooccurrence", "temporal_trends"]
+
+
+@pytest.fixture
+def records(sample_records):
+    """A third paper repeats the Smith-Doe collaboration two years later."""
+    return sample_records + [dict(sample_records[0], Title='Powder reuse', Year='2023', DOI='10.1000/c')]
+
+
+def _rows(conn, table):
+    return conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2, 3").fetchall()
+
+
+def test_enabled_tables_follow_config_flags():
+    assert analytics_tables({}) == TABLES
+    assert analytics_tables({'compute_collaborations': False}) == ["keyword_cooccurrence", "temporal_trends"]
+    assert analytics_tables({'include_analytics_tables': False, 'compute_collaborations': True}) == []
+
+
+def test_build_materializes_pair_and_trend_counts(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(records, Path(tmp)))
+
+        # Smith (1) and Doe (2) co-authored papers 1 and 3; Doe and Lee (3) paper 2
+        assert _rows(conn, "author_collaborations") == [(1, 2, 2, 2.0, 2021, 2023), (2, 3, 1, 1.0, 2022, 2022)]
+
+        # "additive manufacturing" is both an author and an index keyword of papers 1 and 3 and
+        # counts once per paper; paper 2 adds one pair of its own
+        counts = sorted(count for _, _, count in _rows(conn, "keyword_cooccurrence"))
+        assert counts == [1, 2, 2, 2]
+
+        assert conn.execute("SELECT year, paper_count FROM temporal_trends WHERE entity_type = 'author' "
+                            "AND entity_id = 2 ORDER BY year").fetchall() == [(2021, 1), (2022, 1), (2023, 1)]
+        conn.close()
+
+
+def test_spilled_counts_match_in_memory_counts(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(records, Path(tmp)))
+        in_memory = {table: _rows(conn, table) for table in TABLES}
+
+        for table in TABLES:
+            conn.execute(f"DELETE FROM {table}")
+        # A zero budget spills after every new key
+        report = build_analytics_tables(conn, TABLES, memory_limit_mb=0)
+
+        assert all(spills > 1 for spills in report["spills"].values())
+        assert {table: _rows(conn, table) for table in TABLES} == in_memory
+        conn.close()
+
+
+def test_pair_limit_skips_and_counts_large_papers(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(records, Path(tmp)))
+        for table in TABLES:
+            conn.execute(f"DELETE FROM {table}")
+
+        # Papers 1 and 3 have three distinct keywords, paper 2 two; every paper has two authors
+        report = build_analytics_tables(conn, TABLES, max_pair_entities=2)
+
+        assert report["skipped"] == {"author_collaborations": 0, "keyword_cooccurrence": 2}
+        assert [count for _, _, count in _rows(conn, "keyword_cooccurrence")] == [1]
+        assert len(_rows(conn, "author_collaborations")) == 2
+        conn.close()
+
+
+def test_analytics_tables_can_be_disabled(sample_records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(sample_records, Path(tmp), include_analytics_tables=False))
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert not tables & set(TABLES)
+        conn.close()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for resolving references to papers of the same database.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db import ScopusDB
+from scopus_db.database.citation_resolver import CitationResolver, normalize_doi
+
+
+@pytest.fixture
+def records(sample_records):
+    """
+    Paper 1 cites paper 2 by author, year and title; paper 3 cites paper 1 by
+    DOI (with a different year) and paper 2 under a different title.
+    """
+    return [
+        dict(sample_records[0], References=sample_records[0]['References'] +
+             '; Doe A., Lee K., BINDER JETTING REVIEW, Addit. Manuf., 5, pp. 1-9, (2022)'),
+        sample_records[1],
+        dict(sample_records[1], Title='Powder spreading', DOI='10.1000/c',
+             References='Smith J., Doe A., Powder bed fusion, Addit Manuf, 3, (2020), DOI: 10.1000/A; '
+                        'Doe A., Lee K., Binder jetting of ceramics, Addit Manuf, 5, (2022)'),
+    ]
+
+
+def test_normalize_doi():
+    assert normalize_doi('https://doi.org/10.1000/ABC.') == '10.1000/abc'
+    assert normalize_doi('Smith J., Title, (2019)') is None
+    assert normalize_doi(None) is None
+
+
+def test_resolver_matches_title_prefix_and_adjacent_year():
+    conn = sqlite3.connect(':memory:')
+    conn.executescript("""
+        CREATE TABLE papers (paper_id INTEGER PRIMARY KEY, title TEXT, year INTEGER, doi TEXT);
+        CREATE TABLE paper_authors (paper_id INTEGER, author_id INTEGER, position INTEGER);
+        CREATE TABLE authors_master (author_id INTEGER PRIMARY KEY, abbreviated_name TEXT);
+        INSERT INTO papers VALUES (1, 'Laser welding of steel: a review of defects', 2021, NULL),
+                                  (2, 'Laser welding', 2021, NULL);
+        INSERT INTO authors_master VALUES (1, 'Smith J.');
+        INSERT INTO paper_authors VALUES (1, 1, 1), (2, 1, 1);
+    """)
+    resolver = CitationResolver(conn)
+
+    # Both titles prefix this reference (cited a year early); the longer agreement wins
+    assert resolver.resolve('Smith J., Laser Welding of Steel, a review of defects and more, J X, (2020)',
+                            2020, 'Smith J.') == 1
+    assert resolver.resolve('Smith J., Laser welding, J X, (2021)', 2021, 'Smith J.') == 2
+    assert resolver.resolve('Smith J., Laser welding of steel, J X, (2017)', 2017, 'Smith J.') is None
+    assert resolver.resolve('Jones J., Laser welding, J X, (2021)', 2021, 'Jones J.') is None
+
+
+def test_resolved_citations_form_citation_graph(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = build_database(records, Path(tmp))
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT citing_paper_id, cited_paper_id, position FROM citation_graph "
+                            "ORDER BY citing_paper_id, position").fetchall() == [(1, 2, 3), (3, 1, 1)]
+        conn.close()
+
+        assert ScopusDB.get_citation_graph(str(db_path)) == {1: [2], 3: [1]}
+
+
+def test_cited_works_layout_resolves_works(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(records, Path(tmp), cited_works=True))
+        assert conn.execute("SELECT citing_paper_id, cited_paper_id FROM citation_graph "
+                            "ORDER BY citing_paper_id, position").fetchall() == [(1, 2), (3, 1)]
+        conn.close()
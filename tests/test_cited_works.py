@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the cited_works citation layout.
+"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def records(sample_records):
+    """The first record cites the same work with different capitalization and journal abbreviation."""
+    return [
+        dict(sample_records[0], References=sample_records[0]['References'] +
+             '; Smith J., LASER MELTING, J. Mater. Process. Technol., 12, pp. 1-10, (2019)'),
+        dict(sample_records[1], References='Smith J., Laser melting, J Mater Process Technol, 12, 3, pp. 1-10, (2019); '
+                                           'Smith J., Laser melting, J Mater Process Technol, 14, 1, pp. 5-9, (2021)'),
+    ]
+
+
+def test_cited_works_deduplicates_and_counts_citations(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(records, Path(tmp), cited_works=True))
+
+        works = conn.execute(
+            "SELECT cited_work_id, reference_year, reference_journal, citation_count "
+            "FROM cited_works ORDER BY cited_work_id").fetchall()
+        assert works == [
+            (1, 2019, 'J Mater Process Technol', 3),
+            (2, 2015, 'Standard', 1),
+            (3, 2021, 'J Mater Process Technol', 1),
+        ]
+        assert conn.execute("SELECT citing_paper_id, cited_work_id, position FROM paper_citations "
+                            "ORDER BY citing_paper_id, position").fetchall() == [
+            (1, 1, 1), (1, 2, 2), (1, 1, 3), (2, 1, 1), (2, 3, 2)]
+
+        # The compatibility view restores the inline columns
+        assert conn.execute("SELECT reference_title, reference_volume, position FROM paper_citation_details "
+                            "WHERE citing_paper_id = 2 ORDER BY position").fetchall() == [
+            ('Laser melting', '12', 1), ('Laser melting', '14', 2)]
+        conn.close()
+
+
+def test_sharded_cited_works_build_matches_serial_build(records, build_database, dump_database):
+    records = records + [dict(records[1], DOI=f'10.1000/x{i}') for i in range(3)]
+    with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as sharded_dir:
+        serial_db = build_database(records, Path(serial_dir), cited_works=True)
+        sharded_db = build_database(records, Path(sharded_dir), cited_works=True,
+                                    parallel_processing=True, workers=2, shard_size=1)
+
+        assert dump_database(sharded_db) == dump_database(serial_db)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk exclusion log of the data quality filters.
+"""
+
+import csv
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.data_quality_filter_simple import ScopusDataQualityFilter
+from scopus_db.exclusion_log import CsvEntriesSink, ExclusionLog, JsonEntriesSink, replay
+
+
+def test_streamed_json_matches_json_dump():
+    entries = [{"row_index": 1, "nested": {"a": [1, 2]}, "text": "é"}, {"row_index": 2, "empty": []}]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "report.json"
+        for items in (entries, []):
+            document = {"summary": {"total": 2}, "exclusions": items, "log_file": "x.json"}
+            sink = JsonEntriesSink(path, dict(document, exclusions=None), "exclusions")
+            for entry in items:
+                sink.add(entry)
+            sink.close()
+            assert path.read_text(encoding='utf-8') == json.dumps(document, indent=2, ensure_ascii=False)
+
+
+def test_log_keeps_counters_and_reads_entries_back():
+    with tempfile.TemporaryDirectory() as tmp:
+        log = ExclusionLog(Path(tmp) / "exclusions.jsonl")
+        assert not log and list(log) == []
+        log.append({"row_index": 1, "reason": "MISSING_DOI: x", "category": "MISSING_DOI", "title": "A"})
+        log.append({"row_index": 2, "reason": "MISSING_TITLE: x", "category": "MISSING_TITLE", "doi": "10.1/b"})
+        log.close()
+
+        assert len(log) == 2
+        assert log.counts == {"MISSING_DOI": 1, "MISSING_TITLE": 1}
+        assert list(log.fields) == ["row_index", "reason", "category", "title", "doi"]
+        assert [entry["row_index"] for entry in log.entries("MISSING_TITLE")] == [2]
+
+        # One pass feeds every sink
+        sinks = [CsvEntriesSink(Path(tmp) / "all.csv", list(log.fields)),
+                 CsvEntriesSink(Path(tmp) / "doi.csv", list(log.fields), category="MISSING_DOI")]
+        assert replay(log, sinks) == 2
+        assert [sink.rows for sink in sinks] == [2, 1]
+
+
+def test_filter_reports_are_written_from_the_log(make_record):
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "exclusions.json"
+        data_filter = ScopusDataQualityFilter(log_path=str(log_path))
+        records = [make_record(f'10.1/{i}', f'Paper {i}', abstract='' if i % 2 else 'An abstract') for i in range(30)]
+        included = list(data_filter.filter_records(records))
+
+        assert len(included) == 15
+        assert data_filter.report["exclusions"] is data_filter.exclusion_log
+        assert [entry['row_index'] for entry in data_filter.report["exclusions"]] == list(range(2, 31, 2))
+        assert log_path.with_suffix('.jsonl').exists()
+
+        saved = json.loads(log_path.read_text(encoding='utf-8'))
+        assert [entry['row_index'] for entry in saved['exclusions']] == list(range(2, 31, 2))
+        assert list(saved)[-2:] == ['exclusions', 'log_file']
+
+        with open(log_path.with_suffix('.missing_abstract.csv'), encoding='utf-8') as f:
+            assert len(list(csv.DictReader(f))) == 15
+
+
+def test_each_filter_run_starts_from_empty_statistics_and_log(make_record):
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "exclusions.json"
+        data_filter = ScopusDataQualityFilter(log_path=str(log_path))
+        list(data_filter.filter_records([make_record(f'10.1/{i}', f'Paper {i}', abstract='') for i in range(4)]))
+        records = [make_record(f'10.1/{i}', f'Paper {i}', abstract='' if i == 1 else 'An abstract') for i in range(3)]
+        included = list(data_filter.filter_records(records))
+
+        assert len(included) == 2
+        assert data_filter.report["summary"]["total_records"] == 3
+        assert data_filter.report["summary"]["excluded_records"] == 1
+        assert data_filter.report["exclusion_breakdown"] == {"MISSING_ABSTRACT": 1}
+        assert len(data_filter.exclusion_log) == 1
+        assert data_filter.exclusion_log.counts == {"MISSING_ABSTRACT": 1}
+
+        saved = json.loads(log_path.read_text(encoding='utf-8'))
+        assert saved["summary"]["total_records"] == 3
+        assert [entry['row_index'] for entry in saved['exclusions']] == [2]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the column-oriented batch path of the full data quality filter.
+"""
+
+import csv
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.data_quality_filter import BATCH_REASONS, EXCLUSION_CHECKS, ScopusDataQualityFilter
+from scopus_db.parsers.records import read_records, record_columns
+
+
+def _rows():
+    complete = {column: 'value' for column, _ in EXCLUSION_CHECKS}
+    rows = [dict(complete)]
+    for column, _ in EXCLUSION_CHECKS:
+        for blank in ('', '  ', '\t\n', ' ', None):
+            rows.append(dict(complete, **{column: blank}))
+        missing = dict(complete)
+        del missing[column]
+        rows.append(missing)
+    # Several blank fields: the first check in priority order wins
+    rows.append(dict(complete, Title='', DOI=' ', Abstract=None))
+    rows.append(dict(complete, Abstract='', Year=' '))
+    return rows
+
+
+def test_filter_batch_matches_should_exclude_record():
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = _rows()
+        columns = record_columns(rows, [column for column, _ in EXCLUSION_CHECKS])
+        for enabled in (True, False):
+            data_filter = ScopusDataQualityFilter(enable_filtering=enabled, log_path=str(Path(tmp) / "log.json"))
+            expected = [data_filter.should_exclude_record(row, i) for i, row in enumerate(rows, 1)]
+            codes = data_filter.filter_batch(columns)
+            assert [code > 0 for code in codes] == [exclude for exclude, _ in expected]
+            if enabled:
+                assert [BATCH_REASONS[code] for code in codes] == [reason for _, reason in expected]
+
+        # A column absent from the chunk fails every row that passed the earlier checks
+        del columns['Year']
+        assert data_filter.filter_batch(columns) == [0] * len(rows)
+        data_filter.enable_filtering = True
+        codes = data_filter.filter_batch(columns)
+        assert set(codes) == {1, 2, 3, 4} and codes[0] == 4
+
+
+def test_filter_csv_data_gives_same_result_for_dicts_and_records():
+    rows = _rows()
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=[column for column, _ in EXCLUSION_CHECKS])
+    writer.writeheader()
+    writer.writerows(rows)
+    text = buffer.getvalue()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, data in (("dicts", list(csv.DictReader(io.StringIO(text)))),
+                           ("records", list(read_records(io.StringIO(text))))):
+            data_filter = ScopusDataQualityFilter(log_path=str(Path(tmp) / f"{name}.json"))
+            filtered, report = data_filter.filter_csv_data(data)
+            results.append((len(filtered), data_filter.stats["exclusion_reasons"]))
+
+    assert results[0] == results[1]
+    assert results[0][0] == 1
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the config-driven compiled quality filter rules.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.data_quality_filter_simple import FIELD_VARIATIONS, ScopusDataQualityFilter
+from scopus_db.filter_rules import CompiledFilter, build_rules
+from scopus_db.parsers.headers import header_map_for
+
+LEGACY_FIELDS = ["authors", "author_ids", "title", "year", "affiliations", "abstract"]
+
+
+def _legacy_reason(row):
+    """Previous hard-coded should_exclude_record checks."""
+    header = header_map_for(row)
+    for field in LEGACY_FIELDS:
+        key = header.resolve_field(field, FIELD_VARIATIONS.get(field, ()))
+        value = row[key] if key is not None else ""
+        if not value or value.strip() == "":
+            return f"MISSING_{field.upper()}: No {field.replace('_', ' ')} provided"
+    return None
+
+
+def _rows(make_record):
+    rows = [make_record('10.1/a', 'Complete')]
+    for column in ('Authors', 'Author(s) ID', 'Title', 'Year', 'Affiliations', 'Abstract', 'DOI'):
+        for blank in ('', ' \t', None):
+            rows.append(dict(make_record('10.1/b', 'Blank'), **{column: blank}))
+    rows.append(dict(make_record('', 'Two blanks'), Authors='', Abstract=''))
+    # Other header spellings and a missing column
+    rows.append({'Author Names': 'Smith J.', 'Scopus Author ID': '1', 'Article Title': 'T',
+                 'Publication Year': '2021', 'Author Affiliations': 'Uni', 'Summary': 'Text'})
+    rows.append({'Authors': 'Smith J.', 'Author(s) ID': '1', 'Title': 'T', 'Year': '2021', 'Abstract': 'A'})
+    return rows
+
+
+def test_default_rules_match_hard_coded_checks(make_record):
+    data_filter = ScopusDataQualityFilter(log_path="unused.json")
+    rows = _rows(make_record)
+    data_filter.rule_filter.sample_size = 5  # compile the ordered predicate part way through
+    expected = [_legacy_reason(row) for row in rows]
+    assert [data_filter.rule_filter.reason(row) for row in rows] == expected
+    assert data_filter.rule_filter.order is not None
+    assert [data_filter.should_exclude_record(row, 1)[1] or None for row in rows] == expected
+
+
+def test_additional_rules_and_observed_order(make_record):
+    criteria = {"_note": "comment", "require_title": True, "require_doi": True, "require_abstract": False,
+                "min_title_length": 10, "min_abstract_words": 3, "year_range": [2010, 2020],
+                "document_types": ["Article", "Review"]}
+    rules = build_rules(criteria)
+    assert [rule.category for rule in rules] == ["MISSING_TITLE", "MISSING_DOI", "SHORT_TITLE", "SHORT_ABSTRACT",
+                                                 "YEAR_OUT_OF_RANGE", "EXCLUDED_DOCUMENT_TYPE"]
+
+    def row(**fields):
+        record = make_record('10.1/x', 'A sufficiently long title', abstract='Three word abstract')
+        record.update({'Year': '2015', 'Document Type': 'Article'}, **fields)
+        return record
+
+    compiled = CompiledFilter(rules, FIELD_VARIATIONS, sample_size=4)
+    # Sample: every row is a wrong document type, two also lack a DOI
+    for doi in ('', '', '10.1/y', '10.1/z'):
+        compiled.reason(row(DOI=doi, **{'Document Type': 'Editorial'}))
+    assert compiled.rejections == [0, 2, 0, 0, 0, 4]
+    assert compiled.categories()[:2] == ["EXCLUDED_DOCUMENT_TYPE", "MISSING_DOI"]
+
+    # Reasons keep the configured order whatever the evaluation order
+    assert compiled.reason(row(DOI='', **{'Document Type': 'Letter'})) == "MISSING_DOI: No DOI provided"
+    assert compiled.reason(row(Title='Short')).startswith("SHORT_TITLE")
+    assert compiled.reason(row(Abstract='Too short')).startswith("SHORT_ABSTRACT")
+    assert compiled.reason(row(Year='2021')).startswith("YEAR_OUT_OF_RANGE")
+    assert compiled.reason(row(Year='')).startswith("YEAR_OUT_OF_RANGE")
+    assert compiled.reason(row(**{'Document Type': ' review '})) is None
+    assert compiled.reason(row(Abstract='')).startswith("SHORT_ABSTRACT")
+
+
+class _CountingRow(dict):
+    """Row that counts how often each column is read."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = {}
+
+    def __getitem__(self, key):
+        self.reads[key] = self.reads.get(key, 0) + 1
+        return super().__getitem__(key)
+
+
+def test_ordered_rules_read_each_column_once(make_record):
+    criteria = {"require_title": True, "require_doi": True, "min_abstract_words": 3, "year_range": [2010, 2020]}
+    rules = build_rules(criteria)
+    ordered = CompiledFilter(rules, FIELD_VARIATIONS, sample_size=1)
+    ordered.rejections = list(range(len(rules)))  # evaluate in reverse configured order
+    ordered._fix_order()
+    assert ordered.categories() == ["YEAR_OUT_OF_RANGE", "SHORT_ABSTRACT", "MISSING_DOI", "MISSING_TITLE"]
+    sampling = CompiledFilter(rules, FIELD_VARIATIONS, sample_size=10 ** 6)
+
+    for title in ('', 'Title'):
+        for doi in ('', '10.1/a'):
+            for abstract in ('Too short', 'A long enough abstract'):
+                for year in ('2009', '2015'):
+                    row = _CountingRow(make_record(doi, title, abstract=abstract), Year=year)
+                    assert ordered.reason(row) == sampling.reason(dict(row))
+                    assert max(row.reads.values()) == 1
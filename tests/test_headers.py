@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tests for cached CSV header resolution.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.data_quality_filter_simple import FIELD_VARIATIONS
+from scopus_db.parsers.headers import HeaderMap, header_map_for
+
+
+def test_resolves_bom_quote_and_alternative_columns():
+    header = HeaderMap(['\ufeffAuthors', '"Title"', 'Chemical', 'Year', None])
+
+    assert header.resolve('Authors') == '\ufeffAuthors'
+    assert header.resolve('Title') == '"Title"'
+    assert header.resolve('Chemicals/CAS', ['Chemical']) == 'Chemical'
+    assert header.resolve('Tradenames', ['Trade Names']) is None
+    assert header.position('Year') == 3
+
+    assert header.resolve_field('authors', FIELD_VARIATIONS['authors']) == '\ufeffAuthors'
+    assert header.resolve_field('abstract', FIELD_VARIATIONS['abstract']) is None
+
+
+def test_rows_with_same_header_share_one_map():
+    first = {'Authors': 'Smith J.', 'Title': 'A'}
+    second = {'Authors': 'Doe A.', 'Title': 'B'}
+    other = {'Title': 'C', 'Authors': 'Lee K.'}
+
+    assert header_map_for(first) is header_map_for(second)
+    assert header_map_for(first) is not header_map_for(other)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact WITHOUT ROWID link table layout and its migration.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db import ScopusDB
+from scopus_db.database.link_tables import compact_link_tables, is_compact, link_table_report
+
+LINK_QUERIES = {
+    "paper_authors": "SELECT * FROM paper_authors ORDER BY paper_id, author_id",
+    "paper_keywords": "SELECT * FROM {keywords} ORDER BY paper_id, keyword_id, keyword_type",
+    "paper_institutions": "SELECT * FROM paper_institutions ORDER BY paper_id, institution_id",
+}
+
+
+def _links(db_path: Path):
+    conn = sqlite3.connect(db_path)
+    keywords = "paper_keyword_details" if is_compact(conn) else "paper_keywords"
+    # Flags are 0 rather than NULL in the compact layout
+    links = {table: [tuple(0 if value is None else value for value in row)
+                     for row in conn.execute(sql.format(keywords=keywords))]
+             for table, sql in LINK_QUERIES.items()}
+    conn.close()
+    return links
+
+
+def test_compact_build_stores_the_same_links(sample_records, build_database):
+    with tempfile.TemporaryDirectory() as default_dir, tempfile.TemporaryDirectory() as compact_dir:
+        default_db = build_database(sample_records, Path(default_dir), compact_link_tables=False)
+        compact_db = build_database(sample_records, Path(compact_dir), compact_link_tables=True)
+
+        conn = sqlite3.connect(compact_db)
+        assert is_compact(conn)
+        assert {row[0] for row in conn.execute("SELECT DISTINCT keyword_type FROM paper_keywords")} == {0, 1}
+        conn.close()
+        assert _links(compact_db) == _links(default_db)
+
+
+def test_migration_matches_compact_build(sample_records, build_database, dump_database):
+    with tempfile.TemporaryDirectory() as default_dir, tempfile.TemporaryDirectory() as compact_dir:
+        migrated_db = build_database(sample_records, Path(default_dir), compact_link_tables=False)
+        compact_db = build_database(sample_records, Path(compact_dir), compact_link_tables=True)
+
+        conn = sqlite3.connect(migrated_db)
+        result = compact_link_tables(conn)
+        assert result['rows']['paper_authors'] == conn.execute("SELECT COUNT(*) FROM paper_authors").fetchone()[0]
+        # A second run finds nothing to convert
+        assert compact_link_tables(conn)['tables'] == []
+        report = link_table_report(conn, repeat=1)
+        assert set(report['query_ms']) and report['db_mb'] > 0
+        conn.close()
+
+        # Same schema and rows; only the order of the sqlite_stat1 rows differs
+        assert sorted(dump_database(migrated_db)) == sorted(dump_database(compact_db))
+
+
+def test_sharded_compact_build_matches_serial_build(sample_records, build_database, dump_database):
+    with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as sharded_dir:
+        serial_db = build_database(sample_records, Path(serial_dir), compact_link_tables=True)
+        sharded_db = build_database(sample_records, Path(sharded_dir), compact_link_tables=True, parallel_processing=True, workers=2, shard_size=1)
+        assert dump_database(sharded_db) == dump_database(serial_db)
+
+
+def test_search_survives_migration(sample_records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = build_database(sample_records, Path(tmp), compact_link_tables=False, full_text_search=True)
+        before = ScopusDB.search(str(db_path), "author_keywords:steel")
+
+        conn = sqlite3.connect(db_path)
+        compact_link_tables(conn)
+        conn.close()
+
+        assert before and ScopusDB.search(str(db_path), "author_keywords:steel") == before
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for precomputed author and institution metrics.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.database.metrics import compute_entity_metrics
+
+AUTHOR_METRICS = ("SELECT author_id, total_papers, total_citations, h_index, first_author_papers, "
+                  "last_author_papers FROM authors_master ORDER BY author_id")
+
+
+@pytest.fixture
+def records(sample_records):
+    """Doe (author 2) writes every paper; citations 10, 3 and 2 give an h-index of 2."""
+    return [
+        dict(sample_records[0], **{'Cited by': '10'}),
+        dict(sample_records[1], **{'Cited by': '3'}),
+        dict(sample_records[1], Title='Binder jetting of ceramics', DOI='10.1000/c', **{'Cited by': '2'}),
+    ]
+
+
+def test_build_stores_author_and_institution_metrics(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(records, Path(tmp)))
+
+        assert conn.execute(AUTHOR_METRICS).fetchall() == [
+            (1, 1, 10, 1, 1, 0),
+            (2, 3, 15, 2, 2, 1),
+            (3, 2, 5, 2, 0, 2),
+        ]
+        # Fraunhofer is listed on all three papers
+        assert conn.execute("SELECT canonical_name, paper_count, total_citations FROM institutions_master "
+                            "ORDER BY paper_count DESC LIMIT 1").fetchone()[1:] == (3, 15)
+        conn.close()
+
+
+def test_recompute_follows_changed_citations(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(records, Path(tmp)))
+        conn.execute("UPDATE papers SET cited_by = 20 WHERE paper_id = 3")
+
+        report = compute_entity_metrics(conn)
+
+        assert report["authors"] == 3
+        assert conn.execute(AUTHOR_METRICS).fetchall() == [
+            (1, 1, 10, 1, 1, 0),
+            (2, 3, 33, 3, 2, 1),
+            (3, 2, 23, 2, 0, 2),
+        ]
+        conn.close()
+
+
+def test_incremental_recompute_matches_full_recompute(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(build_database(records[:2], Path(tmp)))
+        institution_id = conn.execute("SELECT institution_id FROM institutions_master "
+                                      "WHERE canonical_name LIKE 'Fraunhofer%'").fetchone()[0]
+        # Append the third record's paper by Doe (2) and Lee (3)
+        conn.execute("INSERT INTO papers (paper_id, title, cited_by) VALUES (3, 'Binder jetting of ceramics', 2)")
+        conn.executemany("INSERT INTO paper_authors (paper_id, author_id, position, first_author, last_author) "
+                         "VALUES (?, ?, ?, ?, ?)", [(3, 2, 1, 1, 0), (3, 3, 2, 0, 1)])
+        conn.execute("INSERT INTO paper_institutions (paper_id, institution_id) VALUES (3, ?)", (institution_id,))
+        conn.execute("UPDATE authors_master SET h_index = -1 WHERE author_id = 1")
+
+        report = compute_entity_metrics(conn, [3])
+
+        # Smith (1) is not linked to paper 3 and keeps its stored value
+        assert report == dict(report, authors=2, institutions=1)
+        incremental = conn.execute(AUTHOR_METRICS).fetchall()
+        assert incremental == [
+            (1, 1, 10, -1, 1, 0),
+            (2, 3, 15, 2, 2, 1),
+            (3, 2, 5, 2, 0, 2),
+        ]
+        institutions = conn.execute("SELECT * FROM institutions_master ORDER BY institution_id").fetchall()
+
+        compute_entity_metrics(conn)
+        assert conn.execute(AUTHOR_METRICS).fetchall()[1:] == incremental[1:]
+        assert conn.execute("SELECT * FROM institutions_master ORDER BY institution_id").fetchall() == institutions
+        conn.close()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for MinHash/LSH near-duplicate detection of records without DOI.
+"""
+
+import json
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.database.creator import OptimalScopusDatabase
+from scopus_db.database.near_duplicates import NearDuplicateDetector
+
+
+@pytest.fixture
+def no_doi(make_record):
+    """Factory of records without DOI: no_doi(title, year, authors, source)."""
+    def record(title, year='2021', authors='Smith J.', source='Additive Manufacturing'):
+        fields = make_record('', title)
+        fields.update({'Year': year, 'Authors': authors, 'Source title': source})
+        return fields
+    return record
+
+
+def test_detector_confirms_only_matching_records(no_doi):
+    detector = NearDuplicateDetector()
+    records = [
+        no_doi('Laser powder bed fusion of 316L stainless steel: a review'),
+        no_doi('Laser powder-bed fusion of 316L stainless steel - A review'),  # punctuation/case
+        no_doi('Laser powder bed fusion of 316L stainless steel: a review', year='2022'),
+        no_doi('Laser powder bed fusion of 316L stainless steel: a review', authors='Jones K.'),
+        no_doi('Binder jetting of copper parts for thermal management'),
+    ]
+    matches = [detector.add(record, {'record_index': i}) for i, record in enumerate(records)]
+
+    assert matches == [None, 0, None, None, None]
+    assert detector.clusters() == [[{'record_index': 0}, {'record_index': 1}]]
+
+
+def test_multi_csv_build_reports_and_drops_near_duplicates(no_doi, make_record, write_csv, config_settings):
+    config_settings(drop_near_duplicates=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_dir = Path(tmp) / "raw"
+        raw_dir.mkdir()
+        first, second = raw_dir / "2021.csv", raw_dir / "2022.csv"
+        write_csv(first, [no_doi('Residual stresses in directed energy deposition'),
+                          no_doi('Fatigue of lattice structures')])
+        write_csv(second, [no_doi('Residual Stresses in Directed-Energy Deposition.'),
+                           make_record('10.1/b', 'Second')])
+
+        creator = OptimalScopusDatabase(str(raw_dir), csv_files=[first, second])
+        creator.create_optimal_schema()
+        creator.process_csv_to_optimal_db()
+
+        conn = sqlite3.connect(creator.db_path)
+        titles = [row[0] for row in conn.execute("SELECT title FROM papers ORDER BY paper_id")]
+        conn.close()
+        creator.conn.close()
+
+        report_path, = creator.db_path.parent.glob("missing_doi_records_*.json")
+        report = json.loads(report_path.read_text(encoding='utf-8'))
+
+    assert titles == ['Residual stresses in directed energy deposition', 'Fatigue of lattice structures', 'Second']
+    assert creator.stats['near_duplicates_removed'] == 1
+    assert report['summary']['near_duplicate_clusters'] == 1
+    assert [[r['source_file'] for r in cluster] for cluster in report['near_duplicate_clusters']] == \
+        [['2021.csv', '2022.csv']]
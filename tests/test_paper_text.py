@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the paper_text layout (long text outside papers, optionally compressed).
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db import ScopusDB
+from scopus_db.database.paper_text import compress_text, decompress_text, register_text_functions
+
+ABSTRACT = ("Laser powder bed fusion builds dense steel parts layer by layer. " * 6).strip()
+
+
+@pytest.fixture
+def records(sample_records):
+    return [
+        dict(sample_records[0], Abstract=ABSTRACT, Link='https://www.scopus.com/record?eid=2-s2.0-1'),
+        dict(sample_records[1], Abstract='Short abstract.', Link=''),
+    ]
+
+
+def _papers(conn, table):
+    return conn.execute(f"SELECT * FROM {table} ORDER BY paper_id").fetchall()
+
+
+def test_compress_text_round_trip():
+    assert isinstance(compress_text(ABSTRACT), bytes)
+    assert decompress_text(compress_text(ABSTRACT)) == ABSTRACT
+    # Short or incompressible values stay text
+    assert compress_text('Short abstract.') == 'Short abstract.'
+    assert compress_text('') == '' and compress_text(None) is None
+
+
+def test_paper_details_view_restores_inline_layout(records, build_database):
+    with tempfile.TemporaryDirectory() as inline_dir, tempfile.TemporaryDirectory() as split_dir:
+        inline = sqlite3.connect(build_database(records, Path(inline_dir)))
+        split = sqlite3.connect(build_database(records, Path(split_dir), paper_text=True))
+
+        columns = {info[1] for info in split.execute("PRAGMA table_info(papers)")}
+        assert not columns & {"abstract", "scopus_link"}
+        assert split.execute("SELECT paper_id, abstract FROM paper_text WHERE paper_id = 2").fetchone() == \
+            (2, 'Short abstract.')
+        assert _papers(split, "paper_details") == _papers(inline, "papers")
+        inline.close()
+        split.close()
+
+
+def test_compressed_text_is_decompressed_by_the_view(records, build_database):
+    with tempfile.TemporaryDirectory() as inline_dir, tempfile.TemporaryDirectory() as split_dir:
+        inline = sqlite3.connect(build_database(records, Path(inline_dir)))
+        split = sqlite3.connect(build_database(records, Path(split_dir), paper_text=True, compress_paper_text=True))
+        register_text_functions(split)
+
+        assert split.execute("SELECT typeof(abstract), typeof(scopus_link) FROM paper_text "
+                             "ORDER BY paper_id").fetchall() == [('blob', 'text'), ('text', 'text')]
+        assert _papers(split, "paper_details") == _papers(inline, "papers")
+        inline.close()
+        split.close()
+
+
+def test_sharded_compressed_build_matches_serial_build(records, build_database, dump_database):
+    with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as sharded_dir:
+        serial_db = build_database(records, Path(serial_dir), paper_text=True, compress_paper_text=True)
+        sharded_db = build_database(records, Path(sharded_dir), paper_text=True, compress_paper_text=True,
+                                    parallel_processing=True, workers=2, shard_size=1)
+        assert dump_database(sharded_db) == dump_database(serial_db)
+
+
+def test_search_reads_compressed_abstracts(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = build_database(records, Path(tmp), paper_text=True, compress_paper_text=True,
+                                 full_text_search=True)
+        assert [hit['paper_id'] for hit in ScopusDB.search(str(db_path), "abstract:dense")] == [1]
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the build-time PRAGMA profile and the post-load finalize step.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.database.pragmas import apply_build_profile, finalize_database
+
+
+def _schema(conn):
+    conn.execute("CREATE TABLE papers (paper_id INTEGER PRIMARY KEY)")
+    conn.execute("""
+        CREATE TABLE paper_authors (
+            paper_id INTEGER,
+            author_id INTEGER,
+            FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+        )
+    """)
+
+
+def test_fast_profile_defers_foreign_keys_until_finalize():
+    """Orphan rows load under the fast profile and are reported on finalize."""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(Path(tmp) / "build.db")
+        settings = apply_build_profile(conn, "fast", cache_size_mb=64, mmap_size_mb=0)
+        assert settings["journal_mode"] == "OFF"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+
+        _schema(conn)
+        conn.execute("INSERT INTO papers VALUES (1)")
+        conn.execute("INSERT INTO paper_authors VALUES (1, 10)")
+        conn.execute("INSERT INTO paper_authors VALUES (2, 11)")  # orphan
+
+        report = finalize_database(conn)
+        assert report["foreign_key_violations"] == {"paper_authors -> papers": 1}
+        assert report["journal_mode"] == "wal"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert "analyze" in report["timings"]
+        conn.close()
+
+
+def test_unknown_profile_rejected():
+    conn = sqlite3.connect(":memory:")
+    try:
+        apply_build_profile(conn, "turbo")
+    except ValueError as e:
+        assert "turbo" in str(e)
+    else:
+        raise AssertionError("Unknown profile should raise ValueError")
+    finally:
+        conn.close()
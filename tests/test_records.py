@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact ScopusRecord row representation.
+"""
+
+import csv
+import io
+import pickle
+import sys
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.parsers.headers import header_map_for
+from scopus_db.parsers.records import ScopusRecord, read_records, record_columns
+
+
+CSV_TEXT = (
+    '"Authors","Title","Document Type","Publisher"\r\n'
+    '"Smith J.","First","Article","Elsevier"\r\n'
+    '\r\n'
+    '"Doe A.","Second"\r\n'
+    '"Lee K.","Third","Article","Elsevier","surplus"\r\n'
+)
+
+
+def test_records_match_dictreader_rows():
+    """Blank lines, short rows and surplus fields behave as with csv.DictReader."""
+    expected = list(csv.DictReader(io.StringIO(CSV_TEXT)))
+    records = list(read_records(io.StringIO(CSV_TEXT)))
+
+    assert records == expected
+    assert isinstance(records[0], ScopusRecord)
+    assert records[1]['Publisher'] is None
+    assert records[2][None] == ['surplus']
+    assert list(records[0].values()) == ['Smith J.', 'First', 'Article', 'Elsevier']
+
+
+def test_records_share_schema_and_intern_low_cardinality_values():
+    first, second = list(read_records(io.StringIO('Title,Document Type\r\nA,Article\r\nB,Article\r\n')))
+
+    assert first.schema is second.schema
+    assert header_map_for(first) is first.schema.header
+    assert first['Document Type'] is second['Document Type']
+
+
+def test_record_copy_is_mutable_and_record_pickles():
+    record = next(read_records(io.StringIO(CSV_TEXT)))
+
+    edited = record.copy()
+    edited['Title'] = 'Changed'
+    assert record['Title'] == 'First'
+
+    restored = pickle.loads(pickle.dumps(record))
+    assert restored == record
+    assert restored.get('Missing', '') == ''
+
+
+def test_record_columns_match_get():
+    records = list(read_records(io.StringIO(CSV_TEXT)))
+    columns = ['Title', 'Publisher', 'Abstract']
+    expected = {column: [record.get(column) for record in records] for column in columns}
+
+    # Mixed chunk (surplus row is a dict) and a chunk of ScopusRecords only
+    assert record_columns(records, columns) == expected
+    assert record_columns(records[:2], columns) == {column: values[:2] for column, values in expected.items()}
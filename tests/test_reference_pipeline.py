@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tests for parallel reference parsing with ordered citation writes.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.database.reference_pipeline import ReferencePipeline
+from scopus_db.database.row_processor import ScopusRecordProcessor
+
+
+def _citations(writer):
+    return [values for table, values in writer.rows if table == "paper_citations"]
+
+
+def test_pipeline_writes_citations_in_paper_and_position_order(sample_records, collecting_writer):
+    records = sample_records * 5
+
+    inline = collecting_writer()
+    processor = ScopusRecordProcessor()
+    for paper_id, record in enumerate(records, 1):
+        processor.process_record(paper_id, record, inline)
+
+    piped = collecting_writer()
+    processor = ScopusRecordProcessor()
+    # Small chunks so several are in flight and finish out of order
+    processor.reference_pipeline = ReferencePipeline(piped, processor.emit_citations, workers=2, chunk_size=3)
+    for paper_id, record in enumerate(records, 1):
+        processor.process_record(paper_id, record, piped)
+    processor.reference_pipeline.close()
+
+    assert _citations(piped) == _citations(inline)
+    assert [(row[0], row[-1]) for row in _citations(piped)] == sorted((row[0], row[-1]) for row in _citations(inline))
+    assert processor.reference_pipeline.stats == {"references": 10, "chunks": 3}
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the reference parsing engine.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.parsers.references import ReferenceParser, parse_reference, reference_fingerprint
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Modules compiling regular expressions at import time
+REGEX_MODULES = [
+    "scopus_db.parsers.references",
+    "scopus_db.database.citation_resolver",
+    "scopus_db.database.row_processor",
+    "scopus_db.database.near_duplicates",
+    "scopus_db.database.link_tables",
+    "scopus_db.data_quality_filter_simple",
+]
+
+
+def test_reference_shapes():
+    """Articles (fast path and fallback), web documents, standards, books and fragments."""
+    cases = {
+        "Smith J., Doe A., Laser welding of steel, J Mater Process Technol, 45, 3, pp. 112-120, (2019)":
+            (2019, 'Smith J.', 'Doe A., Laser welding of steel', 'J Mater Process Technol', '45', '3', '112-120'),
+        "Smith J., Laser welding, Int J Adv Manuf Technol, 12, pp. 1-9, (2001)":
+            (2001, 'Smith J.', 'Laser welding', 'Int J Adv Manuf Technol', '12', None, '1-9'),
+        # Journal-like word in the title: the journal is taken from the third part instead
+        "Lee K., Review of additive manufacturing, Robotics and Computer-Integrated Manufacturing, 33, 4, pp. 5-10, (2015)":
+            (2015, 'Lee K.', 'Review of additive manufacturing', 'Robotics and Computer-Integrated Manufacturing',
+             '33', '4', '5-10'),
+        "Additive manufacturing guide [WWW Document], (2020)":
+            (2020, None, 'Additive manufacturing guide', 'Web Document', None, None, None),
+        "ISO 52900, Additive manufacturing, General principles, (2015)":
+            (2015, None, 'ISO 52900, Additive manufacturing', 'Standard', None, None, None),
+        "Gibson I., Rosen D., Stucker B., Additive Manufacturing Technologies, Springer, (2015)":
+            (2015, 'Gibson I.', 'Rosen D., Stucker B.', 'Additive Manufacturing Technologies', None, None, None),
+        ", Smith J., Title words here, Nature, 5, pp. 1-2, (2010)":
+            (2010, 'Smith J.', 'Title words here', 'Nature', '5', None, '1-2'),
+        "2019": (2019, None, None, None, None, None, None),
+        "": (None, None, None, None, None, None, None),
+    }
+    for reference, expected in cases.items():
+        assert parse_reference(reference) == expected, reference
+
+
+def test_parser_memoizes_and_returns_dicts():
+    parser = ReferenceParser(cache_size=16)
+    reference = "Smith J., Laser welding, Int J Adv Manuf Technol, 12, pp. 1-9, (2001)"
+
+    first = parser.parse(reference)
+    assert parser.parse(reference) is first
+    assert parser.cache_info().hits == 1
+    assert parser.parse_dict(reference)['journal'] == 'Int J Adv Manuf Technol'
+    assert ReferenceParser(cache_size=0).cache_info() is None
+
+
+def test_fingerprint_groups_citations_of_one_work():
+    def fingerprint(reference):
+        return reference_fingerprint(reference, parse_reference(reference))
+
+    canonical = fingerprint("Smith J., Doe A., Laser welding of steel, J Mater Process Technol, 45, 3, pp. 112-120, (2019)")
+    assert canonical.startswith("smith|2019|")
+    assert fingerprint("Smith J., Doe A.B., LASER WELDING OF STEEL, J. Mater. Process. Technol., 45, pp. 112-120, (2019)") == canonical
+    assert fingerprint("Smith J., Doe A., Laser welding of steel, J Mater Process Technol, 45, 3, pp. 112-120, (2020)") != canonical
+    assert fingerprint("Smith J., Doe A., Laser welding of aluminium, J Mater Process Technol, 45, 3, pp. 112-120, (2019)") != canonical
+
+
+def test_regexes_compile_on_oldest_supported_python():
+    """Patterns must not use syntax newer than requires-python (e.g. possessive quantifiers, 3.11+)."""
+    pyproject = (PROJECT_ROOT / "pyproject.toml").read_text(encoding="utf-8")
+    oldest = re.search(r'requires-python = ">=(\d+\.\d+)"', pyproject).group(1)
+    interpreter = shutil.which(f"python{oldest}")
+    if interpreter is None:
+        pytest.skip(f"python{oldest} not installed")
+    # PYENV_VERSION lets a pyenv shim run a version that is installed but not selected
+    env = dict(os.environ, PYENV_VERSION=oldest)
+    probe = subprocess.run([interpreter, "-c", "import sys"], env=env,
+                           stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if probe.returncode != 0:
+        pytest.skip(f"python{oldest} cannot be run")
+
+    result = subprocess.run([interpreter, "-c", "import importlib, sys; [importlib.import_module(m) for m in sys.argv[1:]]",
+                             *REGEX_MODULES], cwd=str(PROJECT_ROOT), env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for writing build reports on the background report worker.
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.data_quality_filter_simple import ScopusDataQualityFilter
+from scopus_db.database.creator import OptimalScopusDatabase
+from scopus_db.database.report_worker import ReportError, ReportWorker
+
+
+def test_reports_are_written_in_background_from_snapshots(capsys):
+    release = threading.Event()
+    written = []
+    worker = ReportWorker()
+
+    def writer(snapshot):
+        release.wait(5)
+        written.append(snapshot)
+        return [f"   saved {snapshot['excluded']}"]
+
+    stats = {"excluded": 1}
+    start = time.perf_counter()
+    worker.submit("slow", writer, dict(stats))
+    assert time.perf_counter() - start < 1 and written == []
+    stats["excluded"] = 2
+    release.set()
+
+    # Output and timings reach the caller only once the report is waited for
+    assert worker.timings == {} and capsys.readouterr().out == ""
+    timings = worker.wait()
+    assert written == [{"excluded": 1}]
+    assert set(timings["slow"]) == {"queued", "seconds", "latency"}
+    assert capsys.readouterr().out == "   saved 1\n"
+
+
+def test_failed_reports_are_raised_after_every_report_finished():
+    worker = ReportWorker()
+    worker.submit("broken", lambda: 1 / 0)
+    worker.submit("after", lambda: ["   written"])
+    with pytest.raises(ReportError) as failure:
+        worker.wait()
+
+    assert isinstance(failure.value.errors["broken"], ZeroDivisionError)
+    assert set(worker.timings) == {"broken", "after"}
+
+    # Inline reports raise when submitted
+    with pytest.raises(ZeroDivisionError):
+        ReportWorker(background=False).submit("broken", lambda: 1 / 0)
+
+
+def test_filter_submits_a_report_snapshot(make_record):
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "exclusions.json"
+        worker = ReportWorker()
+        data_filter = ScopusDataQualityFilter(log_path=str(log_path), report_worker=worker)
+        records = [make_record(f'10.1/{i}', f'Paper {i}', abstract='' if i % 3 else 'An abstract') for i in range(12)]
+        assert len(list(data_filter.filter_records(records))) == 4
+
+        data_filter.stats["exclusion_reasons"]["MISSING_ABSTRACT"] = 99
+        worker.wait()
+
+        saved = json.loads(log_path.read_text(encoding='utf-8'))
+        assert saved['exclusion_breakdown'] == {'MISSING_ABSTRACT': 8}
+        assert len(saved['exclusions']) == 8
+        assert "quality_reports" in worker.timings
+
+
+def test_build_waits_for_every_report_at_exit(make_record, write_csv):
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_dir = Path(tmp) / "raw"
+        raw_dir.mkdir()
+        first, second = raw_dir / "2021.csv", raw_dir / "2022.csv"
+        write_csv(first, [make_record('10.1/a', 'First'), make_record('', 'No DOI')])
+        write_csv(second, [make_record('10.1/a', 'First again'), make_record('10.1/b', 'Second', abstract='')])
+
+        creator = OptimalScopusDatabase(str(raw_dir), csv_files=[first, second])
+        creator.create_optimal_schema()
+        creator.process_csv_to_optimal_db()
+        creator.conn.close()
+
+        run_dir = creator.db_path.parent
+        assert set(creator.report_timings) == {"deduplication_logs", "quality_reports", "validation_report"}
+        assert list(run_dir.glob("deduplication_details_*.json"))
+        assert list(run_dir.glob("missing_doi_records_*.json"))
+        assert list(run_dir.glob("data_quality_exclusions_combined_*.html"))
+        assert list((raw_dir / "output").glob("database_validation_report_*.txt"))
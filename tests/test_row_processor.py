@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass record processor used during database creation.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.database import row_processor
+from scopus_db.database.row_processor import ScopusRecordProcessor
+
+
+def test_rows_emitted_in_dependency_order(sample_records, collecting_writer):
+    """Parent rows are produced before relationship rows that reference them."""
+    processor = ScopusRecordProcessor()
+    writer = collecting_writer()
+    processor.process_record(1, sample_records[0], writer)
+
+    tables = [table for table, _ in writer.rows]
+    assert tables[0] == "papers"
+    assert tables.index("authors_master") < tables.index("paper_authors")
+    assert tables.index("keywords_master") < tables.index("paper_keywords")
+    assert tables.index("institutions_master") < tables.index("paper_institutions")
+
+    # Duplicate keyword inside one record is registered once
+    assert processor.stats["keywords_normalized"] == 3
+
+
+def test_expected_counts_tracked_in_same_pass(sample_records, collecting_writer):
+    """Expected population counts are accumulated while records are processed."""
+    processor = ScopusRecordProcessor()
+    writer = collecting_writer()
+    for paper_id, record in enumerate(sample_records, 1):
+        processor.process_record(paper_id, record, writer)
+
+    expected = processor.expected_table_counts()
+    assert expected["papers"] == 2
+    assert expected["authors_master"] == 3
+    assert expected["paper_authors"] == 4
+    assert expected["paper_citations"] == 2
+
+
+def test_fields_split_once_per_record(sample_records, collecting_writer, monkeypatch):
+    """Expected counts reuse the split fields instead of splitting them again."""
+    splits = []
+    split_field = row_processor.split_field
+    monkeypatch.setattr(row_processor, "split_field", lambda value: splits.append(value) or split_field(value))
+
+    processor = ScopusRecordProcessor()
+    for paper_id, record in enumerate(sample_records, 1):
+        del splits[:]
+        processor.process_record(paper_id, record, collecting_writer())
+        assert len(splits) == len(set(splits))
+        assert record['References'] in splits or not record['References']
+
+    expected = processor.expected_table_counts()
+    assert expected["paper_keywords"] == 6
+    assert expected["paper_funding"] == 1
+
+
+def test_variant_headers_are_resolved(sample_records, collecting_writer):
+    """BOM-prefixed and quoted headers reach the same rows as the plain names."""
+    variants = {'Affiliations': '\ufeffAffiliations', 'Author Keywords': '"Author Keywords"',
+                'Index Keywords': ' Index Keywords', 'References': '\ufeff"References"'}
+    rows = {}
+    for label, record in (("plain", sample_records[0]),
+                          ("variant", {variants.get(key, key): value for key, value in sample_records[0].items()})):
+        writer = collecting_writer()
+        ScopusRecordProcessor().process_record(1, record, writer)
+        rows[label] = writer.rows
+
+    tables = {table for table, _ in rows["variant"]}
+    assert {"paper_institutions", "paper_keywords", "paper_citations"} <= tables
+    assert rows["variant"] == rows["plain"]
+
+
+def test_single_pass_database_contents(sample_records, build_database):
+    """A database built in one pass holds every entity and relationship."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = build_database(sample_records, Path(tmp))
+        conn = sqlite3.connect(db_path)
+
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ["papers", "authors_master", "paper_authors", "paper_citations",
+                          "paper_funding", "paper_chemicals", "paper_correspondence",
+                          "paper_open_access", "paper_institutions"]
+        }
+        assert counts == {
+            "papers": 2,
+            "authors_master": 3,
+            "paper_authors": 4,
+            "paper_citations": 2,
+            "paper_funding": 1,
+            "paper_chemicals": 1,
+            "paper_correspondence": 1,
+            "paper_open_access": 2,
+            "paper_institutions": 3,
+        }
+
+        # Shared author keeps a single master id across papers
+        author_ids = conn.execute(
+            "SELECT DISTINCT author_id FROM paper_authors pa "
+            "JOIN authors_master a USING (author_id) WHERE a.scopus_id = '222'"
+        ).fetchall()
+        assert len(author_ids) == 1
+
+        # Author keywords take precedence over index keywords for the master entry,
+        # even when the index keyword was seen first
+        category = conn.execute(
+            "SELECT keyword_text, keyword_category FROM keywords_master WHERE normalized_text = 'steel'"
+        ).fetchone()
+        assert category == ('Steel', 'author')
+
+        conn.close()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the optional FTS5 full-text index and ScopusDB.search.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db import ScopusDB
+from scopus_db.database.search import index_papers
+
+
+@pytest.fixture
+def records(sample_records):
+    return [
+        dict(sample_records[0], Abstract='Dense parts are printed from gas atomized powders.'),
+        dict(sample_records[1], Abstract='We review binder jetting of metals and ceramics.'),
+    ]
+
+
+def _paper_ids(db_path, query, **kwargs):
+    return [hit['paper_id'] for hit in ScopusDB.search(str(db_path), query, **kwargs)]
+
+
+def test_search_ranks_titles_abstracts_and_keywords(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = build_database(records, Path(tmp), full_text_search=True)
+
+        # Paper 1 has steel in its title and index keywords, paper 2 only as author keyword
+        hits = ScopusDB.search(str(db_path), "steel")
+        assert [hit['paper_id'] for hit in hits] == [1, 2]
+        assert hits[0]['bm25'] < hits[1]['bm25']
+
+        assert _paper_ids(db_path, "ceramics") == [2]           # abstract
+        assert _paper_ids(db_path, "powder bed") == [1]         # author keywords
+        assert _paper_ids(db_path, "lasers") == [1]             # porter stemming
+        assert _paper_ids(db_path, "title:steel") == [1]
+        assert _paper_ids(db_path, "steel", limit=1, offset=1) == [2]
+
+        with pytest.raises(ValueError):
+            ScopusDB.search(str(db_path), '"unbalanced')
+
+
+def test_sharded_build_indexes_merged_papers(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        # Shards are built without the FTS5 table; the master indexes all papers after the merge
+        db_path = build_database(records, Path(tmp), full_text_search=True, parallel_processing=True, workers=2, shard_size=1)
+        assert _paper_ids(db_path, "steel") == [1, 2]
+
+
+def test_appended_papers_are_indexed(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = build_database(records, Path(tmp), full_text_search=True)
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO papers (paper_id, title, abstract) "
+                      "VALUES (3, 'Directed energy deposition', 'Wire feedstock')")
+        conn.execute("INSERT INTO paper_keywords (paper_id, keyword_id, keyword_type) VALUES (3, 1, 'author')")
+
+        assert index_papers(conn, [3]) == 1
+        conn.close()
+
+        assert _paper_ids(db_path, "wire") == [3]
+        assert sorted(_paper_ids(db_path, "author_keywords:additive")) == [1, 3]
+
+
+def test_search_requires_full_text_index(records, build_database):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = build_database(records, Path(tmp))
+        tables = {name for (name,) in sqlite3.connect(db_path).execute("SELECT name FROM sqlite_master")}
+        assert "papers_fts" not in tables
+
+        with pytest.raises(ValueError):
+            ScopusDB.search(str(db_path), "steel")
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Tests for the sharded multi-process database build.
+"""
+
+import tempfile
+from pathlib import Path
+
+
+def test_sharded_build_matches_serial_build(sample_records, build_database, dump_database):
+    """Shards merged in order reproduce the serial build exactly."""
+    # Keyword 'Steel' is index-only in the first record and an author keyword
+    # in the second, so with one record per shard the override crosses shards
+    records = sample_records + [
+        dict(sample_records[0], DOI=f'10.1000/x{i}', Title=f'Variant {i}') for i in range(3)
+    ] + [sample_records[1]]
+
+    with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as sharded_dir:
+        serial_db = build_database(records, Path(serial_dir))
+        sharded_db = build_database(records, Path(sharded_dir), parallel_processing=True, workers=2, shard_size=1)
+
+        assert dump_database(sharded_db) == dump_database(serial_db)
+        assert not any(p.name.endswith('_shards') for p in sharded_db.parent.iterdir())
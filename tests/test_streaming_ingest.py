@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming CSV ingest (CSV -> dedup -> filter -> database).
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scopus_db.data_quality_filter_simple import ScopusDataQualityFilter
+from scopus_db.database.creator import OptimalScopusDatabase
+from scopus_db.parsers.csv_files import iter_csv_files_parallel, read_csv_file
+
+
+def test_filter_records_is_lazy(make_record):
+    """Records are yielded before the input is exhausted; the report follows at the end."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_filter = ScopusDataQualityFilter(log_path=str(Path(tmp) / "exclusions.json"))
+        consumed = []
+
+        def source():
+            for record in [make_record('10.1/a', 'First'), make_record('10.1/b', 'Second', abstract=''), make_record('10.1/c', 'Third')]:
+                consumed.append(record['Title'])
+                yield record
+
+        stream = data_filter.filter_records(source())
+        first = next(stream)
+        assert first['Title'] == 'First'
+        assert consumed == ['First']
+        assert data_filter.report is None
+
+        rest = list(stream)
+        assert [r['Title'] for r in rest] == ['Third']
+        assert data_filter.report['summary']['excluded_records'] == 1
+        assert data_filter.report['exclusion_breakdown'] == {'MISSING_ABSTRACT': 1}
+
+
+def test_multi_csv_stream_deduplicates_across_files(make_record, write_csv):
+    """Duplicate DOIs in later files are dropped while streaming."""
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_dir = Path(tmp) / "raw"
+        raw_dir.mkdir()
+        first = raw_dir / "2021.csv"
+        second = raw_dir / "2022.csv"
+        write_csv(first, [make_record('10.1/a', 'First'), make_record('', 'No DOI')])
+        write_csv(second, [make_record('10.1/a', 'First again'), make_record('10.1/b', 'Second')])
+
+        creator = OptimalScopusDatabase(str(raw_dir), csv_files=[first, second])
+        creator.create_optimal_schema()
+        creator.process_csv_to_optimal_db()
+
+        conn = sqlite3.connect(creator.db_path)
+        titles = [row[0] for row in conn.execute("SELECT title FROM papers ORDER BY paper_id")]
+        conn.close()
+        creator.conn.close()
+
+        assert titles == ['First', 'No DOI', 'Second']
+        assert creator.stats['duplicates_removed'] == 1
+        assert creator.stats['records_loaded'] == 4
+        assert creator.stats['csv_files_processed'] == 2
+
+
+def test_parallel_csv_loading_preserves_file_order(make_record, write_csv):
+    """Files decoded in a process pool come back in input order with their counts."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for year, size in ((2020, 3), (2021, 1), (2022, 2)):
+            path = Path(tmp) / f"{year}.csv"
+            write_csv(path, [make_record(f'10.1/{year}-{i}', f'{year} paper {i}') for i in range(size)])
+            paths.append(path)
+
+        results = list(iter_csv_files_parallel(paths, workers=2))
+
+        assert [Path(r.path).name for r in results] == ['2020.csv', '2021.csv', '2022.csv']
+        assert [len(r.rows) for r in results] == [3, 1, 2]
+        assert [r.rows for r in results] == [read_csv_file(p).rows for p in paths]
+        assert all(r.error is None for r in results)
+
+
+def test_unreadable_csv_fails_single_build_and_is_skipped_in_multi_build(make_record, write_csv):
+    """A single CSV that cannot be read stops the build; in a directory it is reported and skipped."""
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_dir = Path(tmp) / "raw"
+        raw_dir.mkdir()
+        good, bad = raw_dir / "good.csv", raw_dir / "bad.csv"
+        write_csv(good, [make_record('10.1/a', 'First')])
+        bad.write_bytes(b'"Authors","Title"\n"\xff\xfe broken"\n')
+
+        creator = OptimalScopusDatabase(str(bad))
+        creator.create_optimal_schema()
+        try:
+            creator.process_csv_to_optimal_db()
+            raised = False
+        except UnicodeDecodeError:
+            raised = True
+        creator.conn.close()
+        assert raised
+
+        creator = OptimalScopusDatabase(str(raw_dir), csv_files=[bad, good])
+        creator.create_optimal_schema()
+        creator.process_csv_to_optimal_db()
+        creator.conn.close()
+        assert [f["error"] is not None for f in creator.csv_load_stats] == [True, False]
+        assert creator.stats['records_loaded'] == 1